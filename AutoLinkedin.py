@@ -1,16 +1,23 @@
 import streamlit as st
-# Only import class definitions and config constants, not objects created at module level
-from Monitor_Feed import LinkedInManager, GPTManager, GoogleManager, _config, _CONFIG_FILENAME, LOGGER
+# Only the lightweight config module: Monitor_Feed (selenium, SDKs, pandas) is never imported here
+from app_config import _config, _CONFIG_FILENAME, APP_DIR, load_config, write_config
+import automation_daemon
+import os
+import sys
 import subprocess
 import threading
 import queue
 import time
+from collections import deque
 
 
 # Do NOT instantiate managers at the top level!
 # All automation is now run via subprocess (see stream_terminal_output),
 # so these objects are not needed in the Streamlit process.
 
+# Re-read on every rerun so settings saved by the automation subprocesses show up
+load_config()
+
 
 # Set dark theme via Streamlit config (must be in .streamlit/config.toml, but we can show instructions)
 st.set_page_config(page_title="LinkedIn Automation Dashboard", layout="wide")
@@ -39,16 +46,19 @@ browser_mode = st.sidebar.radio(
 )
 headless_flag = "--headless" if browser_mode.startswith("Headless") else "--headon"
 
-# Comment source (GPT or Gemini)
+# Comment source (GPT, Gemini or a local model)
 comment_source = st.sidebar.radio(
     "Comment Generation Source",
-    ["Gemini (Google)", "GPT (OpenAI)"]
+    ["Gemini (Google)", "GPT (OpenAI)", "Local model (CPU)"]
 )
 # Map UI label to CLI value
 if comment_source.startswith("Gemini"):
     comment_flag = "--comment-source google"
+elif comment_source.startswith("Local"):
+    comment_flag = "--comment-source local"
 else:
     comment_flag = "--comment-source gpt"
+comment_source_value = comment_flag.split()[-1]
 
 # Number of posts to interact with (for warmup/feed)
 max_posts = st.sidebar.slider("Max Posts to Like/Comment", min_value=1, max_value=20, value=10)
@@ -56,6 +66,22 @@ max_posts_flag = f"--max-posts {max_posts}"
 
 # Add more options as needed (e.g., refresh interval, prompt selection, etc.)
 
+# Warm session: a long-lived Monitor_Feed.py --daemon keeps Chrome signed in, so jobs start instantly
+st.sidebar.header("Warm Session")
+daemon_state = automation_daemon.daemon_status(_config)
+if daemon_state is None:
+    st.sidebar.caption("Not running: each action starts its own browser.")
+    if st.sidebar.button("Start Warm Session"):
+        subprocess.Popen([sys.executable, "Monitor_Feed.py", "--daemon", headless_flag], cwd=APP_DIR)
+        st.sidebar.info("Starting; sign-in happens in the new browser window. Refresh in a few seconds.")
+else:
+    busy = daemon_state["busy"]
+    st.sidebar.caption(f"Running for {daemon_state['uptime'] / 60:.0f} min, " + (f"jobs: {busy}." if busy else "idle."))
+    if busy and st.sidebar.button("Stop All Jobs"):
+        automation_daemon.request({"type": "stop"}, _config)
+    if st.sidebar.button("Shut Down Warm Session"):
+        automation_daemon.request({"type": "shutdown"}, _config)
+
 menu = st.sidebar.selectbox(
     "Choose Action",
     [
@@ -71,25 +97,117 @@ menu = st.sidebar.selectbox(
 # Terminal output capture logic
 def run_with_output(command, output_queue):
     """Run a shell command and put output lines in a queue."""
-    process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    process = subprocess.Popen(command, shell=True, cwd=APP_DIR, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
     for line in iter(process.stdout.readline, ''):
         output_queue.put(line)
     process.stdout.close()
     process.wait()
     output_queue.put(None)  # Sentinel for end
 
-def stream_terminal_output(command):
+def run_daemon_job(job, job_args, output_queue):
+    """Run a job on the warm-session daemon and put its output lines in a queue."""
+    try:
+        for line in automation_daemon.submit_job(job, job_args, _config):
+            output_queue.put(line)
+    except ConnectionError as e:
+        output_queue.put(f"{e}\n")
+    output_queue.put(None)
+
+def _dashboard_setting(key, default):
+    """Read a numeric [DASHBOARD] setting from the config, falling back to the default."""
+    try:
+        return type(default)(_config["DASHBOARD"].get(key, default)) if _config.has_section("DASHBOARD") else default
+    except ValueError:
+        return default
+
+
+def _render_log_download(container, log_path: str, key: str) -> bool:
+    """
+    Show a download button for the run log in `container`. While a command runs, clicking it must not rerun
+    the script (that would stop streaming the output), which needs Streamlit's on_click="ignore".
+    Returns:
+        False if this Streamlit version cannot offer the download without a rerun.
+    """
+    with open(log_path, "rb") as log_file:
+        data = log_file.read()
+    try:
+        container.download_button("Download full log", data, file_name=os.path.basename(log_path), mime="text/plain",
+                                  key=key, on_click="ignore")
+    except TypeError:
+        return False
+    return True
+
+
+def stream_terminal_output(command, job=None, job_args=None):
+    """
+    Run a command and show its output live.
+    Only the last [DASHBOARD] tail_lines lines (default 200) are kept on screen, redrawn in one placeholder
+    at most every [DASHBOARD] refresh_seconds (default 0.5), so long sessions stay cheap to render.
+    Every line is also written to a log file under logs/, whose path is shown from the start; a download
+    button with the log so far is refreshed every few seconds while the command runs (endless feed monitoring
+    and daemon jobs included) and once more when it ends.
+    If a warm session daemon is running, the job is queued there (interleaved with its other jobs)
+    instead of starting a new process.
+    """
+    tail_lines = max(1, _dashboard_setting("tail_lines", 200))
+    refresh_seconds = max(0.1, _dashboard_setting("refresh_seconds", 0.5))
+    log_dir = os.path.join(APP_DIR, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, f"run_{time.strftime('%Y%m%d_%H%M%S')}.log")
+
     output_queue = queue.Queue()
-    thread = threading.Thread(target=run_with_output, args=(command, output_queue))
+    daemon_state = automation_daemon.daemon_status(_config) if job else None
+    if daemon_state is not None:
+        thread = threading.Thread(target=run_daemon_job, args=(job, job_args or {}, output_queue), daemon=True)
+    else:
+        thread = threading.Thread(target=run_with_output, args=(command, output_queue), daemon=True)
     thread.start()
-    output_lines = []
-    while True:
-        line = output_queue.get()
-        if line is None:
-            break
-        output_lines.append(line)
-        st.code(''.join(output_lines), language='bash')
-        time.sleep(0.1)
+    tail = deque(maxlen=tail_lines)
+    placeholder = st.empty()
+    st.caption(f"Full log (written live): {log_path}")
+    download_slot = st.empty()
+    live_download = True
+    downloads = 0
+    last_download = 0.0
+    total_lines = 0
+    last_render = 0.0
+    dirty = False
+    finished = False
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        while not finished:
+            try:
+                line = output_queue.get(timeout=refresh_seconds)
+            except queue.Empty:
+                line = ""
+            # Drain everything already queued before redrawing
+            while line is not None:
+                if line:
+                    tail.append(line)
+                    log_file.write(line)
+                    total_lines += 1
+                    dirty = True
+                try:
+                    line = output_queue.get_nowait()
+                except queue.Empty:
+                    break
+            finished = line is None
+            now = time.monotonic()
+            if dirty and (finished or now - last_render >= refresh_seconds):
+                log_file.flush()
+                placeholder.code(''.join(tail), language='bash')
+                last_render = now
+                dirty = False
+            if live_download and not finished and now - last_download >= max(5.0, refresh_seconds):
+                # Each redraw is a new widget, so it needs its own key
+                downloads += 1
+                live_download = _render_log_download(download_slot, log_path, f"{log_path}-{downloads}")
+                last_download = now
+
+    st.caption(f"{total_lines} lines of output (last {min(total_lines, tail_lines)} shown). Full log: {log_path}")
+    if not _render_log_download(download_slot, log_path, f"{log_path}-final"):
+        with open(log_path, "rb") as log_file:
+            download_slot.download_button("Download full log", log_file, file_name=os.path.basename(log_path),
+                                          mime="text/plain")
 
 
 if menu == "Feed Monitoring":
@@ -99,28 +217,30 @@ if menu == "Feed Monitoring":
     if st.button("Start Feed Monitoring"):
         st.info("Feed monitoring will run in a new terminal window. Output will be shown below.")
         cmd = f"python Monitor_Feed.py --feed-monitoring {headless_flag} {comment_flag} {max_posts_flag} {refresh_flag}"
-        stream_terminal_output(cmd)
+        stream_terminal_output(cmd, "feed", {"refresh_interval": refresh_interval, "comment_source": comment_source_value,
+                                                 "max_posts": max_posts})
 
 elif menu == "Send Connection Requests":
     st.header("Send Connection Requests")
     uploaded_file = st.file_uploader("Upload Excel file with 'Profile Link' and 'Name' columns", type=["xlsx"])
     message = st.text_area("Message Template", "Hi {Name}, I'd like to connect with you on LinkedIn!")
     if st.button("Send Requests") and uploaded_file:
-        with open("uploaded_connections.xlsx", "wb") as f:
+        with open(os.path.join(APP_DIR, "uploaded_connections.xlsx"), "wb") as f:
             f.write(uploaded_file.read())
         st.info("Sending connection requests. Output will be shown below.")
         cmd = f"python Monitor_Feed.py --send-connections uploaded_connections.xlsx --message '{message}' {headless_flag}"
-        stream_terminal_output(cmd)
+        stream_terminal_output(cmd, "connect", {"input_file": "uploaded_connections.xlsx", "message": message})
 
 elif menu == "Profile Warmup":
     st.header("Profile Warmup")
     uploaded_file = st.file_uploader("Upload Excel file with 'Profile Link' column", type=["xlsx"], key="warmup")
     if st.button("Warmup Profiles") and uploaded_file:
-        with open("uploaded_warmup.xlsx", "wb") as f:
+        with open(os.path.join(APP_DIR, "uploaded_warmup.xlsx"), "wb") as f:
             f.write(uploaded_file.read())
         st.info("Warming up profiles. Output will be shown below.")
         cmd = f"python Monitor_Feed.py --profile-warmup uploaded_warmup.xlsx {headless_flag} {comment_flag} {max_posts_flag}"
-        stream_terminal_output(cmd)
+        stream_terminal_output(cmd, "warmup", {"input_file": "uploaded_warmup.xlsx", "comment_source": comment_source_value,
+                                                   "max_posts": max_posts})
 
 elif menu == "Connection Hunting":
     st.header("Connection Hunting")
@@ -129,7 +249,7 @@ elif menu == "Connection Hunting":
     if st.button("Start Hunting") and search_url:
         st.info("Starting connection hunting. Output will be shown below.")
         cmd = f"python Monitor_Feed.py --connection-hunting '{search_url}' --output '{output_file}' {headless_flag}"
-        stream_terminal_output(cmd)
+        stream_terminal_output(cmd, "hunt", {"search_url": search_url, "output": output_file})
 
 elif menu == "Settings":
     st.header("Settings")
@@ -150,8 +270,7 @@ elif menu == "Settings":
         _config["ALL"]["api"] = openai_api
         _config["ALL"]["static prompt"] = gpt_prompt
         _config["ALL"]["ai model"] = gpt_model
-        with open(_CONFIG_FILENAME, "w", encoding="utf-8") as f:
-            _config.write(f)
+        write_config(_config, _CONFIG_FILENAME)
         st.success("GPT settings saved.")
 
     st.subheader("Gemini (Google) Settings")
@@ -167,10 +286,21 @@ elif menu == "Settings":
         _config["GOOGLE"]["api"] = gemini_api
         _config["GOOGLE"]["static prompt"] = gemini_prompt
         _config["GOOGLE"]["selected_model"] = gemini_model
-        with open(_CONFIG_FILENAME, "w", encoding="utf-8") as f:
-            _config.write(f)
+        write_config(_config, _CONFIG_FILENAME)
         st.success("Gemini settings saved.")
 
+    st.subheader("Local Model Settings")
+    # GGUF model run on the CPU with llama-cpp-python (pip install llama-cpp-python)
+    local_model_path = st.text_input("Local Model File (.gguf, e.g. gemma-3-1b-it-Q4_K_M.gguf)", value=_config["LOCAL"].get("model_path", "") if _config.has_section("LOCAL") else "")
+    local_threads = st.number_input("CPU Threads", min_value=1, max_value=64, value=int(_config["LOCAL"].get("n_threads", os.cpu_count() or 4)) if _config.has_section("LOCAL") else (os.cpu_count() or 4))
+    if st.button("Save Local Model Settings"):
+        if not _config.has_section("LOCAL"):
+            _config.add_section("LOCAL")
+        _config["LOCAL"]["model_path"] = local_model_path
+        _config["LOCAL"]["n_threads"] = str(local_threads)
+        write_config(_config, _CONFIG_FILENAME)
+        st.success("Local model settings saved.")
+
     st.info("Note: For browser automation, you may need to run this app locally and interact with the browser window.")
 
     # Show instructions for dark theme in .streamlit/config.toml
@@ -1,55 +1,210 @@
 
 import argparse
-from selenium.webdriver import Chrome
+# Only the locator constants; the WebDriver stack (Chrome, waits, expected conditions) is imported when a browser starts
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as ec
-from selenium.webdriver.support.wait import WebDriverWait
 import time
 import os
-from seleniumbase import SB
-from cutie import select
-from configparser import RawConfigParser
-import openai
-import logging
-import pandas as pd
-import google.generativeai as genai
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import json
+import threading
+from typing import TYPE_CHECKING
+# Heavy, mode-specific packages (selenium's WebDriver, seleniumbase, cutie, openai, google.generativeai, pandas)
+# are imported lazily
+from app_config import _config, _CONFIG_FILENAME, APP_DIR, CONFIG_LOCK, RUN_ID, TEMP_PROFILE, apply_config_overrides, setup_logging, write_config
+from comment_cache import CommentCache
+from seen_posts import SeenPostStore
+from pacing import Pacer
+from worker_pool import run_sharded
+from table_io import RowWriter, count_rows, iter_rows, read_header
+from results_store import HuntResultsStore
+from automation_daemon import AutomationDaemon
+from scheduler import ActionBudget, JobScheduler, job_priority
+from comment_batch import generate_batched
+from local_llm import LocalManager
+from provider_router import ProviderRouter, is_usable_comment
+from api_clients import ApiStats, CommentLimit, OpenAIClient, RetryPolicy, call_with_retries
+from prompt_templates import get_template
+from metrics import REGISTRY, Stopwatch, span, timed
+
+if TYPE_CHECKING:
+    from selenium.webdriver import Chrome
+    from selenium.webdriver.support.wait import WebDriverWait
+
+
+# Result card container on LinkedIn people search pages
+PROFILE_CARD_SELECTOR = 'div.EWKNtlaOOYwGboxrLECAryApIuqhVXpZuIFdE'
+
+# Post containers on the feed and on profile activity pages
+POST_SELECTOR = 'div.feed-shared-update-v2, div.feed-shared-update'
+COMMENT_INPUT_SELECTOR = 'div.editor-content.ql-container div.ql-editor[contenteditable="true"]'
+POST_TEXT_SELECTOR = 'div.update-components-text.relative.update-components-update-v2__commentary span.break-words span[dir="ltr"]'
+
+# Snapshot of one post (element, id, text, like state, comment button); shared by the scripts below.
+# Posts without data-urn/data-id are identified by a hash of their text ('text-...'); only posts without text
+# fall back to a position id ('post-<page load time>-<i>'), which SeenPostStore keeps in memory only.
+_SNAPSHOT_POST_FN = """
+const textId = (text) => {
+    let hash = 0x811c9dc5;
+    for (let c = 0; c < text.length; c++) {
+        hash = Math.imul(hash ^ text.charCodeAt(c), 0x01000193) >>> 0;
+    }
+    return 'text-' + hash.toString(16) + '-' + text.length;
+};
+const snapshotPost = (post, i) => {
+    const textElem = post.querySelector(textSelector);
+    const text = textElem ? (textElem.innerText || textElem.textContent || '').trim() : null;
+    let likeButton = null;
+    for (const btn of post.querySelectorAll('button.react-button__trigger[aria-label*="Like"]')) {
+        const cls = (btn.getAttribute('class') || '').toLowerCase();
+        const label = btn.getAttribute('aria-label') || '';
+        if (!cls.includes('follow') && !label.includes('Follow')) {
+            likeButton = btn;
+            break;
+        }
+    }
+    const commentButton = post.querySelector('button[id^="feed-shared-social-action-bar-comment-"]');
+    return {
+        'element': post,
+        'post_id': post.getAttribute('data-urn') || post.getAttribute('data-id') || (text ? textId(text) : ('post-' + Math.round(performance.timeOrigin) + '-' + i)),
+        'text': text,
+        'liked': likeButton ? likeButton.getAttribute('aria-pressed') === 'true' : false,
+        'comment_button_id': commentButton ? commentButton.id : null
+    };
+};
+"""
+
+# Snapshots every visible post in a single execute_script call
+POST_SNAPSHOT_JS = """
+const [postSelector, textSelector] = arguments;
+""" + _SNAPSHOT_POST_FN + """
+return Array.from(document.querySelectorAll(postSelector)).map(snapshotPost);
+"""
+
+# "New posts" pill LinkedIn shows at the top of the feed instead of inserting new posts right away
+NEW_POSTS_BUTTON_SELECTOR = 'button.feed-new-update-pill__new-update-button'
+
+# Installs (once per page load) a MutationObserver queueing every post inserted into the feed, and queues
+# the posts already on the page; each post id is queued only once per page load
+FEED_WATCH_JS = """
+const postSelector = arguments[0];
+if (!window.__feedWatch) {
+    const state = {queue: [], seen: new Set(), counter: 0};
+    state.add = (post) => {
+        const key = post.getAttribute('data-urn') || post.getAttribute('data-id') || post;
+        if (state.seen.has(key)) return;
+        state.seen.add(key);
+        if (state.queue.length < 500) state.queue.push({post: post, tries: 0});
+    };
+    state.observer = new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType !== 1) continue;
+                if (node.matches(postSelector)) state.add(node);
+                node.querySelectorAll(postSelector).forEach(state.add);
+            }
+        }
+    });
+    state.observer.observe(document.body, {childList: true, subtree: true});
+    window.__feedWatch = state;
+}
+document.querySelectorAll(postSelector).forEach(window.__feedWatch.add);
+return window.__feedWatch.queue.length;
+"""
+
+# Ids (data-urn / data-id, null if missing) of the posts waiting in the page-side queue, or null without a watch
+FEED_QUEUE_IDS_JS = """
+const state = window.__feedWatch;
+if (!state) return null;
+return state.queue.map((entry) => entry.post.getAttribute('data-urn') || entry.post.getAttribute('data-id'));
+"""
+
+# Takes up to `limit` queued posts off the page-side queue and snapshots them. Posts whose id is in `skipIds`
+# (already handled) are dropped first, so they do not count toward the limit; posts whose text has not rendered
+# yet stay queued for up to `maxTries` drains. Returns null if the watch is gone (page reloaded or left the feed).
+FEED_DRAIN_JS = """
+const [textSelector, limit, maxTries, skipIds] = arguments;
+const state = window.__feedWatch;
+if (!state || !location.pathname.startsWith('/feed')) return null;
+""" + _SNAPSHOT_POST_FN + """
+const skip = new Set(skipIds || []);
+const ready = [];
+const waiting = [];
+for (const entry of state.queue) {
+    if (!entry.post.isConnected) continue;
+    const id = entry.post.getAttribute('data-urn') || entry.post.getAttribute('data-id');
+    if (id && skip.has(id)) continue;
+    if (ready.length < limit && (entry.post.querySelector(textSelector) || entry.tries >= maxTries)) {
+        ready.push(entry.post);
+    } else {
+        if (ready.length < limit) entry.tries += 1;
+        waiting.push(entry);
+    }
+}
+state.queue = waiting;
+return ready.map((post) => snapshotPost(post, 'watch-' + (state.counter++)));
+"""
+
+# Shows pending new posts and scrolls to the end of the feed so LinkedIn inserts more posts
+FEED_LOAD_MORE_JS = """
+const pill = document.querySelector(arguments[0]);
+if (pill) pill.click();
+window.scrollTo(0, document.body.scrollHeight);
+return !!pill;
+"""
+
+# Extracts every search result card in a single execute_script call (same selectors as _extract_profile_card)
+PROFILE_CARDS_JS = """
+const text = (el) => (el ? (el.innerText || el.textContent || '').trim() : '');
+return Array.from(document.querySelectorAll(arguments[0])).map((card) => {
+    const link = card.querySelector('a[href*="/in/"]');
+    const nameElem = link ? link.querySelector('span[aria-hidden="true"]') : null;
+    const divs = card.querySelectorAll('div.t-14.t-normal');
+    const locationElem = divs.length > 1 ? divs[1] : (divs.length === 1 ? divs[0] : null);
+    const summary = card.querySelector('p.entity-result__summary--2-lines');
+    return {
+        'Name': nameElem ? text(nameElem) : '',
+        'Profile Link': nameElem ? (link.href || '') : '',
+        'Headline': text(card.querySelector('div.t-14.t-black.t-normal')),
+        'Location': text(locationElem),
+        'Current Position': summary ? text(summary).replace('Current:', '').trim() : ''
+    };
+});
+"""
 
+# Set working directory to script location
+os.chdir(APP_DIR)
 
-TEMP_PROFILE = os.path.expanduser("~/AppData/Local/Temp/LinkedinProfile")
-
-_CONFIG_FILENAME = "config"
-_config = RawConfigParser()
 
+LOGGER = setup_logging()
 
-# Set working directory to script location
-import sys
-if getattr(sys, "frozen", False):
-    os.chdir(os.path.dirname(os.path.abspath(sys.executable)))
-else:
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-
-logging.basicConfig(filename="Monitoring.log", filemode="w",
-                    format="| %(name)s <==> %(levelname)s | %(asctime)s ==> %(message)s")
-LOGGER = logging.getLogger()
-LOGGER.setLevel(logging.DEBUG)
+def select(options, *args, **kwargs):
+    """Show an interactive menu; cutie is only imported when a menu is actually displayed."""
+    from cutie import select as cutie_select
+    return cutie_select(options, *args, **kwargs)
 
 
 # --- Refactored GPTManager class ---
 
 class GPTManager:
 
-    def __init__(self, config, config_filename, logger):
+    def __init__(self, config, config_filename, logger, comment_cache: CommentCache = None):
         """
         Initialize the GPTManager with config, config filename, and logger.
         Args:
             config: RawConfigParser object for configuration.
             config_filename: Path to the config file.
             logger: Logger object for logging errors/info.
+            comment_cache: Optional CommentCache consulted before calling OpenAI.
         """
         self._config = config
         self._CONFIG_FILENAME = config_filename
         self.LOGGER = logger
+        self.comment_cache = comment_cache
+        # One pooled client with timeouts and retries ([API] section) for every request
+        self.client = OpenAIClient(RetryPolicy.from_config(config))
+        # Comments are streamed and cut off at the length limit ([API] comment_max_chars)
+        self.comment_limit = CommentLimit.from_config(config)
 
     def generate_comment_for_description(self, description: str) -> str:
         """
@@ -60,50 +215,155 @@ class GPTManager:
             The generated comment as a string, or an error message if failed.
         """
         try:
-            import openai
-            openai.api_key = self._config["ALL"]["api"]
-            complete_prompt = f"{self._config['ALL']['static prompt']}\n{description}\n"
-            # openai>=1.0.0: use openai.chat.completions.create
-            response = openai.chat.completions.create(
-                model=self._config["ALL"]["ai model"],
-                messages=[{"role": "user", "content": complete_prompt}]
-            )
-            # The new API returns response.choices[0].message.content
-            return response.choices[0].message.content
+            static_prompt = self._config['ALL']['static prompt']
+            model = self._config["ALL"]["ai model"]
+            if self.comment_cache is not None:
+                cached = self.comment_cache.get(description, static_prompt, model)
+                if cached is not None:
+                    return cached
+            # The fixed prefix goes first as the system message so OpenAI can reuse it from its prompt cache
+            template = get_template(static_prompt, "ALL")
+            messages = template.messages(description)
+            with span("llm.comment", provider="gpt"):
+                if self.comment_limit.stream:
+                    comment = self.client.chat_stream(self._config["ALL"]["api"], model, messages, self.comment_limit,
+                                                      prompt_tokens=template.prompt_tokens(description))
+                else:
+                    options = {"max_tokens": self.comment_limit.max_tokens} if self.comment_limit.max_tokens else {}
+                    comment = self.comment_limit.trim(self.client.chat(self._config["ALL"]["api"], model, messages, **options))
+            if self.comment_cache is not None and comment:
+                self.comment_cache.put(description, static_prompt, model, comment)
+            return comment
         except Exception as e:
             self.LOGGER.exception("Exception while generating single comment!")
             return f"Error: {str(e)}"
+
+    @timed("llm.batch", provider="gpt")
+    def _request_batch(self, prompt: str, count: int) -> str:
+        """
+        Send one batch prompt for `count` posts to OpenAI, asking for a JSON reply.
+        Returns:
+            The raw reply text.
+        """
+        import openai
+        api_key = self._config["ALL"]["api"]
+        model = self._config["ALL"]["ai model"]
+        messages = [{"role": "user", "content": prompt}]
+        max_tokens = self.comment_limit.batch_max_tokens(count)
+        options = {"max_tokens": max_tokens} if max_tokens else {}
+        try:
+            return self.client.chat(api_key, model, messages, response_format={"type": "json_object"}, **options)
+        except openai.BadRequestError:
+            # Older models do not support JSON mode; the prompt still asks for JSON
+            return self.client.chat(api_key, model, messages, **options)
+
+    def generate_comments_for_descriptions(self, descriptions: list, batch_size: int = 5) -> list:
+        """
+        Generate comments for several posts, sending up to batch_size posts (and the static prompt once) per request.
+        Posts the batch reply does not cover are generated with single requests.
+        Args:
+            descriptions: Post texts.
+            batch_size: Maximum posts per request.
+        Returns:
+            List of comments, in the order of descriptions.
+        """
+        return generate_batched(descriptions, self._request_batch, self.generate_comment_for_description,
+                                comment_cache=self.comment_cache, prompt=self._config["ALL"].get("static prompt", ""),
+                                model=self._config["ALL"].get("ai model", ""), batch_size=batch_size,
+                                comment_limit=self.comment_limit)
             
-    def openai_request(self, row: pd.Series, total: int, new_dataframe: pd.DataFrame, file_chosen: str):
+    def _generate_post(self, index: int, topic: str, total: int):
         """
-        Send a prompt to OpenAI and save the response to the dataframe.
+        Send a topic prompt to OpenAI and return the generated post.
         Args:
-            row: Row from the input DataFrame.
-            total: Total number of rows.            pip install seleniumbase
-            new_dataframe: DataFrame to store generated posts.
-            file_chosen: Name of the file being processed.
+            index: Zero-based row index of the topic in the input sheet.
+            topic: Topic text from the input sheet.
+            total: Total number of rows.
+        Returns:
+            Tuple of (index, generated post), with None as the post if the request failed.
         """
         try:
-            print(f"{row.name + 1} / {total} => Generating Comment!")
-            complete_prompt = f"{self._config['ALL']['static prompt']}\n{row['Topics']}\n"
-            openai.api_key = self._config["ALL"]["api"]
-            response = openai.ChatCompletion.create(
-                model=self._config["ALL"]["ai model"],
-                messages=[
-                    {"role": "user", "content": complete_prompt}
-                ]
-            )
-            print(f"{row.name + 1} / {total} => Post generated!")
-            new_dataframe.loc[len(new_dataframe)] = {"Post Data": response.choices[0].message.content}
-            new_dataframe.to_excel(f"Output {file_chosen}", index=False)
-            print(f"{row.name + 1} / {total} => Post saved in excel!")
+            template = get_template(self._config['ALL']['static prompt'], "ALL")
+            with span("llm.post", provider="gpt"):
+                post = self.client.chat(self._config["ALL"]["api"], self._config["ALL"]["ai model"], template.messages(topic))
+            print(f"{index + 1} / {total} => Post generated!")
+            return index, post
         except Exception as e:
             self.LOGGER.exception("Exception while generating description!")
-            print(f"{row.name + 1} / {total} => Error occurred while generating description!")
+            print(f"{index + 1} / {total} => Error occurred while generating description!")
+            return index, None
+
+    def _load_checkpoint(self, checkpoint_file: str) -> dict:
+        """
+        Load the posts already generated by a previous (interrupted) run.
+        Args:
+            checkpoint_file: Path to the JSONL checkpoint file.
+        Returns:
+            Dict mapping row index to generated post.
+        """
+        done = {}
+        if not os.path.exists(checkpoint_file):
+            return done
+        with open(checkpoint_file, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                    done[int(record["row"])] = record["post"]
+                except (ValueError, KeyError, TypeError):
+                    # A partially written last line from a crash is simply regenerated
+                    continue
+        return done
+
+    def bulk_generate(self, topics: list, checkpoint_file: str, concurrency: int = 8, checkpoint_every: int = 25) -> list:
+        """
+        Generate posts for many topics with concurrent requests, checkpointing progress in batches.
+        Rows already present in the checkpoint file are skipped, so an interrupted run resumes where it stopped.
+        Args:
+            topics: List of topic strings, one per input row.
+            checkpoint_file: Path to the append-only JSONL checkpoint file.
+            concurrency: Number of requests in flight at once.
+            checkpoint_every: Number of finished posts buffered before they are appended to the checkpoint.
+        Returns:
+            List of generated posts in input row order (None for rows that failed).
+        """
+        total = len(topics)
+        results = self._load_checkpoint(checkpoint_file)
+        pending = [idx for idx in range(total) if idx not in results]
+        if results:
+            print(f"Resuming from checkpoint: {len(results)} / {total} posts already generated.")
+        buffer = []
+
+        def flush():
+            if not buffer:
+                return
+            with open(checkpoint_file, "a", encoding="utf-8") as file:
+                file.writelines(json.dumps({"row": idx, "post": post}) + "\n" for idx, post in buffer)
+            print(f"Checkpoint saved: {len(results)} / {total} posts generated.")
+            buffer.clear()
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = [executor.submit(self._generate_post, idx, topics[idx], total) for idx in pending]
+            try:
+                for future in as_completed(futures):
+                    idx, post = future.result()
+                    if post is None:
+                        continue
+                    results[idx] = post
+                    buffer.append((idx, post))
+                    if len(buffer) >= checkpoint_every:
+                        flush()
+            finally:
+                # Keep whatever finished, even when interrupted
+                for future in futures:
+                    future.cancel()
+                flush()
+        return [results.get(idx) for idx in range(total)]
 
     def generate_description(self):
         """
         Generate posts in bulk from an Excel file using OpenAI and save the results.
+        Requests run concurrently ([ALL] concurrency, default 8) and progress is checkpointed,
+        so re-running on the same file resumes instead of starting over.
         """
         accepted_extensions = [".xlsx"]
         files = [file for file in os.listdir("files") if os.path.splitext(file)[1] in accepted_extensions]
@@ -114,11 +374,24 @@ class GPTManager:
             input("Press Enter to continue!")
             return
         file_chosen = files[select(files)]
+        import pandas as pd
         dataframe = pd.read_excel(f"files/{file_chosen}", index_col=False)
         dataframe.fillna('', inplace=True)
-        new_dataframe = pd.DataFrame(columns=["Post Data"])
-        dataframe.apply(lambda row: self.openai_request(row, len(dataframe), new_dataframe, file_chosen), axis=1)
-        input("Posts generated!\nPress Enter to continue!")
+        try:
+            concurrency = int(self._config["ALL"].get("concurrency", "8"))
+        except ValueError:
+            concurrency = 8
+        output_file = f"Output {file_chosen}"
+        checkpoint_file = f"Output {os.path.splitext(file_chosen)[0]}.checkpoint.jsonl"
+        posts = self.bulk_generate(dataframe["Topics"].tolist(), checkpoint_file, concurrency=concurrency)
+        new_dataframe = pd.DataFrame({"Post Data": [post if post is not None else "" for post in posts]})
+        new_dataframe.to_excel(output_file, index=False)
+        failed = sum(1 for post in posts if post is None)
+        if failed:
+            print(f"{failed} / {len(posts)} posts failed, run again on the same file to retry them.")
+        elif os.path.exists(checkpoint_file):
+            os.remove(checkpoint_file)
+        input(f"Posts generated and saved in {output_file}!\nPress Enter to continue!")
 
     def multiple_line_input(self, default_message: str) -> str:
         """
@@ -179,8 +452,7 @@ class GPTManager:
         """
         Save the current configuration to the config file.
         """
-        with open(self._CONFIG_FILENAME, "w", encoding="utf-8") as file:
-            self._config.write(file)
+        write_config(self._config, self._CONFIG_FILENAME)
 
     def view_config(self):
         """
@@ -241,20 +513,34 @@ class GPTManager:
 
 class LinkedInManager:
 
-    def __init__(self, gpt_manager: GPTManager, google_manager=None, config=None, mode="headon"):
+    def __init__(self, gpt_manager: GPTManager, google_manager=None, config=None, mode="headon", user_data_dir=TEMP_PROFILE,
+                 local_manager=None):
         """
         Initialize the LinkedInManager with references to the GPTManager and GoogleManager for comment generation.
         mode: 'headless' (no browser UI) or 'headon' (browser UI shown)
+        user_data_dir: Chrome profile directory (each parallel worker uses its own)
+        local_manager: Optional LocalManager for comment_source 'local' (on-device model)
         """
-        self.driver: Chrome = None
-        self.wait: WebDriverWait = None
+        self.driver: "Chrome" = None
+        self.wait: "WebDriverWait" = None
         self.email: str = ''
         self.password: str = ''
-        self.sb_init: SB = None
+        self.sb_init = None
         self.gpt_manager = gpt_manager
         self.google_manager = google_manager
+        self.local_manager = local_manager
         self._config = config
         self._mode = mode
+        self._user_data_dir = user_data_dir
+        self._comment_executor: ThreadPoolExecutor = None
+        self._router: ProviderRouter = None
+        self.pacer = Pacer.from_config(config)
+        # Stage timings are exported per [METRICS] and summarized in kill_browser
+        REGISTRY.configure(config)
+        # Set to end the running loop (feed, warmup, connections, hunting) after the current item
+        self.stop_event = threading.Event()
+        # Shared hourly/daily limits for likes, comments, invitations and page views ([BUDGET] section)
+        self.budget = ActionBudget.from_config(config)
         # Default to GPT if not set
         if self._config is not None:
             if not self._config.has_section("LINKEDIN"):
@@ -263,24 +549,172 @@ class LinkedInManager:
                 self._config["LINKEDIN"]["comment_source"] = "gpt"
         # Do not start Chrome on init; start only when needed
 
+    def _max_posts(self) -> int:
+        """Posts to like/comment per feed refresh or profile ([LINKEDIN] max_posts, default 10)."""
+        if self._config is None or not self._config.has_section("LINKEDIN"):
+            return 10
+        try:
+            return max(1, int(self._config["LINKEDIN"].get("max_posts", "10")))
+        except ValueError:
+            return 10
+
+    def _spend(self, kind: str) -> bool:
+        """
+        Spend one action of the shared budget.
+        Args:
+            kind: 'like', 'comment', 'invite' or 'page_view'.
+        Returns:
+            True if the action may be performed (always True when budgets are disabled).
+        """
+        return self.budget is None or self.budget.try_spend(kind)
+
+    def _run_job(self, name: str, steps) -> None:
+        """
+        Run one step generator through a JobScheduler, so budgets also apply when a mode runs on its own.
+        """
+        scheduler = JobScheduler(self.budget, self.stop_event)
+        scheduler.add(name, steps)
+        scheduler.run()
+
+    def _feed_watch_enabled(self) -> bool:
+        """Watch the feed for inserted posts between reloads ([LINKEDIN] feed_watch, default true)."""
+        if self._config is None or not self._config.has_section("LINKEDIN"):
+            return True
+        return self._config["LINKEDIN"].get("feed_watch", "true").lower() not in ("0", "false", "no", "off")
+
+    def _feed_reload_seconds(self) -> float:
+        """Seconds between full feed reloads in watch mode ([LINKEDIN] feed_reload_minutes, default 15)."""
+        if self._config is None or not self._config.has_section("LINKEDIN"):
+            return 15 * 60
+        try:
+            return max(1.0, float(self._config["LINKEDIN"].get("feed_reload_minutes", "15"))) * 60
+        except ValueError:
+            return 15 * 60
+
+    def _pipeline_workers(self) -> int:
+        """Number of background comment-generation workers (0 disables pipelining)."""
+        if self._config is None or not self._config.has_section("LINKEDIN"):
+            return 0
+        try:
+            return max(0, int(self._config["LINKEDIN"].get("pipeline_workers", "4")))
+        except ValueError:
+            return 0
+
+    def _get_comment_executor(self) -> ThreadPoolExecutor:
+        """Create (once) and return the thread pool used to generate comments ahead of the browser."""
+        if self._comment_executor is None:
+            self._comment_executor = ThreadPoolExecutor(max_workers=self._pipeline_workers(), thread_name_prefix="comment")
+        return self._comment_executor
+
+    def _comment_source(self) -> str:
+        """Return the configured comment source ('gpt', 'google' or 'local')."""
+        if self._config is not None and self._config.has_section("LINKEDIN"):
+            return self._config["LINKEDIN"].get("comment_source", "gpt")
+        return "gpt"
+
+    def _comment_manager(self):
+        """Return the manager of the configured comment source."""
+        comment_source = self._comment_source()
+        if comment_source == "google" and self.google_manager is not None:
+            return self.google_manager
+        if comment_source == "local" and self.local_manager is not None:
+            return self.local_manager
+        return self.gpt_manager
+
+    def _get_router(self) -> ProviderRouter:
+        """
+        Create (once) and return the ProviderRouter over all comment sources that have credentials or a model set,
+        so a slow or failing source is backed up by the others.
+        """
+        if self._router is None:
+            def configured(section, *keys):
+                return self._config is not None and self._config.has_section(section) and \
+                    any(self._config[section].get(key, "") for key in keys)
+            providers = {"gpt": self.gpt_manager}
+            if self.google_manager is not None:
+                providers["google"] = self.google_manager
+            if self.local_manager is not None:
+                providers["local"] = self.local_manager
+            comment_source = self._comment_source()
+            sections = {"gpt": ("ALL", "api"), "google": ("GOOGLE", "api"), "local": ("LOCAL", "model_path", "repo_id")}
+            # The selected source is always kept, even if it looks unconfigured
+            providers = {name: manager for name, manager in providers.items()
+                         if name == comment_source or configured(*sections[name])}
+            # Each comment-pipeline worker may wait on every provider at once (hedging)
+            self._router = ProviderRouter.from_config(self._config, providers,
+                                                      workers_per_provider=max(1, self._pipeline_workers()))
+        return self._router
+
+    def _comment_batch_size(self) -> int:
+        """Posts per comment generation request ([LINKEDIN] comment_batch_size, default 5; 1 disables batching)."""
+        if self._config is None or not self._config.has_section("LINKEDIN"):
+            return 5
+        try:
+            return max(1, int(self._config["LINKEDIN"].get("comment_batch_size", "5")))
+        except ValueError:
+            return 5
+
+    def _job_router(self, comment_source: str = None):
+        """
+        Return the router and the source to prefer: comment_source if a job set one, else the configured source.
+        A source chosen for a single job is added to the router even if the config does not set it up.
+        """
+        router = self._get_router()
+        comment_source = comment_source or self._comment_source()
+        managers = {"gpt": self.gpt_manager, "google": self.google_manager, "local": self.local_manager}
+        if managers.get(comment_source) is not None:
+            router.add_provider(comment_source, managers[comment_source])
+        return router, comment_source
+
+    def _generate_comment(self, content: str, comment_source: str = None) -> str:
+        """
+        Generate a comment for a post using the job's or configured comment source, failing over to the others.
+        Args:
+            content: The post text.
+            comment_source: Source for this job ('gpt', 'google' or 'local'); defaults to the configured one.
+        Returns:
+            The generated comment as a string, or None if no source produced a usable one.
+        """
+        router, comment_source = self._job_router(comment_source)
+        return router.generate_comment(content, comment_source)
+
+    def _generate_comments(self, contents: list, comment_source: str = None) -> list:
+        """
+        Generate comments for several posts in one batched request using the job's or configured comment source.
+        Args:
+            contents: The post texts.
+            comment_source: Source for this job; defaults to the configured one.
+        Returns:
+            List of generated comments (None where generation failed), in order.
+        """
+        router, comment_source = self._job_router(comment_source)
+        return router.generate_comments(contents, comment_source, batch_size=len(contents))
+
+    @timed("browser.start")
     def start_chrome(self) -> None:
         """Start the Chrome browser for automation, using the selected mode."""
+        from seleniumbase import SB
+        from selenium.webdriver.support.wait import WebDriverWait
         headless = self._mode == "headless"
-        self.sb_init = SB(uc=True, headed=not headless, headless2=headless, user_data_dir=TEMP_PROFILE)
+        self.sb_init = SB(uc=True, headed=not headless, headless2=headless, user_data_dir=self._user_data_dir)
         sb = self.sb_init.__enter__()
         self.driver = sb.driver
         self.wait = WebDriverWait(self.driver, 30)
 
     def linkedin_signin(self) -> bool:
         """Sign in to LinkedIn. Starts Chrome if not already started."""
+        from selenium.webdriver.support import expected_conditions as ec
         if self.driver is None:
             self.start_chrome()
         signin_successful = False
+        watch = Stopwatch()
         self.driver.get("https://www.linkedin.com/")
+        watch.lap("signin.navigate")
         while True:
             try:
                 self.driver.find_element(By.CSS_SELECTOR, "a[href*='linkedin.com/events']")
                 signin_successful = True
+                watch.lap("signin.session_check")
                 return signin_successful
             except:
                 pass
@@ -291,6 +725,8 @@ class LinkedInManager:
                 pass
         self.email = input("Enter your Email: ")
         self.password = input("Enter your Password: ")
+        # Time spent typing credentials at the prompt is not part of any stage
+        watch.restart()
         email_input = self.wait.until(ec.presence_of_element_located((By.CSS_SELECTOR, "#session_key")))
         email_input.send_keys(self.email)
         pass_inp = self.wait.until(ec.presence_of_element_located((By.CSS_SELECTOR, "#session_password")))
@@ -304,91 +740,129 @@ class LinkedInManager:
                 break
             except:
                 pass
+        watch.lap("signin.submit")
         return signin_successful
 
+    def send_connection_request(self, profile_url: str, name: str, message_template: str, label: str = "") -> str:
+        """
+        Visit one profile and send a connection request with a personalized note.
+        Args:
+            profile_url: LinkedIn profile URL.
+            name: Name used for {Name} in the message template.
+            message_template: Message template for the note.
+            label: Prefix for progress messages (e.g. "Row 3").
+        Returns:
+            Status string: 'sent', 'no_connect_button', 'budget_reached', 'page_view_budget_reached' (profile not
+            visited), 'note_failed' or 'error'.
+        """
+        import traceback
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        try:
+            watch = Stopwatch()
+            if not self._spend("page_view"):
+                print(f"{label}: Page view budget reached, skipping.")
+                return "page_view_budget_reached"
+            self.driver.get(profile_url)
+            self.pacer.wait_dom_ready(self.driver)
+            watch.lap("connect.navigate")
+            self.pacer.pause("read")
+            watch.restart()
+            # Try to find the Connect button
+            connect_btn = None
+            try:
+                # Try primary connect button
+                connect_btn = WebDriverWait(self.driver, 10).until(
+                    EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Connect') and not(@disabled)]"))
+                )
+            except Exception:
+                # Try in the overflow menu (More...)
+                try:
+                    more_btn = self.driver.find_element(By.XPATH, "//button[contains(., 'More')]" )
+                    more_btn.click()
+                    self.pacer.pause("action")
+                    connect_btn = WebDriverWait(self.driver, 5).until(
+                        EC.element_to_be_clickable((By.XPATH, "//span[text()='Connect']/ancestor::button[not(@disabled)]"))
+                    )
+                except Exception:
+                    print(f"{label}: Could not find Connect button, skipping.")
+                    return "no_connect_button"
+            watch.lap("connect.find_button")
+            if not self._spend("invite"):
+                print(f"{label}: Invitation budget reached, skipping.")
+                return "budget_reached"
+            connect_btn.click()
+            self.pacer.pause("action")
+            # Add a note
+            try:
+                add_note_btn = WebDriverWait(self.driver, 5).until(
+                    EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Add a note')]"))
+                )
+                add_note_btn.click()
+                self.pacer.pause("action")
+                # Fill the message
+                msg_box = WebDriverWait(self.driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "textarea[name='message']"))
+                )
+                personalized_msg = message_template.format(Name=name or "there")
+                msg_box.clear()
+                msg_box.send_keys(personalized_msg)
+                self.pacer.pause("typing")
+                # Send the invitation
+                send_btn = self.driver.find_element(By.XPATH, "//button[contains(., 'Send')]" )
+                send_btn.click()
+                watch.lap("connect.invite")
+                print(f"{label}: Connection request sent.")
+            except Exception:
+                print(f"{label}: Could not add note or send request. Skipping.")
+                return "note_failed"
+            self.pacer.pause("between_items")
+            return "sent"
+        except Exception as e:
+            print(f"{label}: Error: {e}")
+            traceback.print_exc()
+            return "error"
+
     def send_connection_requests_from_excel(self, input_excel: str, message_template: str = "Hi {Name}, I'd like to connect with you on LinkedIn!"):
 
         """
         Read an Excel file with a 'Profile Link' column and send connection requests with a personalized message to each user.
+        Rows are streamed from the file (.xlsx, .csv or .jsonl), so large lists are not loaded into memory.
         """
-        import pandas as pd
-        import time
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        import traceback
+        self._run_job("connection requests", self.connection_request_steps(input_excel, message_template))
 
+    def connection_request_steps(self, input_excel: str, message_template: str):
+        """
+        Step generator behind send_connection_requests_from_excel for the JobScheduler: one step per row,
+        each needing the 'invite' budget.
+        """
         if self.driver is None:
             self.start_chrome()
 
         try:
-            df = pd.read_excel(input_excel)
+            if 'Profile Link' not in read_header(input_excel):
+                print("Excel file must contain a 'Profile Link' column.")
+                return
+            total = count_rows(input_excel)
         except Exception as e:
             print(f"Failed to read Excel file: {e}")
             return
 
-        if 'Profile Link' not in df.columns:
-            print("Excel file must contain a 'Profile Link' column.")
-            return
-
-        for idx, row in df.iterrows():
-            profile_url = row.get('Profile Link', '').strip()
-            name = row.get('Name', '').strip() if 'Name' in row else ''
+        for idx, row in enumerate(iter_rows(input_excel)):
+            if self.stop_event.is_set():
+                print("Stopped.")
+                return
+            profile_url = str(row.get('Profile Link', '')).strip()
+            name = str(row.get('Name', '')).strip()
             if not profile_url:
                 print(f"Row {idx+1}: No profile link, skipping.")
                 continue
-            print(f"[{idx+1}/{len(df)}] Visiting: {profile_url}")
-            try:
-                self.driver.get(profile_url)
-                time.sleep(5)
-                # Try to find the Connect button
-                connect_btn = None
-                try:
-                    # Try primary connect button
-                    connect_btn = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Connect') and not(@disabled)]"))
-                    )
-                except Exception:
-                    # Try in the overflow menu (More...)
-                    try:
-                        more_btn = self.driver.find_element(By.XPATH, "//button[contains(., 'More')]" )
-                        more_btn.click()
-                        time.sleep(1)
-                        connect_btn = WebDriverWait(self.driver, 5).until(
-                            EC.element_to_be_clickable((By.XPATH, "//span[text()='Connect']/ancestor::button[not(@disabled)]"))
-                        )
-                    except Exception:
-                        print(f"Row {idx+1}: Could not find Connect button, skipping.")
-                        continue
-                connect_btn.click()
-                time.sleep(2)
-                # Add a note
-                try:
-                    add_note_btn = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Add a note')]"))
-                    )
-                    add_note_btn.click()
-                    time.sleep(1)
-                    # Fill the message
-                    msg_box = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "textarea[name='message']"))
-                    )
-                    personalized_msg = message_template.format(Name=name or "there")
-                    msg_box.clear()
-                    msg_box.send_keys(personalized_msg)
-                    time.sleep(1)
-                    # Send the invitation
-                    send_btn = self.driver.find_element(By.XPATH, "//button[contains(., 'Send')]" )
-                    send_btn.click()
-                    print(f"Row {idx+1}: Connection request sent.")
-                except Exception:
-                    print(f"Row {idx+1}: Could not add note or send request. Skipping.")
-                    continue
-                time.sleep(2)
-            except Exception as e:
-                print(f"Row {idx+1}: Error: {e}")
-                traceback.print_exc()
-                continue
+            yield ("invite", 0)
+            print(f"[{idx+1}/{total}] Visiting: {profile_url}")
+            while self.send_connection_request(profile_url, name, message_template, label=f"Row {idx+1}") == "page_view_budget_reached":
+                # Wait for the page view budget and retry the row instead of skipping it
+                yield ("page_view", 0)
         print("All connection requests processed.")
 
     def connection_request_menu(self):
@@ -411,24 +885,40 @@ class LinkedInManager:
             elif choice == 1:
                 break
     
-    def connection_hunting(self, search_url: str, output_excel: str = "linkedin_connections.xlsx"):
+    def connection_hunting(self, search_url: str, output_excel: str = "linkedin_connections.xlsx", start_page: int = None):
         """
         On a given LinkedIn search URL, grab all visible profiles and save Name, Headline, Location, and Current Position to an Excel file.
         Handles missing elements gracefully. Also paginates through all result pages.
+        The output may also be a .csv or .jsonl file; rows are appended page by page.
+        Profiles are deduplicated by normalized profile URL in '<output>.sqlite3', which also records the last
+        completed page so an interrupted search resumes automatically. Stops early when a page has nothing new.
+        start_page: Page to start from; defaults to the page after the last completed one.
+        """
+        self._run_job("connection hunting", self.connection_hunting_steps(search_url, output_excel, start_page))
+
+    def connection_hunting_steps(self, search_url: str, output_excel: str = "linkedin_connections.xlsx", start_page: int = None):
+        """
+        Step generator behind connection_hunting for the JobScheduler: one step per result page,
+        each needing the 'page_view' budget.
         """
-        import pandas as pd
         from selenium.webdriver.common.by import By
         import time
         import re
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
 
+        if start_page is not None and start_page < 1:
+            print(f"Invalid start page {start_page}: pages start at 1.")
+            return
         if self.driver is None:
             self.start_chrome()
 
         # Go to the first page
+        yield ("page_view", 0)
+        while not self._spend("page_view"):
+            yield ("page_view", 0)
         self.driver.get(search_url)
-        time.sleep(5)
+        self.pacer.wait_dom_ready(self.driver)
 
         # Find total number of pages from pagination by detecting the last number button robustly
         try:
@@ -476,92 +966,158 @@ class LinkedInManager:
         else:
             base_url = base_url + '?page={}'
 
-        profiles = []
-        # Try to load existing data if file exists (for resume support)
-        import os
-        if os.path.exists(output_excel):
-            try:
-                profiles = pd.read_excel(output_excel).to_dict(orient='records')
-            except Exception:
-                profiles = []
-
-        pagest = input(f"Enter the page number to start from (1-{total_pages}, default 1): ").strip()
-        if pagest.isdigit() and 1 <= int(pagest) <= total_pages:
-            start_page = int(pagest)
-        for page in range(start_page, total_pages + 1):
-            url = base_url.format(page)
-            print(f"Processing page {page} of {total_pages}")
-            self.driver.get(url)
-            time.sleep(5)
-            # Scroll to load all profiles on the page
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            scroll_attempts = 0
-            max_scrolls = 5
-            while scroll_attempts < max_scrolls:
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
+        # Append each page to the output instead of re-serializing every profile collected so far;
+        # rows already in the file (from an earlier run) are kept
+        profile_columns = ["Name", "Profile Link", "Headline", "Location", "Current Position"]
+        existing_rows = count_rows(output_excel) if os.path.exists(output_excel) else 0
+
+        store = HuntResultsStore(f"{os.path.splitext(output_excel)[0]}.sqlite3")
+        if len(store) == 0 and existing_rows:
+            # First run with a dedup index: index the profiles already saved by earlier runs
+            store.add_profiles(list(iter_rows(output_excel)))
+        # The search URL without its page parameter identifies the search for resume
+        search_key = base_url.rsplit('page={}', 1)[0].rstrip('?&')
+        if start_page is None:
+            start_page = store.last_completed_page(search_key) + 1
+            if start_page > 1:
+                print(f"Resuming from page {start_page} (pages 1-{start_page - 1} already completed).")
+        if start_page > total_pages:
+            print(f"All {total_pages} pages of this search were already processed.")
+            store.close()
+            return
+        writer = RowWriter(output_excel, profile_columns)
+        try:
+            for page in range(start_page, total_pages + 1):
+                if self.stop_event.is_set():
+                    print(f"Stopped before page {page}.")
                     break
-                last_height = new_height
-                scroll_attempts += 1
-
-            # Find all profile containers (robust selector for LinkedIn search results)
-            cards = self.driver.find_elements(By.CSS_SELECTOR, 'div.EWKNtlaOOYwGboxrLECAryApIuqhVXpZuIFdE')
-            for card in cards:
-                # Name and Profile Link
+                yield ("page_view", 0)
+                url = base_url.format(page)
+                print(f"Processing page {page} of {total_pages}")
+                while not self._spend("page_view"):
+                    yield ("page_view", 0)
+                watch = Stopwatch()
+                self.driver.get(url)
+                self.pacer.wait_dom_ready(self.driver)
+                self.pacer.wait_present(self.driver, (By.CSS_SELECTOR, PROFILE_CARD_SELECTOR))
+                watch.lap("hunt.navigate")
+                self.pacer.pause("read")
+                watch.restart()
+                # Scroll to load all profiles on the page
+                last_height = self.driver.execute_script("return document.body.scrollHeight")
+                scroll_attempts = 0
+                max_scrolls = 5
+                while scroll_attempts < max_scrolls:
+                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    self.pacer.wait_network_idle(self.driver, timeout=5)
+                    self.pacer.pause("scroll")
+                    new_height = self.driver.execute_script("return document.body.scrollHeight")
+                    if new_height == last_height:
+                        break
+                    last_height = new_height
+                    scroll_attempts += 1
+                watch.lap("hunt.scroll")
+
+                # Extract every result card in one round trip; fall back to per-element lookups if the script fails
+                page_profiles = self._extract_profile_cards()
+                if page_profiles is None:
+                    cards = self.driver.find_elements(By.CSS_SELECTOR, PROFILE_CARD_SELECTOR)
+                    page_profiles = [self._extract_profile_card(card) for card in cards]
+                watch.lap("hunt.extract")
+
+                # Keep only profiles not seen before (O(1) index lookup per profile); the index and the page
+                # marker are only committed once the rows are in the output file
+                new_profiles = store.add_profiles(page_profiles, search_key, page, commit=False)
+                print(f"Page {page}: {len(page_profiles)} profiles, {len(new_profiles)} new.")
+
+                # Save after each page to avoid data loss
                 try:
-                    a_elem = card.find_element(By.CSS_SELECTOR, 'a[href*="/in/"]')
-                    name_elem = a_elem.find_element(By.CSS_SELECTOR, 'span[aria-hidden="true"]')
-                    name = name_elem.text.strip()
-                    profile_link = a_elem.get_attribute('href')
-                except Exception:
-                    name = ""
-                    profile_link = ""
-                # Headline (role/title)
-                try:
-                    headline_elem = card.find_element(By.CSS_SELECTOR, 'div.t-14.t-black.t-normal')
-                    headline = headline_elem.text.strip()
-                except Exception:
-                    headline = ""
-                # Location (try to get the second t-14.t-normal div if available)
-                try:
-                    location_elem = None
-                    divs = card.find_elements(By.CSS_SELECTOR, 'div.t-14.t-normal')
-                    if len(divs) > 1:
-                        location_elem = divs[1]
-                    elif len(divs) == 1:
-                        location_elem = divs[0]
-                    if location_elem:
-                        location = location_elem.text.strip()
-                    else:
-                        location = ""
-                except Exception:
-                    location = ""
-                # Current Position (from summary paragraph, if present)
-                try:
-                    current_position_elem = card.find_element(By.CSS_SELECTOR, 'p.entity-result__summary--2-lines')
-                    # Remove label 'Current:' and get the rest
-                    current_position = current_position_elem.text.replace('Current:', '').strip()
-                except Exception:
-                    current_position = ""
-                profiles.append({
-                    "Name": name,
-                    "Profile Link": profile_link,
-                    "Headline": headline,
-                    "Location": location,
-                    "Current Position": current_position
-                })
-
-            # Save after each page to avoid data loss
-            try:
-                df = pd.DataFrame(profiles)
-                df.to_excel(output_excel, index=False)
-                print(f"Saved {len(df)} profiles to {output_excel} (up to page {page})")
-            except Exception as e:
-                print(f"Error saving data after page {page}: {e}")
+                    writer.write_rows(new_profiles)
+                    print(f"Saved {existing_rows + writer.rows_written} profiles to {output_excel} (up to page {page})")
+                except Exception as e:
+                    store.rollback()
+                    print(f"Error saving data after page {page}: {e}. Stopping; the page is retried on the next run.")
+                    break
+                store.mark_page_done(search_key, page, total_pages, commit=False)
+                store.commit()
+                watch.lap("hunt.save")
+                if not new_profiles:
+                    print(f"Page {page} yielded no new profiles, stopping early.")
+                    break
+        finally:
+            writer.close()
+            store.close()
 
-        print(f"Saved {len(profiles)} profiles to {output_excel}")
+        print(f"Saved {existing_rows + writer.rows_written} profiles to {output_excel}")
+
+    def _extract_profile_cards(self):
+        """
+        Extract Name, Profile Link, Headline, Location and Current Position for every result card on the page
+        with one injected script.
+        Returns:
+            List of profile dicts, or None if the script failed (caller should use the per-element fallback).
+        """
+        try:
+            cards = self.driver.execute_script(PROFILE_CARDS_JS, PROFILE_CARD_SELECTOR)
+            if not isinstance(cards, list):
+                return None
+            return [dict(card) for card in cards]
+        except Exception as e:
+            LOGGER.exception("Profile card script extraction failed")
+            print(f"Script extraction failed ({e}), falling back to per-element extraction.")
+            return None
+
+    def _extract_profile_card(self, card) -> dict:
+        """
+        Extract one result card through individual WebDriver calls. Slower fallback for _extract_profile_cards.
+        Args:
+            card: Selenium WebElement of the result card.
+        Returns:
+            Profile dict with Name, Profile Link, Headline, Location and Current Position.
+        """
+        # Name and Profile Link
+        try:
+            a_elem = card.find_element(By.CSS_SELECTOR, 'a[href*="/in/"]')
+            name_elem = a_elem.find_element(By.CSS_SELECTOR, 'span[aria-hidden="true"]')
+            name = name_elem.text.strip()
+            profile_link = a_elem.get_attribute('href')
+        except Exception:
+            name = ""
+            profile_link = ""
+        # Headline (role/title)
+        try:
+            headline_elem = card.find_element(By.CSS_SELECTOR, 'div.t-14.t-black.t-normal')
+            headline = headline_elem.text.strip()
+        except Exception:
+            headline = ""
+        # Location (try to get the second t-14.t-normal div if available)
+        try:
+            location_elem = None
+            divs = card.find_elements(By.CSS_SELECTOR, 'div.t-14.t-normal')
+            if len(divs) > 1:
+                location_elem = divs[1]
+            elif len(divs) == 1:
+                location_elem = divs[0]
+            if location_elem:
+                location = location_elem.text.strip()
+            else:
+                location = ""
+        except Exception:
+            location = ""
+        # Current Position (from summary paragraph, if present)
+        try:
+            current_position_elem = card.find_element(By.CSS_SELECTOR, 'p.entity-result__summary--2-lines')
+            # Remove label 'Current:' and get the rest
+            current_position = current_position_elem.text.replace('Current:', '').strip()
+        except Exception:
+            current_position = ""
+        return {
+            "Name": name,
+            "Profile Link": profile_link,
+            "Headline": headline,
+            "Location": location,
+            "Current Position": current_position
+        }
 
     def connection_hunting_menu(self):
         """
@@ -581,100 +1137,252 @@ class LinkedInManager:
             elif choice == 1:
                 break
 
-    def _like_and_comment_on_posts(self, posts, processed_posts=None, max_posts=10, require_long_content=False):
+    @timed("posts.snapshot")
+    def _snapshot_posts(self) -> list:
+        """
+        Snapshot all visible posts (element, post id, text, liked state, comment button id) in one script call.
+        Falls back to the plain WebElement list if the script fails.
+        Returns:
+            List of snapshot dicts, or of WebElements on fallback; both are accepted by _like_and_comment_on_posts.
+        """
+        try:
+            snapshots = self.driver.execute_script(POST_SNAPSHOT_JS, POST_SELECTOR, POST_TEXT_SELECTOR)
+            if isinstance(snapshots, list):
+                return snapshots
+        except Exception as e:
+            LOGGER.exception("Post snapshot script failed")
+            print(f"Post snapshot failed ({e}), falling back to per-element extraction.")
+        return self.driver.find_elements(By.CSS_SELECTOR, POST_SELECTOR)
+
+    def _install_feed_watch(self) -> bool:
+        """
+        Inject the feed MutationObserver (see FEED_WATCH_JS) and queue the posts already on the page.
+        Returns:
+            True if the watch is running.
+        """
+        try:
+            self.driver.execute_script(FEED_WATCH_JS, POST_SELECTOR)
+            return True
+        except Exception as e:
+            LOGGER.exception("Feed watch script failed")
+            print(f"Feed watch could not be started ({e}), using full reloads.")
+            return False
+
+    @timed("feed.drain")
+    def _drain_feed_watch(self, limit: int, is_handled=None):
+        """
+        Take up to `limit` newly inserted posts off the page-side queue.
+        Args:
+            limit: Maximum number of posts to return.
+            is_handled: Optional predicate on a post id; queued posts it accepts (already seen, postponed) are dropped
+                        before the limit is applied, so they do not take the places of new posts.
+        Returns:
+            List of post snapshots (as from _snapshot_posts), or None if the watch is not running on this page.
+        """
+        try:
+            skip_ids = []
+            if is_handled is not None:
+                queued_ids = self.driver.execute_script(FEED_QUEUE_IDS_JS)
+                if queued_ids is None:
+                    return None
+                skip_ids = [post_id for post_id in queued_ids if post_id and is_handled(post_id)]
+            posts = self.driver.execute_script(FEED_DRAIN_JS, POST_TEXT_SELECTOR, limit, 3, skip_ids)
+        except Exception:
+            LOGGER.exception("Feed watch drain failed")
+            return None
+        return posts if isinstance(posts, list) else None
+
+    def _load_more_posts(self) -> None:
+        """Click the "New posts" pill if shown and scroll to the end of the feed, so new posts get inserted."""
+        try:
+            if self.driver.execute_script(FEED_LOAD_MORE_JS, NEW_POSTS_BUTTON_SELECTOR):
+                print("Showing new posts.")
+            self.pacer.wait_network_idle(self.driver, timeout=5)
+        except Exception as e:
+            print(f"Could not load more posts: {e}")
+
+    def _like_and_comment_on_posts(self, posts, processed_posts=None, max_posts=10, require_long_content=False,
+                                   comment_source=None, deferred_posts=None):
         """
         Like and comment on LinkedIn posts. Used by both monitor_feed and warmup_profile_activity.
-        - posts: list of Selenium WebElement posts
-        - processed_posts: set of post IDs to avoid duplicates (optional)
+        - posts: list of post snapshots from _snapshot_posts, or Selenium WebElement posts
+        - processed_posts: set-like store of post IDs to avoid duplicates, e.g. SeenPostStore (optional)
         - max_posts: maximum number of posts to process
         - require_long_content: if True, only comment if content >= 100 chars (for feed); else always comment (for warmup)
+        - comment_source: comment source of this job ('gpt', 'google' or 'local'); defaults to the configured one
+        - deferred_posts: set of post IDs postponed earlier in this run (optional); they are skipped, so they
+          neither take max_posts slots nor trigger new comment requests, and postponed posts are added to it
+        When pipeline_workers > 0 in the [LINKEDIN] config, comments for all candidate posts are generated
+        in a background pool while the browser likes and opens comment boxes, instead of one post at a time.
         Returns: number of posts processed
         """
-        count = 0
+        # Collect unseen posts and their text up front so generation can start before any browser action
+        watch = Stopwatch()
+        candidates = []
         for idx, post in enumerate(posts):
-            if count >= max_posts:
+            if len(candidates) >= max_posts:
                 break
+            # Snapshots already carry id, text and like state, so no WebDriver calls are needed here
+            snapshot = post if isinstance(post, dict) else None
+            if snapshot is not None:
+                post = snapshot["element"]
             try:
                 # Unique post id logic (optional for warmup)
                 post_id = None
                 if processed_posts is not None:
-                    try:
-                        post_id = post.get_attribute('data-urn') or post.get_attribute('data-id') or f'post-{idx}'
-                    except Exception:
-                        post_id = f'post-{idx}'
+                    if snapshot is not None:
+                        post_id = snapshot["post_id"]
+                    else:
+                        try:
+                            post_id = post.get_attribute('data-urn') or post.get_attribute('data-id') or f'post-{idx}'
+                        except Exception:
+                            post_id = f'post-{idx}'
                     if post_id in processed_posts:
                         continue
+                    if deferred_posts is not None and post_id in deferred_posts:
+                        continue
 
                 # Extract post description
-                try:
-                    content_elem = post.find_element(By.CSS_SELECTOR, 'div.update-components-text.relative.update-components-update-v2__commentary span.break-words span[dir="ltr"]')
-                    content = content_elem.text.strip()
-                except Exception:
-                    content = "[Could not extract post text]"
+                if snapshot is not None:
+                    content = snapshot["text"] if snapshot["text"] is not None else "[Could not extract post text]"
+                else:
+                    try:
+                        content_elem = post.find_element(By.CSS_SELECTOR, POST_TEXT_SELECTOR)
+                        content = content_elem.text.strip()
+                    except Exception:
+                        content = "[Could not extract post text]"
+                candidates.append((idx, post, post_id, content, snapshot))
+            except Exception as e:
+                print(f"Error processing post {idx+1}: {e}")
+        watch.lap("post.collect")
+
+        # Submit comment generation for every post that may be commented on, several posts per request;
+        # comment_futures maps the post index to (future, position in the batch result or None)
+        comment_futures = {}
+        if self._pipeline_workers() > 0:
+            executor = self._get_comment_executor()
+            to_comment = [(idx, content) for idx, post, post_id, content, snapshot in candidates
+                          if not require_long_content or (content and len(content) >= 100)]
+            # Only pay for comments that can still be posted
+            remaining = self.budget.remaining("comment") if self.budget is not None else None
+            if remaining is not None:
+                to_comment = to_comment[:remaining]
+            batch_size = self._comment_batch_size()
+            for start in range(0, len(to_comment), batch_size):
+                chunk = to_comment[start:start + batch_size]
+                if len(chunk) == 1:
+                    comment_futures[chunk[0][0]] = (executor.submit(self._generate_comment, chunk[0][1], comment_source), None)
+                    continue
+                future = executor.submit(self._generate_comments, [content for _, content in chunk], comment_source)
+                for position, (idx, _) in enumerate(chunk):
+                    comment_futures[idx] = (future, position)
 
+        count = 0
+        for idx, post, post_id, content, snapshot in candidates:
+            # Per-stage latencies of this post ([METRICS]); human-like pauses between stages are left out
+            watch.restart()
+            # Set when a like or comment was only postponed (budget, no usable comment): the post is not marked
+            # as seen, so a later run retries it
+            deferred = False
+            try:
                 # Scroll post into view
                 try:
                     self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", post)
-                    time.sleep(2)
+                    self.pacer.pause("scroll")
                 except Exception:
                     pass
+                watch.lap("post.scroll")
 
                 # Like the post
                 liked = False
-                try:
-                    like_buttons = post.find_elements(By.CSS_SELECTOR, 'button.react-button__trigger[aria-label*="Like"]')
-                    like_button = None
-                    for btn in like_buttons:
-                        if 'follow' not in btn.get_attribute('class').lower() and 'Follow' not in btn.get_attribute('aria-label'):
-                            like_button = btn
-                            break
-                    if like_button:
-                        self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", like_button)
-                        time.sleep(2)
-                        aria_pressed = like_button.get_attribute('aria-pressed')
-                        if aria_pressed is None or aria_pressed == 'false':
-                            like_button.click()
-                            print(f"Post {idx+1}: Liked!")
-                            liked = True
+                if snapshot is not None and snapshot["liked"]:
+                    print(f"Post {idx+1}: Already liked.")
+                    liked = True
+                else:
+                    try:
+                        like_buttons = post.find_elements(By.CSS_SELECTOR, 'button.react-button__trigger[aria-label*="Like"]')
+                        like_button = None
+                        for btn in like_buttons:
+                            if 'follow' not in btn.get_attribute('class').lower() and 'Follow' not in btn.get_attribute('aria-label'):
+                                like_button = btn
+                                break
+                        if like_button:
+                            self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", like_button)
+                            self.pacer.pause("scroll")
+                            aria_pressed = like_button.get_attribute('aria-pressed')
+                            if aria_pressed is not None and aria_pressed != 'false':
+                                print(f"Post {idx+1}: Already liked.")
+                                liked = True
+                            elif not self._spend("like"):
+                                print(f"Post {idx+1}: Like budget reached, skipping.")
+                                deferred = True
+                            else:
+                                like_button.click()
+                                print(f"Post {idx+1}: Liked!")
+                                liked = True
                         else:
-                            print(f"Post {idx+1}: Already liked.")
-                            liked = True
-                    else:
-                        print(f"Post {idx+1}: Like button not found.")
-                except Exception:
-                    print(f"Post {idx+1}: Could not click like button.")
-                time.sleep(2)
+                            print(f"Post {idx+1}: Like button not found.")
+                    except Exception:
+                        print(f"Post {idx+1}: Could not click like button.")
+                    watch.lap("post.like")
+                self.pacer.pause("action")
+                watch.restart()
 
                 # Comment if liked
                 do_comment = liked
                 if require_long_content:
                     do_comment = liked and content and len(content) >= 100
+                # Generate a comment using the selected source (or pick up the pipelined one) before opening the box
+                generated_comment = None
+                if do_comment and self.budget is not None and not self.budget.available("comment"):
+                    print(f"Post {idx+1}: Comment budget reached, skipping.")
+                    do_comment = False
+                    deferred = True
+                if do_comment:
+                    try:
+                        if idx in comment_futures:
+                            future, position = comment_futures.pop(idx)
+                            generated_comment = future.result() if position is None else future.result()[position]
+                        else:
+                            generated_comment = self._generate_comment(content, comment_source)
+                    except Exception as e:
+                        print(f"Post {idx+1}: Error generating comment: {e}")
+                    # Time the browser waited for the comment (near zero when the pipeline finished it early)
+                    watch.lap("post.comment_wait")
+                    if not is_usable_comment(generated_comment):
+                        print(f"Post {idx+1}: No usable comment was generated, skipping comment.")
+                        do_comment = False
+                        deferred = True
+                if do_comment and not self._spend("comment"):
+                    print(f"Post {idx+1}: Comment budget reached, skipping.")
+                    do_comment = False
+                    deferred = True
                 if do_comment:
                     try:
-                        comment_buttons = post.find_elements(By.CSS_SELECTOR, 'button[id^="feed-shared-social-action-bar-comment-"]')
+                        if snapshot is not None and snapshot["comment_button_id"]:
+                            comment_buttons = self.driver.find_elements(By.ID, snapshot["comment_button_id"])
+                        else:
+                            comment_buttons = post.find_elements(By.CSS_SELECTOR, 'button[id^="feed-shared-social-action-bar-comment-"]')
                         if comment_buttons:
                             comment_button = comment_buttons[0]
                             self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", comment_button)
-                            time.sleep(2)
+                            self.pacer.pause("scroll")
                             comment_button.click()
-                            time.sleep(2)
-                            comment_input = post.find_element(By.CSS_SELECTOR, 'div.editor-content.ql-container div.ql-editor[contenteditable="true"]')
+                            self.pacer.pause("action")
+                            comment_input = self.pacer.wait_visible(post, (By.CSS_SELECTOR, COMMENT_INPUT_SELECTOR))
+                            if comment_input is None:
+                                comment_input = post.find_element(By.CSS_SELECTOR, COMMENT_INPUT_SELECTOR)
                             self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", comment_input)
-                            time.sleep(2)
+                            self.pacer.pause("scroll")
                             comment_input.click()
-                            # Generate a comment using the selected manager and insert it
+                            watch.lap("post.comment_open")
+                            # Insert the generated comment
                             try:
-                                comment_source = "gpt"
-                                if self._config is not None and self._config.has_section("LINKEDIN"):
-                                    comment_source = self._config["LINKEDIN"].get("comment_source", "gpt")
-                                if comment_source == "google" and self.google_manager is not None:
-                                    generated_comment = self.google_manager.generate_comment_for_description(content)
-                                else:
-                                    generated_comment = self.gpt_manager.generate_comment_for_description(content)
-                                time.sleep(2)
+                                self.pacer.pause("typing")
                                 print(f"Generated Comment: {generated_comment}")
                                 comment_input.send_keys(generated_comment)
-                                time.sleep(2)
+                                self.pacer.pause("typing")
+                                watch.lap("post.typing")
                                 # Find and click the submit/post button
                                 submit_btn = None
                                 try:
@@ -688,23 +1396,31 @@ class LinkedInManager:
                                         pass
                                 if submit_btn:
                                     self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", submit_btn)
-                                    time.sleep(2)
+                                    self.pacer.pause("scroll")
                                     submit_btn.click()
+                                    watch.lap("post.submit")
                                     print(f"Post {idx+1}: Comment posted!")
                                 else:
                                     print(f"Post {idx+1}: Could not find post/submit button.")
                             except Exception as e:
-                                print(f"Post {idx+1}: Error generating or inserting comment: {e}")
+                                print(f"Post {idx+1}: Error inserting comment: {e}")
                         else:
                             print(f"Post {idx+1}: Comment button not found.")
                     except Exception as e:
                         print(f"Post {idx+1}: Could not open comment box or insert comment. Error: {e}")
-                    time.sleep(2)
+                    self.pacer.pause("between_items")
+                if deferred:
+                    if deferred_posts is not None and post_id is not None:
+                        deferred_posts.add(post_id)
+                    continue
                 if processed_posts is not None and post_id is not None:
                     processed_posts.add(post_id)
                 count += 1
             except Exception as e:
                 print(f"Error processing post {idx+1}: {e}")
+        # Drop comments generated for posts that were not commented on
+        for future, _ in comment_futures.values():
+            future.cancel()
         return count
 
     def monitor_feed(self, refresh_interval: int = 60):
@@ -713,77 +1429,154 @@ class LinkedInManager:
         - For each new post: like, comment, and wait 5 seconds between actions to humanize.
         - After processing, wait for the refresh interval, then refresh and process only new posts.
         """
+        try:
+            self._run_job("feed monitoring", self.feed_monitoring_steps(refresh_interval))
+        except KeyboardInterrupt:
+            print("\nMonitoring stopped by user.")
+
+    def feed_monitoring_steps(self, refresh_interval: int = 60, max_posts: int = None, comment_source: str = None):
+        """
+        Step generator behind monitor_feed for the JobScheduler: one step per feed refresh, each needing
+        the 'like' budget, with the refresh interval as the wait between steps.
+        max_posts and comment_source apply to this job only (default: [LINKEDIN] max_posts and comment_source).
+        """
         print("Starting LinkedIn Manager for Feed Monitoring and Interaction ...")
-        self.driver.get("https://www.linkedin.com/feed/")
-        processed_posts = set()  # Track post unique ids to avoid duplicate actions
-        first_run = True
-        while True:
+        max_posts = max_posts or self._max_posts()
+        yield ("like", 0)
+        # Track post unique ids to avoid duplicate actions, persisted across restarts
+        processed_posts = SeenPostStore.from_config(self._config)
+        # Posts postponed in this run (budget reached, no usable comment) are not picked again until the next run
+        deferred_posts = set()
+
+        def is_handled(post_id):
+            return post_id in processed_posts or post_id in deferred_posts
+        # In watch mode the feed is only reloaded every feed_reload_minutes; in between, each cycle drains the
+        # posts the injected MutationObserver queued, so the work per cycle scales with the new posts only
+        feed_watch = self._feed_watch_enabled()
+        reload_seconds = self._feed_reload_seconds()
+        loaded_at = None
+        while not self.stop_event.is_set():
             try:
-                print("\nRefreshing feed...")
-                if not first_run:
-                    self.driver.refresh()
-                else:
-                    first_run = False
-                scroll_height = self.driver.execute_script("return document.body.scrollHeight")
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(15)  # Wait for feed to load
-                posts = self.driver.find_elements(By.CSS_SELECTOR, 'div.feed-shared-update-v2, div.feed-shared-update')
-                print(f"Found {len(posts)} posts on the feed.")
-                new_posts_processed = self._like_and_comment_on_posts(posts, processed_posts, max_posts=10, require_long_content=True)
+                watch = Stopwatch()
+                posts = None
+                if feed_watch and loaded_at is not None and time.monotonic() - loaded_at < reload_seconds:
+                    self._load_more_posts()
+                    posts = self._drain_feed_watch(max_posts, is_handled)
+                    if posts is None:
+                        # Another job navigated away, or the page was reloaded
+                        print("\nFeed watch lost, reloading the feed...")
+                    else:
+                        print(f"\nFound {len(posts)} new posts since the last check.")
+                if posts is None:
+                    if not self._spend("page_view"):
+                        print("Page view budget reached, waiting before reloading the feed.")
+                        yield ("page_view", 0)
+                        continue
+                    print("\nRefreshing feed...")
+                    self.driver.get("https://www.linkedin.com/feed/")
+                    loaded_at = time.monotonic()
+                    scroll_height = self.driver.execute_script("return document.body.scrollHeight")
+                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    # Wait for the feed to load instead of a fixed 15 seconds
+                    self.pacer.wait_dom_ready(self.driver)
+                    self.pacer.wait_present(self.driver, (By.CSS_SELECTOR, POST_SELECTOR), timeout=15)
+                    self.pacer.wait_network_idle(self.driver)
+                    watch.lap("feed.load")
+                    self.pacer.pause("read")
+                    if feed_watch and self._install_feed_watch():
+                        # Posts beyond max_posts stay queued for the next cycle
+                        posts = self._drain_feed_watch(max_posts, is_handled)
+                    if posts is None:
+                        posts = self._snapshot_posts()
+                    print(f"Found {len(posts)} posts on the feed.")
+                new_posts_processed = self._like_and_comment_on_posts(posts, processed_posts, max_posts=max_posts, require_long_content=True,
+                                                                     comment_source=comment_source, deferred_posts=deferred_posts)
                 print(f"Processed {new_posts_processed} new posts, waiting for next refresh...")
                 print(f"Waiting {refresh_interval} seconds before next refresh...")
-                time.sleep(refresh_interval)
-            except KeyboardInterrupt:
-                print("\nMonitoring stopped by user.")
-                break
             except Exception as e:
                 print(f"Error during monitoring: {e}")
-                time.sleep(refresh_interval)
+            # Other queued jobs run while this one waits for its next refresh
+            yield ("like", refresh_interval)
+        if self.stop_event.is_set():
+            print("\nMonitoring stopped.")
+
+    def warmup_profile(self, profile_url: str, label: str = "", max_posts: int = None, comment_source: str = None) -> int:
+        """
+        Visit one profile's activity page and like/comment on its latest posts.
+        Args:
+            profile_url: LinkedIn profile URL.
+            label: Progress prefix (e.g. "[3/40]").
+            max_posts: Posts to handle (default: [LINKEDIN] max_posts).
+            comment_source: Comment source for this job (default: [LINKEDIN] comment_source).
+        Returns:
+            Number of posts processed, or None if the page view budget did not allow visiting the profile.
+        """
+        if '?' in profile_url:
+            profile_url = profile_url.split('?', 1)[0]
+        profile_url = profile_url.rstrip('/')
+        activity_url = profile_url + '/recent-activity/all/'
+        print(f"Visiting activity page: {activity_url}")
+        print(f"{label} Visiting: {profile_url}")
+        if not self._spend("page_view"):
+            print(f"{label} Page view budget reached, skipping.")
+            return None
+        watch = Stopwatch()
+        self.driver.get(activity_url)
+        self.pacer.wait_dom_ready(self.driver)
+        self.pacer.wait_present(self.driver, (By.CSS_SELECTOR, POST_SELECTOR))
+        watch.lap("warmup.load")
+        self.pacer.pause("read")
+        # Scroll to load posts
+        for _ in range(3):
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            self.pacer.wait_network_idle(self.driver, timeout=5)
+            self.pacer.pause("scroll")
+
+        posts = self._snapshot_posts()
+        print(f"Found {len(posts)} posts on activity page.")
+        count = self._like_and_comment_on_posts(posts, processed_posts=None, max_posts=max_posts or self._max_posts(),
+                                                require_long_content=False, comment_source=comment_source)
+        print(f"Warmed up {count} posts on {profile_url}")
+        return count
 
     def warmup_profile_activity(self, input_excel: str):
         """
         Visit a LinkedIn profile's activity page, like and comment on the latest 10 posts.
         Comments are generated using Gemini (Google) AI, with the same prompt as the feed monitoring function.
+        Rows are streamed from the file (.xlsx, .csv or .jsonl), so large lists are not loaded into memory.
+        """
+        self._run_job("profile warmup", self.warmup_steps(input_excel))
+
+    def warmup_steps(self, input_excel: str, max_posts: int = None, comment_source: str = None):
+        """
+        Step generator behind warmup_profile_activity for the JobScheduler: one step per profile,
+        each needing the 'like' budget. max_posts and comment_source apply to this job only.
         """
-        import time
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
         if self.driver is None:
             self.start_chrome()
 
         try:
-            df = pd.read_excel(input_excel)
+            if 'Profile Link' not in read_header(input_excel):
+                print("Excel file must contain a 'Profile Link' column.")
+                return
+            total = count_rows(input_excel)
         except Exception as e:
             print(f"Failed to read Excel file: {e}")
             return
 
-        if 'Profile Link' not in df.columns:
-            print("Excel file must contain a 'Profile Link' column.")
-            return
-
-        for idx, row in df.iterrows():
-            profile_url = row.get('Profile Link', '').strip()
-            name = row.get('Name', '').strip() if 'Name' in row else ''
-            if '?' in profile_url:
-                profile_url = profile_url.split('?', 1)[0]
-            profile_url = profile_url.rstrip('/')
-            activity_url = profile_url + '/recent-activity/all/'
-            print(f"Visiting activity page: {activity_url}")
-            self.driver.get(activity_url)
-            time.sleep(3)
-            print(f"[{idx+1}/{len(df)}] Visiting: {profile_url}")
-            self.driver.get(activity_url)
-            time.sleep(5)
-            # Scroll to load posts
-            for _ in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-
-            posts = self.driver.find_elements(By.CSS_SELECTOR, 'div.feed-shared-update-v2, div.feed-shared-update')
-            print(f"Found {len(posts)} posts on activity page.")
-            count = self._like_and_comment_on_posts(posts, processed_posts=None, max_posts=10, require_long_content=False)
-            print(f"Warmed up {count} posts on {profile_url}")
+        for idx, row in enumerate(iter_rows(input_excel)):
+            if self.stop_event.is_set():
+                print("Stopped.")
+                return
+            profile_url = str(row.get('Profile Link', '')).strip()
+            if not profile_url:
+                print(f"Row {idx+1}: No profile link, skipping.")
+                continue
+            yield ("like", 0)
+            while self.warmup_profile(profile_url, label=f"[{idx+1}/{total}]", max_posts=max_posts,
+                                      comment_source=comment_source) is None:
+                # Wait for the page view budget and retry the profile instead of skipping it
+                yield ("page_view", 0)
 
     def warmup_profile_menu(self):
         """
@@ -808,16 +1601,16 @@ class LinkedInManager:
         """
         while True:
             options = [
-                "Choose Comment Generation Source (GPT or Gemini)",
+                "Choose Comment Generation Source (GPT, Gemini or Local)",
                 "View Current Source",
                 "Back to LinkedIn Menu"
             ]
             print("\n--- LinkedIn Settings ---")
             choice = select(options)
             if choice == 0:
-                sources = ["gpt", "google"]
+                sources = ["gpt", "google", "local"]
                 print("Choose comment generation source:")
-                src_choice = select(["OpenAI GPT", "Google Gemini"])
+                src_choice = select(["OpenAI GPT", "Google Gemini", "Local model (CPU)"])
                 if not self._config.has_section("LINKEDIN"):
                     self._config.add_section("LINKEDIN")
                 self._config["LINKEDIN"]["comment_source"] = sources[src_choice]
@@ -830,8 +1623,7 @@ class LinkedInManager:
                         config_filename = global_config_filename
                     except Exception:
                         config_filename = "config"
-                with open(config_filename, "w", encoding="utf-8") as file:
-                    self._config.write(file)
+                write_config(self._config, config_filename)
                 print(f"Comment generation source set to: {sources[src_choice]}")
             elif choice == 1:
                 src = self._config["LINKEDIN"].get("comment_source", "gpt")
@@ -841,72 +1633,175 @@ class LinkedInManager:
                 break
 
     def kill_browser(self):
+        self.pacer.print_report()
+        if self.budget is not None:
+            self.budget.print_report()
+        for stats in (getattr(getattr(self.gpt_manager, "client", None), "stats", None),
+                      getattr(self.google_manager, "api_stats", None), getattr(self.local_manager, "api_stats", None)):
+            if stats is not None and stats.used():
+                print(stats.summary())
+        comment_cache = getattr(self.gpt_manager, "comment_cache", None)
+        if comment_cache is not None:
+            stats = comment_cache.stats()
+            print(f"Comment cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} stored.")
+        if self._comment_executor is not None:
+            self._comment_executor.shutdown(wait=False, cancel_futures=True)
+            self._comment_executor = None
+        if self._router is not None:
+            self._router.print_report()
+            self._router.shutdown()
+            self._router = None
+        REGISTRY.finish_run(run_id=RUN_ID)
+        if self.driver is None:
+            return
         self.driver.quit()
         self.sb_init.__exit__(None, None, None)
+        self.driver = None
+        self.sb_init = None
 
 
 # --- GoogleManager class for Gemini integration and settings ---
 class GoogleManager:
-    def __init__(self, config, config_filename, logger):
+    def __init__(self, config, config_filename, logger, comment_cache: CommentCache = None):
         """
         Initialize the GoogleManager with config, config filename, and logger.
+        No network calls happen here: the model catalog is cached in the config for [GOOGLE] models_ttl_hours
+        (default 24) and refreshed in the background when stale, and the model is built on the first comment.
         Args:
             config: RawConfigParser object for configuration.
             config_filename: Path to the config file.
             logger: Logger object for logging errors/info.
+            comment_cache: Optional CommentCache consulted before calling Gemini.
         """
         self._config = config
         self._CONFIG_FILENAME = config_filename
         self.LOGGER = logger
+        self.comment_cache = comment_cache
+        self.model = None
+        self._model_lock = threading.Lock()
+        # Timeouts and retries ([API] section) for generate_content calls on the persistent model
+        self.retry_policy = RetryPolicy.from_config(config)
+        self.api_stats = ApiStats("Gemini API")
+        self.comment_limit = CommentLimit.from_config(config)
         self._ensure_config_keys()
-        self._configure_gemini()
+        if self._config["GOOGLE"].get("api", "") and not self._catalog_is_fresh():
+            threading.Thread(target=self._refresh_model_catalog, name="gemini-models", daemon=True).start()
+
+    def _set_config_value(self, key: str, value: str) -> bool:
+        """
+        Set a [GOOGLE] config value.
+        Returns:
+            True if the stored value actually changed.
+        """
+        if self._config["GOOGLE"].get(key) == value:
+            return False
+        self._config["GOOGLE"][key] = value
+        return True
 
     def _ensure_config_keys(self):
+        changed = False
         if not self._config.has_section("GOOGLE"):
             self._config.add_section("GOOGLE")
-        if not self._config["GOOGLE"].get("api"):
-            self._config["GOOGLE"]["api"] = ""
+            changed = True
+        if self._config["GOOGLE"].get("api") is None:
+            changed |= self._set_config_value("api", "")
         if not self._config["GOOGLE"].get("static prompt"):
-            self._config["GOOGLE"]["static prompt"] = "Write a short, positive comment for this LinkedIn post:"
-        self.save_config()
+            changed |= self._set_config_value("static prompt", "Write a short, positive comment for this LinkedIn post:")
+        # Only touch the config file when something was actually missing
+        if changed:
+            self.save_config()
 
-    def _configure_gemini(self):
-        api_key = self._config["GOOGLE"].get("api", "")
-        if api_key:
-            genai.configure(api_key=api_key)
+    def _catalog_is_fresh(self) -> bool:
+        """
+        True if the cached model catalog in the config is younger than [GOOGLE] models_ttl_hours.
+        """
+        section = self._config["GOOGLE"]
+        if not section.get("available_models"):
+            return False
+        try:
+            ttl_hours = float(section.get("models_ttl_hours", "24"))
+            refreshed = float(section.get("models_refreshed", "0"))
+        except ValueError:
+            return False
+        return time.time() - refreshed < ttl_hours * 3600
+
+    def _refresh_model_catalog(self, force: bool = False) -> list:
+        """
+        Fetch the non-deprecated models supporting generateContent (latest 5) and cache them in the config.
+        Args:
+            force: Refresh even if the cached catalog is still fresh.
+        Returns:
+            List of (model name, display name) tuples, or the cached list if the refresh failed.
+        """
+        section = self._config["GOOGLE"]
+        api_key = section.get("api", "")
+        if api_key and (force or not self._catalog_is_fresh()):
             try:
+                import google.generativeai as genai
+                genai.configure(api_key=api_key)
                 models = genai.list_models()
-                #print("\nAvailable Gemini models (not deprecated, showing up to 5):")
-                available_models = []
-                display_names = []
                 # Filter and sort models: prefer 'gemini-1.5' and 'flash' in name, then by name descending
                 filtered = [m for m in models if not (hasattr(m, 'description') and m.description and 'deprecated' in m.description.lower())]
                 # Only include models that support 'generateContent'
                 filtered = [m for m in filtered if hasattr(m, 'supported_generation_methods') and 'generateContent' in m.supported_generation_methods]
-                # Sort: prefer 'gemini-1.5' and 'flash', then by name descending
                 filtered.sort(key=lambda m: (not (('gemini-1.5' in m.name) or ('flash' in m.name)), m.name), reverse=True)
                 filtered = filtered[:5]
-                for m in filtered:
-                    available_models.append(m.name)
-                    display_names.append(getattr(m, 'display_name', m.name))
-                    #print(f"- {m.name} ({getattr(m, 'display_name', '')})")
-                self._config["GOOGLE"]["available_models"] = ",".join(available_models)
-                self._config["GOOGLE"]["available_model_names"] = ",".join(display_names)
-                selected_model = self._config["GOOGLE"].get("selected_model", "")
-                if selected_model and selected_model in available_models:
-                    self.model = genai.GenerativeModel(selected_model.split("/")[-1])
-                elif available_models:
-                    self.model = genai.GenerativeModel(available_models[0].split("/")[-1])
-                    self._config["GOOGLE"]["selected_model"] = available_models[0]
-                else:
-                    print("No non-deprecated Gemini models found that support generateContent.")
-                    self.model = None
-                self.save_config()
+                catalog = {
+                    "available_models": ",".join(m.name for m in filtered),
+                    "available_model_names": ",".join(getattr(m, 'display_name', m.name) for m in filtered),
+                    "models_refreshed": str(int(time.time())),
+                }
+                # This may run on the background "gemini-models" thread while the main thread edits and saves
+                # the same config, so the catalog is applied and saved in one step under the config lock
+                with CONFIG_LOCK:
+                    changed = False
+                    for key, value in catalog.items():
+                        changed |= self._set_config_value(key, value)
+                    if changed:
+                        self.save_config()
             except Exception as e:
+                self.LOGGER.exception("Error listing Gemini models")
                 print(f"Error listing Gemini models: {e}")
-                self.model = None
-        else:
-            self.model = None
+        names = [name for name in section.get("available_models", "").split(",") if name]
+        display_names = [name for name in section.get("available_model_names", "").split(",") if name]
+        display_names += names[len(display_names):]
+        return list(zip(names, display_names))
+
+    def _get_model(self):
+        """
+        Build the Gemini model on first use from the selected (or first cached) model.
+        Returns:
+            The GenerativeModel, or None if no API key or model is available.
+        """
+        with self._model_lock:
+            if self.model is not None:
+                return self.model
+            api_key = self._config["GOOGLE"].get("api", "")
+            if not api_key:
+                return None
+            available_models = [name for name, _ in self._refresh_model_catalog()]
+            selected_model = self._config["GOOGLE"].get("selected_model", "")
+            if not selected_model or (available_models and selected_model not in available_models):
+                if not available_models:
+                    print("No non-deprecated Gemini models found that support generateContent.")
+                    return None
+                selected_model = available_models[0]
+                with CONFIG_LOCK:
+                    if self._set_config_value("selected_model", selected_model):
+                        self.save_config()
+            import google.generativeai as genai
+            genai.configure(api_key=api_key)
+            self.model = genai.GenerativeModel(selected_model.split("/")[-1])
+            return self.model
+
+    def _configure_gemini(self):
+        """
+        Refresh the model catalog now and rebuild the model (after the API key or model changed).
+        """
+        self.model = None
+        if self._config["GOOGLE"].get("api", ""):
+            self._refresh_model_catalog(force=True)
+            self._get_model()
 
     def change_gemini_model(self):
         """
@@ -916,26 +1811,19 @@ class GoogleManager:
         if not api_key:
             print("Set your Gemini API key first.")
             return
-        genai.configure(api_key=api_key)
         try:
-            models = genai.list_models()
-            filtered = [m for m in models if not (hasattr(m, 'description') and m.description and 'deprecated' in m.description.lower())]
-            filtered = [m for m in filtered if hasattr(m, 'supported_generation_methods') and 'generateContent' in m.supported_generation_methods]
-            filtered.sort(key=lambda m: (not (('gemini-1.5' in m.name) or ('flash' in m.name)), m.name), reverse=True)
-            filtered = filtered[:5]
-            available_models = [m.name for m in filtered]
-            display_names = [getattr(m, 'display_name', m.name) for m in filtered]
-            if not available_models:
+            catalog = self._refresh_model_catalog(force=True)
+            if not catalog:
                 print("No non-deprecated Gemini models found that support generateContent.")
                 return
             print("Choose Gemini model:")
-            for i, (name, disp) in enumerate(zip(available_models, display_names)):
+            for i, (name, disp) in enumerate(catalog):
                 print(f"{i+1}. {name} ({disp})")
-            idx = select([f"{name} ({disp})" for name, disp in zip(available_models, display_names)])
-            self._config["GOOGLE"]["selected_model"] = available_models[idx]
+            idx = select([f"{name} ({disp})" for name, disp in catalog])
+            self._config["GOOGLE"]["selected_model"] = catalog[idx][0]
             self.save_config()
-            print(f"Selected Gemini model: {available_models[idx]}")
-            self._configure_gemini()
+            print(f"Selected Gemini model: {catalog[idx][0]}")
+            self.model = None
         except Exception as e:
             print(f"Error listing Gemini models: {e}")
 
@@ -948,18 +1836,120 @@ class GoogleManager:
             The generated comment as a string, or an error message if failed.
         """
         try:
-            if not self.model:
-                self._configure_gemini()
-            if not self.model:
-                return "Error: Gemini API key not set."
             prompt = self._config["GOOGLE"].get("static prompt", "")
-            full_prompt = f"{prompt}\n{description}" if prompt else description
-            response = self.model.generate_content(full_prompt)
-            return response.text
+            model_name = self._config["GOOGLE"].get("selected_model", "")
+            if self.comment_cache is not None:
+                cached = self.comment_cache.get(description, prompt, model_name)
+                if cached is not None:
+                    return cached
+            model = self._get_model()
+            if not model:
+                return "Error: Gemini API key not set."
+            # Gemma models take no system instruction, so the fixed prefix stays at the start of the
+            # contents, where Gemini's implicit caching can reuse it
+            full_prompt = get_template(prompt, "GOOGLE").full_text(description) if prompt else description
+            with span("llm.comment", provider="google"):
+                if self.comment_limit.stream:
+                    comment = self._stream_comment(model, full_prompt)
+                else:
+                    comment = self.comment_limit.trim(self._generate_content(model, full_prompt, generation_config=self._comment_config()))
+            if self.comment_cache is not None and comment:
+                self.comment_cache.put(description, prompt, model_name, comment)
+            return comment
         except Exception as e:
             self.LOGGER.exception("Exception while generating Gemini comment!")
             return f"Error: {str(e)}"
 
+    def _generate_content(self, model, prompt: str, **options) -> str:
+        """
+        Run one generate_content request with the configured timeout and retries.
+        Returns:
+            The reply text.
+        """
+        response = call_with_retries(
+            lambda: model.generate_content(prompt, request_options={"timeout": self.retry_policy.timeout}, **options),
+            self.retry_policy, self.api_stats, label="Gemini request")
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            self.api_stats.record_usage(usage.prompt_token_count, getattr(usage, "cached_content_token_count", 0))
+        return response.text
+
+    def _comment_config(self):
+        """Generation config capping output tokens at the comment limit."""
+        return {"max_output_tokens": self.comment_limit.max_tokens} if self.comment_limit.max_tokens else None
+
+    def _stream_comment(self, model, prompt: str) -> str:
+        """
+        Stream one comment and stop reading once the comment limit is reached.
+        Returns:
+            The comment text, trimmed to the limit.
+        """
+        started = time.monotonic()
+        response = call_with_retries(
+            lambda: model.generate_content(prompt, stream=True, generation_config=self._comment_config(),
+                                           request_options={"timeout": self.retry_policy.timeout}),
+            self.retry_policy, self.api_stats, label="Gemini request")
+
+        usage = []
+
+        def pieces():
+            for chunk in response:
+                if getattr(chunk, "usage_metadata", None) is not None:
+                    usage[:] = [chunk.usage_metadata]
+                try:
+                    yield chunk.text
+                except ValueError:
+                    # Chunks without text parts (e.g. only a finish reason)
+                    continue
+        try:
+            comment = self.comment_limit.collect(pieces(), started, self.api_stats)
+        finally:
+            # Cancelling the underlying call (gRPC or REST) stops the server from generating tokens
+            # that would be thrown away once the limit cut the comment off
+            stream = getattr(response, "_iterator", None)
+            if stream is not None and hasattr(stream, "cancel"):
+                try:
+                    stream.cancel()
+                except Exception:
+                    LOGGER.debug("Could not cancel the Gemini stream", exc_info=True)
+        if usage:
+            self.api_stats.record_usage(usage[0].prompt_token_count, getattr(usage[0], "cached_content_token_count", 0))
+        return comment
+
+    @timed("llm.batch", provider="google")
+    def _request_batch(self, prompt: str, count: int) -> str:
+        """
+        Send one batch prompt for `count` posts to Gemini, asking for a JSON reply.
+        Returns:
+            The raw reply text.
+        """
+        model = self._get_model()
+        if not model:
+            raise RuntimeError("Gemini API key not set.")
+        generation_config = {}
+        max_tokens = self.comment_limit.batch_max_tokens(count)
+        if max_tokens:
+            generation_config["max_output_tokens"] = max_tokens
+        # Gemma models do not support JSON mode; the prompt still asks for JSON
+        if "gemma" not in self._config["GOOGLE"].get("selected_model", ""):
+            generation_config["response_mime_type"] = "application/json"
+        return self._generate_content(model, prompt, generation_config=generation_config or None)
+
+    def generate_comments_for_descriptions(self, descriptions: list, batch_size: int = 5) -> list:
+        """
+        Generate comments for several posts, sending up to batch_size posts (and the static prompt once) per request.
+        Posts the batch reply does not cover are generated with single requests.
+        Args:
+            descriptions: Post texts.
+            batch_size: Maximum posts per request.
+        Returns:
+            List of comments, in the order of descriptions.
+        """
+        return generate_batched(descriptions, self._request_batch, self.generate_comment_for_description,
+                                comment_cache=self.comment_cache, prompt=self._config["GOOGLE"].get("static prompt", ""),
+                                model=self._config["GOOGLE"].get("selected_model", ""), batch_size=batch_size,
+                                comment_limit=self.comment_limit)
+
     def change_static_prompt(self):
         """
         Change the static prompt used for Gemini by selecting a .txt file from the Prompts directory.
@@ -988,8 +1978,7 @@ class GoogleManager:
         self._configure_gemini()
 
     def save_config(self):
-        with open(self._CONFIG_FILENAME, "w", encoding="utf-8") as file:
-            self._config.write(file)
+        write_config(self._config, self._CONFIG_FILENAME)
 
     def view_config(self):
         for key, val in self._config["GOOGLE"].items():
@@ -1032,24 +2021,33 @@ def main():
     parser.add_argument("--profile-warmup", type=str, help="Excel file for profile warmup")
     parser.add_argument("--connection-hunting", type=str, help="LinkedIn search URL for connection hunting")
     parser.add_argument("--output", type=str, help="Output Excel filename for connection hunting")
+    parser.add_argument("--start-page", type=int, help="Connection hunting start page (default: resume after the last completed page)")
     parser.add_argument("--headless", action="store_true", help="Run browser in headless mode")
     parser.add_argument("--headon", action="store_true", help="Run browser in headed (UI) mode")
-    parser.add_argument("--comment-source", type=str, choices=["gpt", "google"], help="Comment generation source: gpt or google")
+    parser.add_argument("--comment-source", type=str, choices=["gpt", "google", "local"], help="Comment generation source: gpt, google or local")
 
     parser.add_argument("--max-posts", type=int, help="Max posts to like/comment per profile/feed")
     parser.add_argument("--refresh-interval", type=int, help="Feed refresh interval in seconds")
+    parser.add_argument("--workers", type=int, help="Parallel browser workers for --send-connections / --profile-warmup")
+    parser.add_argument("--pacing", type=str, choices=["fast", "normal", "careful"], help="Human-like delay profile")
+    parser.add_argument("--pipeline-workers", type=int, help="Background comment generation workers (0 disables pipelining)")
+    parser.add_argument("--daemon", action="store_true", help="Keep a signed-in browser warm and run jobs sent by the dashboard")
     args = parser.parse_args()
+    if args.start_page is not None and args.start_page < 1:
+        parser.error("--start-page must be 1 or higher")
 
     # Load config and managers
     # Ensure all class definitions are above this point!
     if not os.path.exists(_CONFIG_FILENAME):
         gpt_manager = GPTManager(_config, _CONFIG_FILENAME, LOGGER)
         gpt_manager.generate_config()
-        google_manager = GoogleManager(_config, _CONFIG_FILENAME, LOGGER)
     else:
         _config.read(_CONFIG_FILENAME, encoding="utf-8")
         gpt_manager = GPTManager(_config, _CONFIG_FILENAME, LOGGER)
-        google_manager = GoogleManager(_config, _CONFIG_FILENAME, LOGGER)
+    comment_cache = CommentCache.from_config(_config)
+    gpt_manager.comment_cache = comment_cache
+    google_manager = GoogleManager(_config, _CONFIG_FILENAME, LOGGER, comment_cache=comment_cache)
+    local_manager = LocalManager(_config, _CONFIG_FILENAME, LOGGER, comment_cache=comment_cache)
 
     # Determine browser mode
     if args.headless:
@@ -1064,20 +2062,67 @@ def main():
         if not _config.has_section("LINKEDIN"):
             _config.add_section("LINKEDIN")
         _config["LINKEDIN"]["comment_source"] = args.comment_source
-        with open(_CONFIG_FILENAME, "w", encoding="utf-8") as file:
-            _config.write(file)
-
-    # Set max posts if provided
-    max_posts = args.max_posts if args.max_posts else 10
+        write_config(_config, _CONFIG_FILENAME)
+
+    # Pacing mode, pipeline workers and max posts apply to this run only (not saved);
+    # parallel workers read the config file themselves, so they get the same overrides passed explicitly
+    config_overrides = {}
+    if args.pacing:
+        config_overrides.setdefault("PACING", {})["mode"] = args.pacing
+    if args.pipeline_workers is not None:
+        config_overrides.setdefault("LINKEDIN", {})["pipeline_workers"] = str(max(0, args.pipeline_workers))
+    if args.max_posts:
+        config_overrides.setdefault("LINKEDIN", {})["max_posts"] = str(max(1, args.max_posts))
+    apply_config_overrides(_config, config_overrides)
+
+    # Number of parallel browser workers for row-based modes
+    workers = args.workers if args.workers else 1
 
     # Create LinkedInManager with selected mode
-    linkedin_manager = LinkedInManager(gpt_manager, google_manager=google_manager, config=_config, mode=linkedin_mode)
+    linkedin_manager = LinkedInManager(gpt_manager, google_manager=google_manager, config=_config, mode=linkedin_mode,
+                                       local_manager=local_manager)
+
+    # Long-lived automation daemon for the dashboard
+    if args.daemon:
+        AutomationDaemon(linkedin_manager, _config, _CONFIG_FILENAME).serve_forever()
+        return
+
+    msg_template = args.message if args.message else "Hi {Name}, I'd like to connect with you on LinkedIn!"
+    interval = args.refresh_interval if args.refresh_interval else 60
+    output_file = args.output if args.output else "linkedin_connections.xlsx"
+
+    # Several modes at once: interleave them as prioritized jobs on one signed-in session,
+    # sharing the [BUDGET] limits (the feed keeps running until stopped with Ctrl+C)
+    requested_modes = [args.feed_monitoring, args.send_connections, args.profile_warmup, args.connection_hunting]
+    if sum(1 for mode in requested_modes if mode) > 1 and workers == 1:
+        if linkedin_manager.linkedin_signin():
+            scheduler = JobScheduler(linkedin_manager.budget, linkedin_manager.stop_event)
+            if args.send_connections:
+                scheduler.add("connection requests", linkedin_manager.connection_request_steps(args.send_connections, msg_template),
+                              priority=job_priority(_config, "connect"))
+            if args.profile_warmup:
+                scheduler.add("profile warmup", linkedin_manager.warmup_steps(args.profile_warmup), priority=job_priority(_config, "warmup"))
+            if args.connection_hunting:
+                scheduler.add("connection hunting", linkedin_manager.connection_hunting_steps(args.connection_hunting, output_file, start_page=args.start_page),
+                              priority=job_priority(_config, "hunt"))
+            if args.feed_monitoring:
+                scheduler.add("feed monitoring", linkedin_manager.feed_monitoring_steps(refresh_interval=interval), priority=job_priority(_config, "feed"))
+            try:
+                scheduler.run()
+            except KeyboardInterrupt:
+                print("\nStopped by user.")
+            except Exception as e:
+                print(f"Error: {e}")
+            finally:
+                linkedin_manager.kill_browser()
+        else:
+            print("Sign in failed.")
+        return
 
     # Feed Monitoring
     if args.feed_monitoring:
         if linkedin_manager.linkedin_signin():
             try:
-                interval = args.refresh_interval if args.refresh_interval else 60
                 linkedin_manager.monitor_feed(refresh_interval=interval)
             except Exception as e:
                 print(f"Error: {e}")
@@ -1091,8 +2136,13 @@ def main():
     if args.send_connections:
         if linkedin_manager.linkedin_signin():
             try:
-                msg_template = args.message if args.message else "Hi {Name}, I'd like to connect with you on LinkedIn!"
-                linkedin_manager.send_connection_requests_from_excel(args.send_connections, msg_template)
+                if workers > 1:
+                    # Release the signed-in main profile so it can be copied into each worker's profile
+                    linkedin_manager.kill_browser()
+                    run_sharded("connect", args.send_connections, workers, mode=linkedin_mode, message_template=msg_template,
+                                config_overrides=config_overrides)
+                else:
+                    linkedin_manager.send_connection_requests_from_excel(args.send_connections, msg_template)
             except Exception as e:
                 print(f"Error: {e}")
             finally:
@@ -1105,7 +2155,11 @@ def main():
     if args.profile_warmup:
         if linkedin_manager.linkedin_signin():
             try:
-                linkedin_manager.warmup_profile_activity(args.profile_warmup)
+                if workers > 1:
+                    linkedin_manager.kill_browser()
+                    run_sharded("warmup", args.profile_warmup, workers, mode=linkedin_mode, config_overrides=config_overrides)
+                else:
+                    linkedin_manager.warmup_profile_activity(args.profile_warmup)
             except Exception as e:
                 print(f"Error: {e}")
             finally:
@@ -1118,8 +2172,7 @@ def main():
     if args.connection_hunting:
         if linkedin_manager.linkedin_signin():
             try:
-                output_file = args.output if args.output else "linkedin_connections.xlsx"
-                linkedin_manager.connection_hunting(args.connection_hunting, output_file)
+                linkedin_manager.connection_hunting(args.connection_hunting, output_file, start_page=args.start_page)
             except Exception as e:
                 print(f"Error: {e}")
             finally:
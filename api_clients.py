@@ -0,0 +1,367 @@
+
+import random
+import re
+import threading
+import time
+from collections import deque
+
+from app_config import LOGGER
+
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits and server errors
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+
+class RetryPolicy:
+
+    def __init__(self, timeout: float = 30, max_retries: int = 3, backoff_base: float = 1.0, backoff_max: float = 20):
+        """
+        Timeout and retry settings shared by the API clients.
+        Args:
+            timeout: Seconds before a single request is abandoned.
+            max_retries: Retries after the first attempt for rate limits, server errors and connection failures.
+            backoff_base: Base of the exponential backoff in seconds (doubles per retry).
+            backoff_max: Upper bound of one backoff delay in seconds.
+        """
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build a policy from the optional [API] section of the config (timeout, max_retries, backoff_base, backoff_max).
+        Args:
+            config: RawConfigParser object for configuration (may be None).
+        Returns:
+            A RetryPolicy instance.
+        """
+        section = config["API"] if config is not None and config.has_section("API") else {}
+        try:
+            return cls(timeout=float(section.get("timeout", "30")),
+                       max_retries=max(0, int(section.get("max_retries", "3"))),
+                       backoff_base=float(section.get("backoff_base", "1")),
+                       backoff_max=float(section.get("backoff_max", "20")))
+        except ValueError:
+            print("Invalid [API] settings, using defaults.")
+            return cls()
+
+    def delay(self, attempt: int, retry_after: float = None) -> float:
+        """
+        Return the wait before retry number `attempt` (0-based): full jitter over the exponential backoff,
+        so parallel workers hitting the same rate limit do not retry in lockstep. A server-sent Retry-After wins.
+        """
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        return max(delay, retry_after) if retry_after else delay
+
+
+def _status_code(exc):
+    # openai errors carry status_code, google.api_core errors carry code
+    for attr in ("status_code", "code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def is_retryable(exc: Exception) -> bool:
+    """
+    True for rate limits (429), server errors (5xx), timeouts and connection failures.
+    """
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    try:
+        import openai
+        if isinstance(exc, openai.APIConnectionError):
+            return True
+    except ImportError:
+        pass
+    return _status_code(exc) in RETRYABLE_STATUS
+
+
+def _retry_after(exc: Exception):
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return min(60.0, float(headers.get("retry-after", "")))
+    except (TypeError, ValueError):
+        return None
+
+
+# --- ApiStats: per-provider call latency ---
+
+class ApiStats:
+
+    def __init__(self, name: str, window: int = 200):
+        """
+        Record the latency, retries and failures of one provider's API calls.
+        Args:
+            name: Provider name shown in the report.
+            window: Number of recent latencies kept for percentiles.
+        """
+        self.name = name
+        self.calls = 0
+        self.failures = 0
+        self.retries = 0
+        self.latencies = deque(maxlen=window)
+        self.first_token = deque(maxlen=window)
+        self.stream_totals = deque(maxlen=window)
+        self.cut_off = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, ok: bool, retries: int = 0) -> None:
+        with self._lock:
+            self.calls += 1
+            self.retries += retries
+            if ok:
+                self.latencies.append(seconds)
+            else:
+                self.failures += 1
+
+    def record_stream(self, first_token: float, total: float, cut_off: bool) -> None:
+        """Record a streamed reply: time to first token, total time, and whether it was cut off early."""
+        with self._lock:
+            if first_token is not None:
+                self.first_token.append(first_token)
+            self.stream_totals.append(total)
+            self.cut_off += int(cut_off)
+
+    def record_usage(self, prompt_tokens: int, cached_tokens: int = 0) -> None:
+        """Record prompt tokens sent and how many of them the provider served from its prefix cache."""
+        with self._lock:
+            self.prompt_tokens += prompt_tokens or 0
+            self.cached_tokens += cached_tokens or 0
+
+    @staticmethod
+    def _percentiles(samples) -> str:
+        samples = sorted(samples)
+        p50 = samples[len(samples) // 2]
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        return f"p50 {p50:.2f}s / p95 {p95:.2f}s"
+
+    def summary(self) -> str:
+        """One-line report: calls, failures, retries, p50/p95 latency and, for streamed replies, time to first token."""
+        with self._lock:
+            latencies, first_token, totals = list(self.latencies), list(self.first_token), list(self.stream_totals)
+            calls, failures, retries, cut_off = self.calls, self.failures, self.retries, self.cut_off
+            prompt_tokens, cached_tokens = self.prompt_tokens, self.cached_tokens
+        parts = []
+        if calls:
+            parts.append(f"{calls} calls, {failures} failed, {retries} retries")
+        if latencies:
+            parts.append(f"latency {self._percentiles(latencies)}")
+        if totals:
+            parts.append(f"{len(totals)} streamed ({cut_off} cut off), total {self._percentiles(totals)}")
+        if first_token:
+            parts.append(f"first token {self._percentiles(first_token)}")
+        if prompt_tokens:
+            parts.append(f"{prompt_tokens} prompt tokens ({cached_tokens} cached)")
+        return f"{self.name}: {', '.join(parts) or 'no calls'}."
+
+    def used(self) -> bool:
+        """True if any call or stream was recorded."""
+        with self._lock:
+            return bool(self.calls or self.stream_totals)
+
+
+def call_with_retries(func, policy: RetryPolicy, stats: ApiStats = None, label: str = "API call"):
+    """
+    Call func(), retrying retryable errors with jittered exponential backoff.
+    Args:
+        func: Callable performing one request.
+        policy: RetryPolicy with the retry count and backoff.
+        stats: Optional ApiStats recording the call's total latency and retries.
+        label: Name used in log messages.
+    Returns:
+        The result of func().
+    Raises:
+        The last exception if the request did not succeed.
+    """
+    started = time.monotonic()
+    attempt = 0
+    while True:
+        try:
+            result = func()
+        except Exception as e:
+            if attempt >= policy.max_retries or not is_retryable(e):
+                if stats is not None:
+                    stats.record(time.monotonic() - started, False, attempt)
+                raise
+            delay = policy.delay(attempt, _retry_after(e))
+            LOGGER.warning("%s failed (%s), retry %d/%d in %.1fs", label, e, attempt + 1, policy.max_retries, delay)
+            time.sleep(delay)
+            attempt += 1
+            continue
+        if stats is not None:
+            stats.record(time.monotonic() - started, True, attempt)
+        return result
+
+
+# --- CommentLimit: streamed comments cut off at the character limit ---
+
+class CommentLimit:
+
+    def __init__(self, max_chars: int = 150, max_tokens: int = None, stream: bool = True):
+        """
+        Length limit for generated comments. Comments are streamed and generation stops as soon as max_chars
+        characters have arrived; the output token cap keeps providers from running far past the limit.
+        Args:
+            max_chars: Maximum comment length in characters (0 disables the limit).
+            max_tokens: Output token cap (default: about 1 token per 3 characters plus a margin).
+            stream: Stream single comments (otherwise the full reply is requested and trimmed).
+        """
+        self.max_chars = max_chars
+        self.max_tokens = max_tokens or (max_chars // 3 + 10 if max_chars else None)
+        self.stream = stream
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build the limit from the optional [API] section of the config (comment_max_chars, comment_max_tokens, stream).
+        Args:
+            config: RawConfigParser object for configuration (may be None).
+        Returns:
+            A CommentLimit instance.
+        """
+        section = config["API"] if config is not None and config.has_section("API") else {}
+        stream = str(section.get("stream", "true")).lower() not in ("0", "false", "no", "off")
+        try:
+            max_tokens = int(section.get("comment_max_tokens", "0")) or None
+            return cls(max(0, int(section.get("comment_max_chars", "150"))), max_tokens, stream)
+        except ValueError:
+            print("Invalid [API] comment limits, using defaults.")
+            return cls(stream=stream)
+
+    def trim(self, text: str) -> str:
+        """
+        Shorten text to max_chars, ending at the last complete sentence if one ends past half the limit,
+        otherwise at the last whole word.
+        """
+        text = (text or "").strip()
+        if not self.max_chars or len(text) <= self.max_chars:
+            return text
+        head = text[:self.max_chars + 1]
+        sentence_ends = [match.end() for match in re.finditer(r"[.!?](?=\s|$)", head) if match.end() <= self.max_chars]
+        if sentence_ends and sentence_ends[-1] >= self.max_chars // 2:
+            return head[:sentence_ends[-1]].strip()
+        cut = head.rfind(" ", 0, self.max_chars + 1)
+        return head[:cut if cut > 0 else self.max_chars].rstrip(" ,;:-")
+
+    def collect(self, pieces, started: float, stats: ApiStats = None) -> str:
+        """
+        Read streamed text pieces until the reply ends or max_chars is exceeded, then trim it.
+        Args:
+            pieces: Iterator of text deltas.
+            started: time.monotonic() when the request was sent.
+            stats: Optional ApiStats recording time to first token and total time.
+        Returns:
+            The comment text.
+        """
+        text = ""
+        first_token = None
+        cut_off = False
+        for piece in pieces:
+            if not piece:
+                continue
+            if first_token is None:
+                first_token = time.monotonic() - started
+            text += piece
+            if self.max_chars and len(text.strip()) > self.max_chars:
+                cut_off = True
+                break
+        if stats is not None:
+            stats.record_stream(first_token, time.monotonic() - started, cut_off)
+        return self.trim(text)
+
+    def batch_max_tokens(self, count: int):
+        """Output token cap for a JSON batch reply with `count` comments (None without a limit)."""
+        if not self.max_tokens:
+            return None
+        # Each entry also carries its id and the JSON syntax around the comment
+        return count * (self.max_tokens + 15)
+
+
+# --- OpenAIClient: one persistent client for all OpenAI requests ---
+
+class OpenAIClient:
+
+    def __init__(self, policy: RetryPolicy = None):
+        """
+        Keep one openai.OpenAI client, and with it one pooled keep-alive HTTP connection, for all requests
+        instead of configuring the module-level client per call. The client is rebuilt only when the API key
+        changes. The SDK's own retries are disabled in favour of call_with_retries, so every call is timed.
+        Args:
+            policy: RetryPolicy with the timeout and retry settings.
+        """
+        self.policy = policy or RetryPolicy()
+        self.stats = ApiStats("OpenAI API")
+        self._client = None
+        self._api_key = None
+        self._lock = threading.Lock()
+
+    def client(self, api_key: str):
+        """Return the shared openai.OpenAI client for this API key."""
+        with self._lock:
+            if self._client is None or api_key != self._api_key:
+                import openai
+                if self._client is not None:
+                    self._client.close()
+                self._client = openai.OpenAI(api_key=api_key, timeout=self.policy.timeout, max_retries=0)
+                self._api_key = api_key
+            return self._client
+
+    def chat(self, api_key: str, model: str, messages: list, **options) -> str:
+        """
+        Run one chat completion with retries.
+        Args:
+            api_key: OpenAI API key.
+            model: Model name.
+            messages: Chat messages.
+            options: Extra arguments for chat.completions.create (e.g. response_format).
+        Returns:
+            The reply text.
+        """
+        client = self.client(api_key)
+        response = call_with_retries(lambda: client.chat.completions.create(model=model, messages=messages, **options),
+                                     self.policy, self.stats, label="OpenAI request")
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            details = getattr(usage, "prompt_tokens_details", None)
+            self.stats.record_usage(usage.prompt_tokens, getattr(details, "cached_tokens", 0) if details else 0)
+        return response.choices[0].message.content
+
+    def chat_stream(self, api_key: str, model: str, messages: list, limit: CommentLimit, prompt_tokens: int = 0) -> str:
+        """
+        Stream one chat completion and stop reading once the comment limit is reached.
+        Args:
+            api_key: OpenAI API key.
+            model: Model name.
+            messages: Chat messages.
+            limit: CommentLimit with the character and token caps.
+            prompt_tokens: Counted prompt tokens (a stream cut off early never receives the usage report).
+        Returns:
+            The reply text, trimmed to the limit.
+        """
+        self.stats.record_usage(prompt_tokens)
+        client = self.client(api_key)
+        started = time.monotonic()
+        options = {"max_tokens": limit.max_tokens} if limit.max_tokens else {}
+        # Retries cover opening the stream (rate limits and server errors arrive before the first token)
+        stream = call_with_retries(lambda: client.chat.completions.create(model=model, messages=messages, stream=True, **options),
+                                   self.policy, self.stats, label="OpenAI request")
+        try:
+            return limit.collect((chunk.choices[0].delta.content for chunk in stream if chunk.choices), started, self.stats)
+        finally:
+            # Closing the response stops the server from generating tokens that would be thrown away
+            stream.close()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
@@ -0,0 +1,264 @@
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+import uuid
+from configparser import RawConfigParser
+
+
+# Lightweight shared settings: importing this module must stay cheap (no selenium, SDKs or pandas),
+# so the dashboard and helper processes can use the config without loading the automation stack.
+
+# Directory holding the scripts, config, Prompts and files (next to the executable when frozen)
+if getattr(sys, "frozen", False):
+    APP_DIR = os.path.dirname(os.path.abspath(sys.executable))
+else:
+    APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+TEMP_PROFILE = os.path.expanduser("~/AppData/Local/Temp/LinkedinProfile")
+
+_CONFIG_FILENAME = os.path.join(APP_DIR, "config")
+_config = RawConfigParser()
+# Serializes background updates of the shared config (e.g. the Gemini model catalog) with writes of the file
+CONFIG_LOCK = threading.RLock()
+
+LOGGER = logging.getLogger()
+_logging_configured = False
+_log_listener = None
+
+# Identifies one run in the logs and metrics. Every process gets a fresh id, except parallel workers, whose
+# parent passes its own id in RUN_ID_ENV while starting them; the variable is removed right away, so processes
+# started later (e.g. each run launched from the dashboard) do not inherit it
+RUN_ID_ENV = "AUTOLINKEDIN_RUN_ID"
+RUN_ID = os.environ.pop(RUN_ID_ENV, None) or uuid.uuid4().hex[:12]
+
+# Chatty libraries are kept at WARNING unless [LOGGING] levels says otherwise
+DEFAULT_LIBRARY_LEVELS = {"selenium": "WARNING", "seleniumbase": "WARNING", "urllib3": "WARNING",
+                          "httpx": "WARNING", "httpcore": "WARNING", "openai": "WARNING", "google": "WARNING"}
+
+TEXT_LOG_FORMAT = "| %(name)s <==> %(levelname)s | %(asctime)s | run %(run_id)s pid %(process)d ==> %(message)s"
+
+# Attributes every LogRecord has; anything else was passed with extra={...}
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "run_id"}
+
+
+def load_config() -> RawConfigParser:
+    """
+    Read the config file (if it exists) into the shared RawConfigParser and return it.
+    Safe to call repeatedly, e.g. on every Streamlit rerun, to pick up changes made by other processes.
+    """
+    if os.path.exists(_CONFIG_FILENAME):
+        _config.read(_CONFIG_FILENAME, encoding="utf-8")
+    return _config
+
+
+def apply_config_overrides(config: RawConfigParser, overrides: dict) -> None:
+    """
+    Apply in-memory setting overrides (e.g. from command-line flags) without saving them.
+    Args:
+        config: RawConfigParser to update.
+        overrides: {section: {key: value}}.
+    """
+    for section, values in (overrides or {}).items():
+        if not config.has_section(section):
+            config.add_section(section)
+        for key, value in values.items():
+            config[section][key] = value
+
+
+class JsonFormatter(logging.Formatter):
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record as one JSON line (time, level, logger, message, run id, process, thread,
+        exception and any extra={...} fields).
+        """
+        data = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "run_id": RUN_ID,
+            "pid": record.process,
+            "thread": record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                data[key] = value
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data, default=str, ensure_ascii=False)
+
+
+class _StructuredQueueHandler(logging.handlers.QueueHandler):
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Make the record safe to hand to the writer thread: merge the arguments into the message and render the
+        traceback, but keep it in exc_text instead of appending it to the message like QueueHandler does.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.run_id = RUN_ID
+        return record
+
+
+class _SharedRolloverMixin:
+    """
+    Several processes append to the same log (dashboard jobs, the daemon, parallel workers).
+    Before rotating, a process checks whether another one already rotated the file it still has open; if so it
+    continues in the new file instead of rotating again. On Windows the file cannot be renamed while another
+    process has it open, so a failed rollover keeps appending and is retried later.
+    """
+    rollover_retry_seconds = 60
+    _rollover_blocked_until = 0.0
+
+    def _rotated_elsewhere(self) -> bool:
+        """True if the path no longer points to the file this handler has open."""
+        if self.stream is None:
+            return False
+        try:
+            current = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            return True
+        opened = os.fstat(self.stream.fileno())
+        return (current.st_dev, current.st_ino) != (opened.st_dev, opened.st_ino)
+
+    def _reopen(self) -> None:
+        self.stream.close()
+        self.stream = self._open()
+
+    def shouldRollover(self, record) -> bool:
+        if time.monotonic() < self._rollover_blocked_until:
+            return False
+        if not super().shouldRollover(record):
+            return False
+        if self._rotated_elsewhere():
+            self._reopen()
+            return super().shouldRollover(record)
+        return True
+
+    def doRollover(self) -> None:
+        try:
+            super().doRollover()
+        except OSError:
+            self._rollover_blocked_until = time.monotonic() + self.rollover_retry_seconds
+            if self.stream is None:
+                self.stream = self._open()
+
+
+class SharedRotatingFileHandler(_SharedRolloverMixin, logging.handlers.RotatingFileHandler):
+    pass
+
+
+class SharedTimedRotatingFileHandler(_SharedRolloverMixin, logging.handlers.TimedRotatingFileHandler):
+
+    def _reopen(self) -> None:
+        super()._reopen()
+        # The other process rotated for this interval already; wait for the next one
+        self.rolloverAt = self.computeRollover(int(time.time()))
+
+
+def _parse_levels(text: str) -> dict:
+    """Parse 'selenium=WARNING, openai=INFO' into {logger name: level name}."""
+    levels = {}
+    for item in text.split(","):
+        if "=" in item:
+            name, level = item.split("=", 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def _file_handler(section, path: str) -> logging.Handler:
+    backup_count = int(section.get("backup_count", "5"))
+    when = section.get("rotate_when", "").strip()
+    if when:
+        # Time-based rotation, e.g. 'midnight' or 'H'
+        return SharedTimedRotatingFileHandler(path, when=when, backupCount=backup_count, encoding="utf-8", delay=True)
+    max_bytes = int(float(section.get("max_mb", "5")) * 1024 * 1024)
+    return SharedRotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+
+
+def write_config(config: RawConfigParser = None, path: str = None) -> None:
+    """
+    Save the config under CONFIG_LOCK, through a temporary file that replaces the config file,
+    so writers in this process do not interleave and other processes never read a half-written file.
+    Args:
+        config: RawConfigParser to save (default: the shared one).
+        path: Config file path (default: the app's config file).
+    """
+    config = _config if config is None else config
+    path = path or _CONFIG_FILENAME
+    with CONFIG_LOCK:
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            config.write(file)
+        for attempt in range(5):
+            try:
+                os.replace(temp_path, path)
+                return
+            except PermissionError:
+                # Windows refuses the replace while another process is reading the file
+                if attempt == 4:
+                    raise
+                time.sleep(0.1)
+
+
+def setup_logging(config: RawConfigParser = None) -> logging.Logger:
+    """
+    Configure logging once per process and return the root logger.
+    Records are put on an in-memory queue and written by a background thread, so logging never blocks the
+    automation on disk I/O. The log ([LOGGING] path, default Monitoring.log) is appended to and rotated by size
+    (max_mb, backup_count) or time (rotate_when), as JSON lines carrying the run id (or text with format = text).
+    The root level is [LOGGING] level (default INFO); levels sets single libraries, e.g. selenium=DEBUG.
+    Args:
+        config: RawConfigParser object for configuration (default: the config file is read).
+    Returns:
+        The root logger.
+    """
+    global _logging_configured, _log_listener
+    if _logging_configured:
+        return LOGGER
+    config = load_config() if config is None else config
+    section = config["LOGGING"] if config.has_section("LOGGING") else {}
+    path = section.get("path", "") or os.path.join(APP_DIR, "Monitoring.log")
+    try:
+        handler = _file_handler(section, path)
+    except ValueError:
+        print("Invalid [LOGGING] rotation settings, using defaults.")
+        handler = _file_handler({}, path)
+    if section.get("format", "json").lower() == "text":
+        handler.setFormatter(logging.Formatter(TEXT_LOG_FORMAT))
+    else:
+        handler.setFormatter(JsonFormatter())
+
+    log_queue = queue.SimpleQueue()
+    LOGGER.addHandler(_StructuredQueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, handler)
+    _log_listener.start()
+    # Write out queued records on exit
+    atexit.register(_log_listener.stop)
+
+    levels = dict(DEFAULT_LIBRARY_LEVELS, **_parse_levels(section.get("levels", "")))
+    levels[""] = section.get("level", "INFO").upper()
+    for name, level in levels.items():
+        try:
+            logging.getLogger(name or None).setLevel(level)
+        except ValueError:
+            print(f"Invalid [LOGGING] level '{level}' for {name or 'root'}, ignored.")
+    _logging_configured = True
+    LOGGER.info("Run %s started: %s", RUN_ID, " ".join(sys.argv))
+    return LOGGER
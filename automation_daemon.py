@@ -0,0 +1,320 @@
+
+import io
+import secrets
+import sys
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+from app_config import LOGGER, write_config
+from scheduler import JobScheduler, job_priority
+
+
+# Jobs the daemon can run on its warm browser session
+JOB_TYPES = ("feed", "connect", "warmup", "hunt")
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 6010
+
+
+def daemon_address(config) -> tuple:
+    """
+    Return the (host, port) the daemon listens on, from [DAEMON] host/port in the config.
+    """
+    host, port = DEFAULT_HOST, DEFAULT_PORT
+    if config is not None and config.has_section("DAEMON"):
+        host = config["DAEMON"].get("host", DEFAULT_HOST)
+        try:
+            port = int(config["DAEMON"].get("port", str(DEFAULT_PORT)))
+        except ValueError:
+            pass
+    return host, port
+
+
+def daemon_authkey(config, config_filename: str = None) -> bytes:
+    """
+    Return the shared secret clients must present, from [DAEMON] authkey.
+    Args:
+        config: RawConfigParser object for configuration.
+        config_filename: If given and no key is set yet, a random key is generated and saved there.
+    Returns:
+        The key as bytes, or None if no key is configured.
+    """
+    authkey = config["DAEMON"].get("authkey", "") if config.has_section("DAEMON") else ""
+    if not authkey and config_filename:
+        if not config.has_section("DAEMON"):
+            config.add_section("DAEMON")
+        authkey = secrets.token_hex(16)
+        config["DAEMON"]["authkey"] = authkey
+        write_config(config, config_filename)
+    return authkey.encode() if authkey else None
+
+
+# --- Client side (used by the dashboard) ---
+
+def request(message: dict, config) -> dict:
+    """
+    Send one control message ('status', 'stop' or 'shutdown') to the daemon and return its reply.
+    Returns:
+        The reply dict, or None if no daemon is reachable.
+    """
+    authkey = daemon_authkey(config)
+    if authkey is None:
+        return None
+    try:
+        with Client(daemon_address(config), authkey=authkey) as conn:
+            conn.send(message)
+            return conn.recv()
+    except (OSError, EOFError, AuthenticationError):
+        return None
+
+
+def daemon_status(config) -> dict:
+    """
+    Return {'busy': job name or None, 'signed_in': bool, 'uptime': seconds}, or None if no daemon is running.
+    """
+    return request({"type": "status"}, config)
+
+
+def submit_job(job: str, args: dict, config):
+    """
+    Run a job on the daemon and stream its output.
+    Args:
+        job: One of JOB_TYPES.
+        args: Job arguments (see AutomationDaemon.job_steps).
+        config: RawConfigParser object for configuration.
+    Yields:
+        Output lines as they are printed by the job, then a final summary line.
+    Raises:
+        ConnectionError: If no daemon is reachable.
+    """
+    authkey = daemon_authkey(config)
+    if authkey is None:
+        raise ConnectionError("No daemon authkey configured")
+    try:
+        conn = Client(daemon_address(config), authkey=authkey)
+    except (OSError, AuthenticationError) as e:
+        raise ConnectionError(f"Automation daemon not reachable: {e}")
+    with conn:
+        conn.send({"type": "job", "job": job, "args": args})
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                yield "Connection to the automation daemon was lost.\n"
+                return
+            if message["type"] == "output":
+                yield message["text"]
+            elif message["type"] == "error":
+                yield f"Error: {message['message']}\n"
+                return
+            elif message["type"] == "done":
+                outcome = "finished" if message["ok"] else "failed"
+                yield f"Job '{job}' {outcome} after {message['seconds']:.1f}s.\n"
+                return
+
+
+# --- Daemon side ---
+
+class _ConnectionWriter(io.TextIOBase):
+
+    def __init__(self, conn, console):
+        """
+        File-like object that echoes printed text to the daemon console and streams complete lines to a client.
+        Jobs print from pipeline threads too, so sends are serialized with a lock.
+        """
+        self._conn = conn
+        self._console = console
+        self._buffer = ""
+        self._lock = threading.Lock()
+        self._connected = True
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._console.write(text)
+        with self._lock:
+            self._buffer += text
+            if "\n" in self._buffer:
+                lines, self._buffer = self._buffer.rsplit("\n", 1)
+                self._send(lines + "\n")
+        return len(text)
+
+    def flush(self) -> None:
+        self._console.flush()
+        with self._lock:
+            if self._buffer:
+                self._send(self._buffer)
+                self._buffer = ""
+
+    def _send(self, text: str) -> None:
+        if not self._connected:
+            return
+        try:
+            self._conn.send({"type": "output", "text": text})
+        except (OSError, ValueError):
+            # The dashboard went away; keep running the job and only print to the console
+            self._connected = False
+
+
+class AutomationDaemon:
+
+    def __init__(self, linkedin_manager, config, config_filename: str):
+        """
+        Long-lived worker that keeps one signed-in browser session warm and runs dashboard jobs on it.
+        Jobs are queued in a JobScheduler, which interleaves them by priority under the shared action budgets,
+        and each job's output is streamed back over a local authenticated socket ([DAEMON] host/port/authkey),
+        so starting a job does not pay for imports, model discovery, a Chrome cold start or sign-in.
+        Args:
+            linkedin_manager: LinkedInManager whose browser session is reused by every job.
+            config: RawConfigParser object for configuration.
+            config_filename: Path to the config file.
+        """
+        self.manager = linkedin_manager
+        self._config = config
+        self._CONFIG_FILENAME = config_filename
+        self._console = sys.stdout
+        self.scheduler = JobScheduler(linkedin_manager.budget, linkedin_manager.stop_event)
+        self._signed_in = False
+        self._shutdown = False
+        self._started = time.monotonic()
+
+    def _log(self, text: str) -> None:
+        self._console.write(f"[daemon] {text}\n")
+        self._console.flush()
+
+    def _ensure_session(self) -> bool:
+        """
+        Make sure the browser is alive and signed in, restarting it if it was closed or crashed.
+        Returns:
+            True if the session is ready.
+        """
+        if self.manager.driver is not None:
+            try:
+                self.manager.driver.current_url
+                if self._signed_in:
+                    return True
+            except Exception:
+                self._log("Browser session lost, restarting ...")
+                try:
+                    self.manager.kill_browser()
+                except Exception:
+                    self.manager.driver = None
+                    self.manager.sb_init = None
+        try:
+            self._signed_in = self.manager.linkedin_signin()
+        except EOFError:
+            # Credentials cannot be prompted for without a terminal; the profile must already be signed in
+            self._signed_in = False
+        return self._signed_in
+
+    def job_steps(self, job: str, args: dict):
+        """
+        Step generator for one job on the warm session (see JobScheduler).
+        Args:
+            job: 'feed' (refresh_interval), 'connect' (input_file, message), 'warmup' (input_file)
+                 or 'hunt' (search_url, output, start_page).
+            args: Job arguments; feed and warmup also take 'comment_source' (gpt, google or local) and 'max_posts',
+                  which apply to this job only.
+        """
+        if not self._ensure_session():
+            raise RuntimeError("Sign in failed.")
+        comment_source = args.get("comment_source") or None
+        max_posts = max(1, int(args["max_posts"])) if args.get("max_posts") else None
+        if job == "feed":
+            yield from self.manager.feed_monitoring_steps(refresh_interval=int(args.get("refresh_interval") or 60),
+                                                          max_posts=max_posts, comment_source=comment_source)
+        elif job == "connect":
+            message = args.get("message") or "Hi {Name}, I'd like to connect with you on LinkedIn!"
+            yield from self.manager.connection_request_steps(args["input_file"], message)
+        elif job == "warmup":
+            yield from self.manager.warmup_steps(args["input_file"], max_posts=max_posts, comment_source=comment_source)
+        elif job == "hunt":
+            yield from self.manager.connection_hunting_steps(args["search_url"], args.get("output") or "linkedin_connections.xlsx",
+                                                             start_page=args.get("start_page"))
+
+    def _handle_job(self, conn, message: dict) -> None:
+        job = message.get("job")
+        if job not in JOB_TYPES:
+            conn.send({"type": "error", "message": f"Unknown job '{job}'"})
+            return
+        started = time.monotonic()
+        writer = _ConnectionWriter(conn, self._console)
+        queued = self.scheduler.pending()
+        scheduled = self.scheduler.add(job, self.job_steps(job, message.get("args") or {}),
+                                       priority=job_priority(self._config, job), output=writer)
+        self._log(f"Queued job '{job}'")
+        if queued:
+            writer.write(f"Queued alongside: {', '.join(queued)}\n")
+        scheduled.done.wait()
+        writer.flush()
+        self._log(f"Job '{job}' finished")
+        try:
+            conn.send({"type": "done", "ok": scheduled.ok, "seconds": time.monotonic() - started})
+        except (OSError, ValueError):
+            pass
+
+    def _handle_connection(self, conn) -> None:
+        with conn:
+            try:
+                message = conn.recv()
+                kind = message.get("type")
+                if kind == "job":
+                    self._handle_job(conn, message)
+                elif kind == "status":
+                    conn.send({"type": "status", "busy": ", ".join(self.scheduler.pending()) or None,
+                               "signed_in": self._signed_in, "uptime": time.monotonic() - self._started})
+                elif kind == "stop":
+                    stopping = self.scheduler.pending()
+                    self.manager.stop_event.set()
+                    conn.send({"type": "ok", "stopping": stopping})
+                elif kind == "shutdown":
+                    self._shutdown = True
+                    self.scheduler.close()
+                    self.manager.stop_event.set()
+                    conn.send({"type": "ok"})
+                    # Unblock accept() so serve_forever can exit
+                    try:
+                        Client(self._address, authkey=self._authkey).close()
+                    except OSError:
+                        pass
+                else:
+                    conn.send({"type": "error", "message": f"Unknown message '{kind}'"})
+            except (EOFError, OSError):
+                pass
+            except Exception:
+                LOGGER.exception("Automation daemon connection failed")
+
+    def serve_forever(self) -> None:
+        """
+        Sign in once, then accept jobs until a 'shutdown' message or Ctrl+C.
+        """
+        self._address = daemon_address(self._config)
+        self._authkey = daemon_authkey(self._config, self._CONFIG_FILENAME)
+        if self._ensure_session():
+            self._log("Signed in, browser session is warm.")
+        else:
+            self._log("Sign in failed; will retry when a job arrives.")
+        # All browser work happens on the scheduler thread
+        scheduler_thread = threading.Thread(target=self.scheduler.run, kwargs={"forever": True}, name="scheduler", daemon=True)
+        scheduler_thread.start()
+        with Listener(self._address, authkey=self._authkey) as listener:
+            self._log(f"Listening on {self._address[0]}:{self._address[1]}")
+            try:
+                while not self._shutdown:
+                    try:
+                        conn = listener.accept()
+                    except Exception as e:
+                        # Failed handshake (wrong authkey) or a dropped client
+                        self._log(f"Rejected connection: {e}")
+                        continue
+                    threading.Thread(target=self._handle_connection, args=(conn,), daemon=True).start()
+            except KeyboardInterrupt:
+                self._log("Interrupted.")
+        self.scheduler.close()
+        self.manager.stop_event.set()
+        scheduler_thread.join()
+        self.manager.kill_browser()
+        self._log("Stopped.")
@@ -0,0 +1,205 @@
+
+"""
+Fake LinkedIn site for the offline benchmark.
+
+Serves the pages the automation visits, built from the HTML fixtures in benchmarks/fixtures with the same
+selectors the code relies on (feed posts, like/comment buttons, the comment editor, search result cards,
+pagination, profile Connect / Add a note / Send). Likes, comments and invitations are reported back by the
+page script and counted, so a benchmark can check what was actually done.
+
+Usage (standalone, to look at the pages in a browser):
+    python benchmarks/fake_linkedin.py [--port 8710]
+"""
+import argparse
+import collections
+import html
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import parse_qs, urlparse
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+POST_TEXTS = [
+    "We cut our onboarding time in half by writing down every step new hires asked about in their first month. "
+    "The document is now the most edited page in our wiki.",
+    "Three years ago I almost shut the company down. Today we shipped our biggest release yet, built by a team "
+    "of eight people who never gave up on the idea.",
+    "Hot take: most automation projects fail because nobody owns the process they automate, not because of "
+    "the tools. Fix ownership first, then write the scripts.",
+    "Hiring update: we are growing the data team and looking for people who enjoy turning messy spreadsheets "
+    "into pipelines that run themselves every morning.",
+]
+
+
+def _load_fixture(name: str) -> Template:
+    with open(os.path.join(FIXTURES_DIR, name), "r", encoding="utf-8") as file:
+        return Template(file.read())
+
+
+class FakeLinkedIn:
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, posts_per_page: int = 10, total_pages: int = 5,
+                 profiles_per_page: int = 10):
+        """
+        Initialize (but do not start) the fake site.
+        Args:
+            host: Interface to listen on.
+            port: Port to listen on (0 picks a free port).
+            posts_per_page: Posts on the feed and on every activity page. Each feed load shows new posts.
+            total_pages: Result pages of every people search.
+            profiles_per_page: Result cards per search page.
+        """
+        self.posts_per_page = posts_per_page
+        self.total_pages = total_pages
+        self.profiles_per_page = profiles_per_page
+        self.events = collections.Counter()
+        self.page_views = collections.Counter()
+        self._feed_loads = 0
+        self._lock = threading.Lock()
+        self._templates = {name: _load_fixture(f"{name}.html") for name in ("page", "post", "card", "pagination", "profile")}
+        with open(os.path.join(FIXTURES_DIR, "linkedin.js"), "rb") as file:
+            self._script = file.read()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve in a background thread; returns self."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-linkedin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def counts(self) -> dict:
+        """Likes, comments and invitations reported so far."""
+        with self._lock:
+            return dict(self.events)
+
+    # --- Pages ---
+
+    def _page(self, title: str, content: str) -> str:
+        return self._templates["page"].substitute(title=html.escape(title), content=content)
+
+    def _posts(self, prefix: str) -> str:
+        posts = []
+        for number in range(self.posts_per_page):
+            posts.append(self._templates["post"].substitute(
+                post_id=f"{prefix}-{number}", author=f"Author {number}", text=html.escape(POST_TEXTS[number % len(POST_TEXTS)])))
+        return "\n".join(posts)
+
+    def feed_page(self) -> str:
+        with self._lock:
+            self._feed_loads += 1
+            load = self._feed_loads
+        # Every load (first visit or refresh) brings a fresh set of posts
+        return self._page("Feed", self._posts(f"feed{load}"))
+
+    def activity_page(self, slug: str) -> str:
+        return self._page(f"{slug} activity", self._posts(f"{slug}"))
+
+    def profile_page(self, slug: str) -> str:
+        number = slug.rsplit("-", 1)[-1]
+        return self._page(slug, self._templates["profile"].substitute(
+            slug=html.escape(slug), name=f"Bench User {number}", headline="Founder at Bench Company"))
+
+    def search_page(self, page: int) -> str:
+        cards = []
+        for number in range(self.profiles_per_page):
+            user = (page - 1) * self.profiles_per_page + number
+            cards.append(self._templates["card"].substitute(
+                slug=f"bench-user-{user}", name=f"Bench User {user}", headline=f"Founder at Company {user}",
+                location=f"City {user % 7}", position=f"CEO at Company {user}"))
+        pages = "\n".join(f'    <li class="artdeco-pagination__indicator artdeco-pagination__indicator--number">'
+                          f'<button aria-label="Page {number}"><span>{number}</span></button></li>'
+                          for number in range(1, self.total_pages + 1))
+        return self._page("Search", "\n".join(cards) + self._templates["pagination"].substitute(pages=pages))
+
+    def route(self, path: str, query: dict):
+        """
+        Return (status, content type, body) for a GET request.
+        """
+        if path == "/":
+            return 200, "text/html", self._page("Home", "")
+        if path in ("/feed", "/feed/"):
+            return 200, "text/html", self.feed_page()
+        if path == "/static/linkedin.js":
+            return 200, "application/javascript", self._script
+        if path.startswith("/search/results/people"):
+            page = int((query.get("page") or ["1"])[0])
+            if page > self.total_pages:
+                return 200, "text/html", self._page("Search", "")
+            return 200, "text/html", self.search_page(page)
+        match = re.match(r"^/in/([^/]+)/recent-activity(/all)?/?$", path)
+        if match:
+            return 200, "text/html", self.activity_page(match.group(1))
+        match = re.match(r"^/in/([^/]+)/?$", path)
+        if match:
+            return 200, "text/html", self.profile_page(match.group(1))
+        return 404, "text/plain", "Not found"
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, content_type: str, body) -> None:
+                if isinstance(body, str):
+                    body = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                status, content_type, body = site.route(url.path, parse_qs(url.query))
+                with site._lock:
+                    site.page_views[url.path.split("/")[1] or "home"] += 1
+                self._send(status, content_type, body)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    event = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    event = {}
+                if urlparse(self.path).path == "/event" and event.get("type"):
+                    with site._lock:
+                        site.events[event["type"]] += 1
+                self._send(200, "application/json", "{}")
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the fake LinkedIn pages used by the offline benchmark")
+    parser.add_argument("--port", type=int, default=8710)
+    args = parser.parse_args()
+    site = FakeLinkedIn(port=args.port)
+    print(f"Fake LinkedIn on {site.base_url}: /feed/, /search/results/people/?keywords=x, /in/bench-user-1/")
+    try:
+        site._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
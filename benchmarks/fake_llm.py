@@ -0,0 +1,186 @@
+
+"""
+Stub LLM server for the offline benchmark.
+
+Answers OpenAI chat completions (/v1/chat/completions) and Gemini REST generateContent /
+streamGenerateContent requests with canned comments after a configurable latency, streaming word by word
+when asked to. Batch prompts ("Post 1:", "Post 2:", ...) get a JSON reply with one comment per post.
+
+Usage (standalone):
+    python benchmarks/fake_llm.py [--port 8711] [--latency 0.8] [--token-delay 0.02]
+    OPENAI_BASE_URL=http://127.0.0.1:8711/v1 python Monitor_Feed.py ...
+"""
+import argparse
+import collections
+import itertools
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+
+# Longer than the 150 character comment limit, so the streaming cutoff is exercised
+REPLY = ("Really like how you framed this, it matches what we saw when we automated our own reporting last year. "
+         "The hard part was ownership, not tooling. What was the first process you tackled?")
+BATCH_REPLY = "Really like how you framed this. The hard part was ownership, not tooling. What did you tackle first?"
+
+
+def _batch_count(prompt: str) -> int:
+    return len(re.findall(r"^Post \d+:", prompt, re.MULTILINE)) if "JSON" in prompt else 0
+
+
+def _reply(prompt: str) -> str:
+    count = _batch_count(prompt)
+    if count:
+        return json.dumps({"comments": [{"id": number, "comment": BATCH_REPLY} for number in range(1, count + 1)]})
+    return REPLY
+
+
+class FakeLLM:
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.8, token_delay: float = 0.02):
+        """
+        Initialize (but do not start) the stub server.
+        Args:
+            host: Interface to listen on.
+            port: Port to listen on (0 picks a free port).
+            latency: Seconds before the first token (or the whole reply when not streaming).
+            token_delay: Seconds between streamed words.
+        """
+        self.latency = latency
+        self.token_delay = token_delay
+        self.requests = collections.Counter()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve in a background thread; returns self."""
+        threading.Thread(target=self._server.serve_forever, name="fake-llm", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _count(self, kind: str) -> None:
+        with self._lock:
+            self.requests[kind] += 1
+
+    def _handler_class(self):
+        llm = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _json(self, status: int, payload: dict) -> None:
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _stream(self, events) -> None:
+                """Send server-sent events; stops quietly when the client closes the stream early."""
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                try:
+                    for event in events:
+                        data = event.encode("utf-8")
+                        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                        self.wfile.flush()
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True
+
+            def _words(self, text: str):
+                time.sleep(llm.latency)
+                for index, word in enumerate(text.split(" ")):
+                    if index:
+                        time.sleep(llm.token_delay)
+                    yield word if index == 0 else " " + word
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+                if url.path.endswith("/chat/completions"):
+                    self._openai(body)
+                elif ":generateContent" in url.path or ":streamGenerateContent" in url.path:
+                    self._gemini(url, body)
+                else:
+                    self._json(404, {"error": {"message": f"Unknown path {url.path}"}})
+
+            def _openai(self, body: dict) -> None:
+                prompt = "\n".join(str(message.get("content", "")) for message in body.get("messages", []))
+                text = _reply(prompt)
+                llm._count("openai_batch" if _batch_count(prompt) else "openai")
+                base = {"id": "chatcmpl-bench", "created": int(time.time()), "model": body.get("model", "bench")}
+                usage = {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(text) // 4,
+                         "total_tokens": (len(prompt) + len(text)) // 4}
+                if not body.get("stream"):
+                    time.sleep(llm.latency)
+                    self._json(200, dict(base, object="chat.completion", usage=usage, choices=[
+                        {"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": text}}]))
+                    return
+                chunks = (json.dumps(dict(base, object="chat.completion.chunk", choices=[
+                    {"index": 0, "finish_reason": None, "delta": {"content": word}}])) for word in self._words(text))
+                # OpenAI streams end with a [DONE] marker
+                self._stream(itertools.chain((f"data: {chunk}\n\n" for chunk in chunks), ["data: [DONE]\n\n"]))
+
+            def _gemini(self, url, body: dict) -> None:
+                prompt = "\n".join(part.get("text", "") for content in body.get("contents", [])
+                                   for part in content.get("parts", []))
+                text = _reply(prompt)
+                llm._count("gemini_batch" if _batch_count(prompt) else "gemini")
+                usage = {"promptTokenCount": len(prompt) // 4, "candidatesTokenCount": len(text) // 4,
+                         "totalTokenCount": (len(prompt) + len(text)) // 4}
+
+                def response(part: str, finished: bool) -> dict:
+                    candidate = {"content": {"parts": [{"text": part}], "role": "model"}, "index": 0}
+                    if finished:
+                        candidate["finishReason"] = "STOP"
+                    return {"candidates": [candidate], "usageMetadata": usage}
+
+                if ":streamGenerateContent" not in url.path:
+                    time.sleep(llm.latency)
+                    self._json(200, response(text, True))
+                    return
+                chunks = (json.dumps(response(word, False)) for word in self._words(text))
+                if "alt=sse" in url.query:
+                    self._stream(f"data: {chunk}\r\n\r\n" for chunk in chunks)
+                else:
+                    # Without alt=sse the REST client reads one JSON array, element by element
+                    self._stream(itertools.chain((("[" if index == 0 else ",\r\n") + chunk for index, chunk in enumerate(chunks)), ["]"]))
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve stub OpenAI/Gemini endpoints for the offline benchmark")
+    parser.add_argument("--port", type=int, default=8711)
+    parser.add_argument("--latency", type=float, default=0.8, help="Seconds before the first token")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="Seconds between streamed words")
+    args = parser.parse_args()
+    llm = FakeLLM(port=args.port, latency=args.latency, token_delay=args.token_delay)
+    print(f"Stub LLM on {llm.base_url} (OpenAI base URL {llm.base_url}/v1)")
+    try:
+        llm._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+// Minimal behaviour of the LinkedIn pages used by the offline benchmark.
+// Every like, comment and invitation is reported to the fixture server, which counts them.
+function report(type, id) {
+  // sendBeacon is delivered even when the automation navigates away right after the click
+  navigator.sendBeacon('/event', new Blob([JSON.stringify({type: type, id: id})], {type: 'application/json'}));
+}
+
+document.addEventListener('click', function (event) {
+  const button = event.target.closest('button');
+  if (!button) {
+    return;
+  }
+  if (button.classList.contains('react-button__trigger')) {
+    if (button.getAttribute('aria-pressed') !== 'true') {
+      button.setAttribute('aria-pressed', 'true');
+      report('like', button.dataset.post);
+    }
+  } else if (button.id && button.id.startsWith('feed-shared-social-action-bar-comment-')) {
+    button.closest('.feed-shared-update-v2').querySelector('.comments-comment-box').classList.add('open');
+  } else if (button.classList.contains('comments-comment-box__submit-button--cr')) {
+    const editor = button.closest('.comments-comment-box').querySelector('.ql-editor');
+    if (editor.textContent.trim()) {
+      editor.textContent = '';
+      report('comment', button.dataset.post);
+    }
+  } else if (button.classList.contains('connect-button')) {
+    document.querySelector('.send-invite').classList.add('open');
+  } else if (button.classList.contains('send-invite-button')) {
+    document.querySelector('.send-invite').classList.remove('open');
+    report('invite', button.dataset.profile);
+  }
+});
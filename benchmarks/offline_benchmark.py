@@ -0,0 +1,276 @@
+
+"""
+Offline benchmark of the automation modes against a fake LinkedIn site and a stub LLM server.
+
+Usage:
+    python benchmarks/offline_benchmark.py [--modes feed,hunt,warmup,connect] [--llm-latency 0.8] [--pacing none]
+
+Runs feed monitoring, connection hunting, profile warmup and connection requests in a real (headless) Chrome,
+started the same way as a normal run, but every linkedin.com URL is redirected to benchmarks/fake_linkedin.py
+and OpenAI/Gemini requests go to benchmarks/fake_llm.py. The user's config, Chrome profile and databases are
+not touched. Reports posts/min, profiles and pages per second, and the peak RSS of the whole process tree
+(Python, chromedriver and Chrome; shared pages are counted once per process). Needs Chrome and Linux (/proc).
+"""
+import argparse
+import configparser
+import csv
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path[:0] = [REPO_DIR, BENCH_DIR]
+
+from fake_linkedin import FakeLinkedIn
+from fake_llm import FakeLLM
+
+MODES = ("feed", "hunt", "warmup", "connect")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+STATIC_PROMPT = ("Write a 3 sentence LinkedIn comment on the post below. Sound human and relevant, do not sell anything. "
+                 "No more than 150 characters. No emojis.\nLinkedin Post:")
+
+
+# --- Peak memory of the process tree ---
+
+def _children(pid: int) -> list:
+    children = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            try:
+                with open(f"/proc/{pid}/task/{task}/children") as file:
+                    children += [int(child) for child in file.read().split()]
+            except OSError:
+                continue
+    except OSError:
+        pass
+    return children
+
+
+def tree_rss(pid: int) -> int:
+    """Return the summed resident set size in bytes of a process and all its descendants."""
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f"/proc/{current}/statm") as file:
+                total += int(file.read().split()[1]) * PAGE_SIZE
+        except (OSError, ValueError, IndexError):
+            continue
+        stack += _children(current)
+    return total
+
+
+class PeakRssSampler(threading.Thread):
+
+    def __init__(self, interval: float = 0.2):
+        """
+        Sample the RSS of this process tree in the background and keep the peak since the last reset().
+        """
+        super().__init__(name="rss-sampler", daemon=True)
+        self.interval = interval
+        self.peak = 0
+        self._done = threading.Event()
+
+    def reset(self) -> None:
+        self.peak = tree_rss(os.getpid())
+
+    def run(self) -> None:
+        while not self._done.wait(self.interval):
+            self.peak = max(self.peak, tree_rss(os.getpid()))
+
+    def stop(self) -> None:
+        self._done.set()
+
+
+# --- Setup ---
+
+def build_config(args, workdir: str) -> configparser.RawConfigParser:
+    """
+    Build an in-memory config pointing every store into workdir, with budgets and the comment cache off.
+    """
+    config = configparser.RawConfigParser()
+    config["ALL"] = {"api": "offline-benchmark", "ai model": "gpt-3.5-turbo", "static prompt": STATIC_PROMPT}
+    config["GOOGLE"] = {"api": "offline-benchmark", "static prompt": STATIC_PROMPT,
+                        "selected_model": "models/gemini-benchmark", "available_models": "models/gemini-benchmark",
+                        "available_model_names": "Gemini Benchmark", "models_refreshed": str(int(time.time()))}
+    config["LINKEDIN"] = {"comment_source": args.comment_source, "max_posts": str(args.posts),
+                          "pipeline_workers": str(args.pipeline_workers),
+                          # The fake feed never inserts posts, so every refresh must be a full load
+                          "feed_watch": "false",
+                          "seen_posts_db": os.path.join(workdir, "seen_posts.sqlite3")}
+    config["BUDGET"] = {"enabled": "false"}
+    config["API"] = {"max_retries": "1"}
+    if args.pacing == "none":
+        config["PACING"] = {"mode": "fast", "delay_action": "0", "delay_scroll": "0", "delay_typing": "0",
+                            "delay_read": "0", "delay_between_items": "0"}
+    else:
+        config["PACING"] = {"mode": args.pacing}
+    return config
+
+
+def use_stub_gemini(base_url: str) -> None:
+    """Send Gemini requests to the stub server over REST (GoogleManager calls genai.configure before use)."""
+    import google.generativeai as genai
+    configure = genai.configure
+
+    def configure_stub(**kwargs):
+        kwargs.update(transport="rest", client_options={"api_endpoint": base_url})
+        configure(**kwargs)
+    genai.configure = configure_stub
+
+
+def redirect_driver(driver, base_url: str) -> None:
+    """Make driver.get() load linkedin.com URLs from the fake site."""
+    get = driver.get
+
+    def get_local(url: str):
+        for prefix in ("https://www.linkedin.com", "https://linkedin.com"):
+            if url.startswith(prefix):
+                url = base_url + url[len(prefix):]
+        return get(url)
+    driver.get = get_local
+
+
+def write_profiles(path: str, base_url: str, count: int) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["Name", "Profile Link"])
+        for number in range(count):
+            writer.writerow([f"Bench User {number}", f"{base_url}/in/bench-user-{number}/"])
+
+
+# --- Modes ---
+
+def run_feed(manager, site, args, workdir) -> dict:
+    # Drive the step generator directly so the run ends after a fixed number of feed loads
+    steps = manager.feed_monitoring_steps(refresh_interval=0)
+    for _ in range(args.refreshes + 1):
+        next(steps)
+    steps.close()
+    return {"refreshes": args.refreshes}
+
+
+def run_hunt(manager, site, args, workdir) -> dict:
+    output = os.path.join(workdir, "hunt_results.csv")
+    manager.connection_hunting(f"{site.base_url}/search/results/people/?keywords=founder", output)
+    from table_io import count_rows
+    return {"profiles": count_rows(output) if os.path.exists(output) else 0}
+
+
+def run_warmup(manager, site, args, workdir) -> dict:
+    profiles = os.path.join(workdir, "warmup_profiles.csv")
+    write_profiles(profiles, site.base_url, args.profiles)
+    manager.warmup_profile_activity(profiles)
+    return {"profiles": args.profiles}
+
+
+def run_connect(manager, site, args, workdir) -> dict:
+    profiles = os.path.join(workdir, "connect_profiles.csv")
+    write_profiles(profiles, site.base_url, args.profiles)
+    manager.send_connection_requests_from_excel(profiles, "Hi {Name}, great to connect!")
+    return {"profiles": args.profiles}
+
+
+RUNNERS = {"feed": run_feed, "hunt": run_hunt, "warmup": run_warmup, "connect": run_connect}
+
+
+def summarize(mode: str, seconds: float, events: dict, pages: int, extra: dict) -> str:
+    """Return the throughput column for one mode."""
+    minutes = seconds / 60 if seconds else 1
+    if mode in ("feed", "warmup"):
+        return (f"{events.get('like', 0) / minutes:.1f} posts/min "
+                f"({events.get('like', 0)} liked, {events.get('comment', 0)} commented)")
+    if mode == "hunt":
+        profiles = extra.get("profiles", 0)
+        per_page = profiles / pages if pages else 0
+        return f"{profiles / seconds:.1f} profiles/s, {pages / seconds:.2f} pages/s ({per_page:.0f} profiles/page)"
+    return f"{events.get('invite', 0) / minutes:.1f} invites/min ({events.get('invite', 0)} sent)"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the automation modes against a fake LinkedIn site and a stub LLM")
+    parser.add_argument("--modes", default=",".join(MODES), help="Comma-separated modes: feed, hunt, warmup, connect")
+    parser.add_argument("--comment-source", choices=["gpt", "google"], default="gpt")
+    parser.add_argument("--llm-latency", type=float, default=0.8, help="Stub LLM seconds before the first token")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="Stub LLM seconds between streamed words")
+    parser.add_argument("--posts", type=int, default=10, help="Posts per feed load / activity page (and max_posts)")
+    parser.add_argument("--refreshes", type=int, default=3, help="Feed loads in the feed mode")
+    parser.add_argument("--pages", type=int, default=5, help="Result pages of the people search")
+    parser.add_argument("--profiles-per-page", type=int, default=10)
+    parser.add_argument("--profiles", type=int, default=5, help="Profiles visited by warmup and connect")
+    parser.add_argument("--pipeline-workers", type=int, default=4)
+    parser.add_argument("--pacing", choices=["none", "fast", "normal", "careful"], default="none",
+                        help="'none' removes the human-like delays to measure the code itself")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    parser.add_argument("--output", help="Also write the results as JSON to this file")
+    args = parser.parse_args()
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        parser.error(f"Unknown mode(s): {', '.join(unknown)}")
+    # Importing Monitor_Feed changes the working directory
+    output = os.path.abspath(args.output) if args.output else None
+
+    site = FakeLinkedIn(posts_per_page=args.posts, total_pages=args.pages, profiles_per_page=args.profiles_per_page).start()
+    llm = FakeLLM(latency=args.llm_latency, token_delay=args.token_delay).start()
+    os.environ["OPENAI_BASE_URL"] = f"{llm.base_url}/v1"
+    use_stub_gemini(llm.base_url)
+
+    import Monitor_Feed
+    from app_config import LOGGER
+
+    sampler = PeakRssSampler()
+    sampler.start()
+    results = []
+    with tempfile.TemporaryDirectory(prefix="linkedin-bench-") as workdir:
+        config = build_config(args, workdir)
+        config_file = os.path.join(workdir, "config")
+        gpt_manager = Monitor_Feed.GPTManager(config, config_file, LOGGER)
+        google_manager = Monitor_Feed.GoogleManager(config, config_file, LOGGER)
+        manager = Monitor_Feed.LinkedInManager(gpt_manager, google_manager, config, mode="headon" if args.headed else "headless",
+                                               user_data_dir=os.path.join(workdir, "chrome-profile"))
+        try:
+            started = time.perf_counter()
+            try:
+                manager.start_chrome()
+            except Exception as e:
+                sys.exit(f"Could not start Chrome: {e}")
+            redirect_driver(manager.driver, site.base_url)
+            print(f"Chrome started in {time.perf_counter() - started:.1f}s")
+            for mode in modes:
+                print(f"\n=== {mode} ===")
+                before, pages_before = site.counts(), site.page_views["search"]
+                sampler.reset()
+                started = time.perf_counter()
+                extra = RUNNERS[mode](manager, site, args, workdir)
+                seconds = time.perf_counter() - started
+                # Let the page deliver its last reports
+                time.sleep(0.5)
+                after = site.counts()
+                events = {kind: after.get(kind, 0) - before.get(kind, 0) for kind in after}
+                pages = site.page_views["search"] - pages_before
+                results.append({"mode": mode, "seconds": round(seconds, 2), "events": events, "search_pages": pages,
+                                "peak_rss_mb": round(sampler.peak / 2 ** 20, 1), "throughput": summarize(mode, seconds, events, pages, extra),
+                                **extra})
+        finally:
+            manager.kill_browser()
+            sampler.stop()
+            site.stop()
+            llm.stop()
+
+    print(f"\n{'mode':<8} {'seconds':>8} {'peak RSS':>10}  throughput")
+    for result in results:
+        print(f"{result['mode']:<8} {result['seconds']:>8.1f} {result['peak_rss_mb']:>8.0f}MB  {result['throughput']}")
+    print(f"Stub LLM requests: {dict(llm.requests)}")
+    if output:
+        with open(output, "w", encoding="utf-8") as file:
+            json.dump({"args": vars(args), "results": results, "llm_requests": dict(llm.requests)}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
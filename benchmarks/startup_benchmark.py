@@ -0,0 +1,57 @@
+
+"""
+Startup-time benchmark: how long a fresh Python process needs before each entry point can do useful work.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 5]
+
+Every scenario runs in a new interpreter so import caches do not carry over between runs.
+"eager imports" reproduces what every process used to pay before the lazy-loading split
+(everything Monitor_Feed used to import at module level).
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = [
+    ("dashboard config (app_config)", ["-c", "import app_config; app_config.load_config()"]),
+    ("eager imports (previous startup)", ["-c", "import selenium.webdriver, seleniumbase, cutie, openai, pandas, google.generativeai"]),
+    ("Monitor_Feed import", ["-c", "import Monitor_Feed"]),
+    ("CLI --help", ["Monitor_Feed.py", "--help"]),
+]
+
+
+def time_run(args: list) -> float:
+    """
+    Run the interpreter once with the given arguments.
+    Returns:
+        Wall-clock seconds, or None if the process failed (e.g. a package is not installed).
+    """
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable] + args, cwd=REPO_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    elapsed = time.perf_counter() - started
+    return elapsed if result.returncode == 0 else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure process startup time of each entry point")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per scenario (median is reported)")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<36} {'median':>9} {'min':>9}")
+    for name, scenario_args in SCENARIOS:
+        times = [time_run(scenario_args) for _ in range(args.runs)]
+        if any(t is None for t in times):
+            print(f"{name:<36} {'unavailable (missing dependency)':>20}")
+            continue
+        print(f"{name:<36} {statistics.median(times) * 1000:>7.0f}ms {min(times) * 1000:>7.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+
+import json
+import re
+
+from app_config import LOGGER
+
+
+# Appended to the static prompt when several posts are sent in one request
+BATCH_INSTRUCTIONS = (
+    "You will receive {count} LinkedIn posts, each starting with a line like 'Post 1:'. "
+    "Follow the instructions above for every post separately. "
+    'Reply with JSON only, exactly in this form: {{"comments": [{{"id": 1, "comment": "..."}}, ...]}} '
+    "with one entry per post, using the post numbers as ids."
+)
+
+
+def build_batch_prompt(static_prompt: str, descriptions: list) -> str:
+    """
+    Build one prompt asking for a comment on each of several posts.
+    The static prompt is sent once per batch instead of once per post.
+    Args:
+        static_prompt: The configured static prompt.
+        descriptions: Post texts, in order.
+    Returns:
+        The complete prompt text.
+    """
+    parts = [static_prompt.strip()] if static_prompt else []
+    parts.append(BATCH_INSTRUCTIONS.format(count=len(descriptions)))
+    for number, description in enumerate(descriptions, start=1):
+        parts.append(f"Post {number}:\n{description.strip()}")
+    return "\n\n".join(parts)
+
+
+def _load_json(text: str):
+    # Models often wrap JSON in ``` fences or add a sentence around it
+    text = re.sub(r"^```(?:json)?\s*|\s*```$", "", text.strip())
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    match = re.search(r"[\[{].*[\]}]", text, re.DOTALL)
+    if match:
+        try:
+            return json.loads(match.group(0))
+        except ValueError:
+            pass
+    return None
+
+
+def parse_batch_response(text: str, count: int) -> list:
+    """
+    Parse a batch reply into one comment per post.
+    Accepts {"comments": [...]} or a bare list, with items given as {"id", "comment"} objects or plain strings.
+    Either every item carries an id and the ids are exactly 1..count, or no item has an id and there is
+    one item per post, in order. Anything else (0-based, duplicate, missing or mixed ids) could attach a
+    comment to the wrong post, so the whole reply is rejected.
+    Args:
+        text: Raw model reply.
+        count: Number of posts that were sent.
+    Returns:
+        List of length `count` with the comment for each post, or None where it could not be parsed
+        (all None when the reply cannot be matched to the posts).
+    """
+    comments = [None] * count
+    data = _load_json(text or "")
+    if isinstance(data, dict):
+        data = data.get("comments")
+    if not isinstance(data, list) or len(data) != count:
+        return comments
+    with_id = [item for item in data if isinstance(item, dict) and "id" in item]
+    if with_id and len(with_id) != count:
+        return comments
+    if with_id:
+        try:
+            indexes = [int(item["id"]) - 1 for item in data]
+        except (TypeError, ValueError):
+            return comments
+        if sorted(indexes) != list(range(count)):
+            return comments
+    else:
+        indexes = range(count)
+    for index, item in zip(indexes, data):
+        comment = item.get("comment") if isinstance(item, dict) else item
+        if isinstance(comment, str) and comment.strip():
+            comments[index] = comment.strip()
+    return comments
+
+
+def generate_batched(descriptions: list, request_batch, generate_single, comment_cache=None, prompt: str = "",
+                     model: str = "", batch_size: int = 5, comment_limit=None) -> list:
+    """
+    Generate one comment per post, sending up to batch_size uncached posts per request.
+    Posts missing from a batch reply (or whose batch request failed) fall back to a single request.
+    Args:
+        descriptions: Post texts, in order.
+        request_batch: Callable sending one prompt for `count` posts to the provider, as request_batch(prompt, count),
+                       and returning the raw reply text.
+        generate_single: Callable generating (and caching) the comment for one post.
+        comment_cache: Optional CommentCache consulted and filled per post.
+        prompt: Static prompt (also part of the cache key).
+        model: Model name (part of the cache key).
+        batch_size: Maximum posts per request.
+        comment_limit: Optional CommentLimit every parsed comment is trimmed to before it is cached.
+    Returns:
+        List of comments, in the order of descriptions.
+    """
+    comments = [None] * len(descriptions)
+    pending = []
+    for index, description in enumerate(descriptions):
+        cached = comment_cache.get(description, prompt, model) if comment_cache is not None else None
+        if cached is not None:
+            comments[index] = cached
+        else:
+            pending.append(index)
+    batch_size = max(1, batch_size)
+    for start in range(0, len(pending), batch_size):
+        chunk = pending[start:start + batch_size]
+        if len(chunk) > 1:
+            try:
+                reply = request_batch(build_batch_prompt(prompt, [descriptions[index] for index in chunk]), len(chunk))
+                parsed = parse_batch_response(reply, len(chunk))
+                if comment_limit is not None:
+                    parsed = [comment_limit.trim(comment) if comment is not None else None for comment in parsed]
+            except Exception:
+                LOGGER.exception("Batch comment request failed, falling back to single requests")
+                parsed = [None] * len(chunk)
+            for index, comment in zip(chunk, parsed):
+                if comment is not None:
+                    comments[index] = comment
+                    if comment_cache is not None:
+                        comment_cache.put(descriptions[index], prompt, model, comment)
+        for index in chunk:
+            if comments[index] is None:
+                comments[index] = generate_single(descriptions[index])
+    return comments
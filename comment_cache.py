@@ -0,0 +1,148 @@
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+
+
+# --- CommentCache: on-disk cache of generated comments ---
+
+class CommentCache:
+
+    def __init__(self, path: str = "comment_cache.sqlite3", ttl_seconds: int = 7 * 24 * 3600, max_entries: int = 5000):
+        """
+        Initialize the comment cache backed by a SQLite file.
+        Args:
+            path: Path to the SQLite database file.
+            ttl_seconds: Age after which a cached comment is ignored and evicted (0 disables expiry).
+            max_entries: Maximum number of comments kept; the least recently used are evicted first.
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Comments are generated from worker threads too, so share one connection behind a lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS comments ("
+            "key TEXT PRIMARY KEY, comment TEXT NOT NULL, created REAL NOT NULL, used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS comments_used ON comments (used)")
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build a cache from the [CACHE] section of the config, or return None if caching is disabled.
+        Args:
+            config: RawConfigParser object for configuration.
+        Returns:
+            A CommentCache instance or None.
+        """
+        section = config["CACHE"] if config.has_section("CACHE") else {}
+        if str(section.get("enabled", "true")).lower() in ("0", "false", "no", "off"):
+            return None
+        try:
+            ttl_hours = float(section.get("ttl_hours", "168"))
+            max_entries = int(section.get("max_entries", "5000"))
+        except ValueError:
+            ttl_hours, max_entries = 168, 5000
+        path = section.get("path", "comment_cache.sqlite3")
+        try:
+            return cls(path, ttl_seconds=int(ttl_hours * 3600), max_entries=max_entries)
+        except sqlite3.Error as e:
+            print(f"Comment cache disabled, could not open {path}: {e}")
+            return None
+
+    @staticmethod
+    def make_key(description: str, prompt: str, model: str) -> str:
+        """
+        Build the cache key for a post. Whitespace and case differences in the post text are ignored.
+        Args:
+            description: The post text.
+            prompt: The static prompt used for generation.
+            model: The model name used for generation.
+        Returns:
+            Hex digest identifying (post text, prompt, model).
+        """
+        normalized = re.sub(r"\s+", " ", description or "").strip().casefold()
+        digest = hashlib.sha256()
+        for part in (normalized, prompt or "", model or ""):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, description: str, prompt: str, model: str):
+        """
+        Look up a cached comment.
+        Args:
+            description: The post text.
+            prompt: The static prompt used for generation.
+            model: The model name used for generation.
+        Returns:
+            The cached comment, or None on a miss or an expired entry.
+        """
+        key = self.make_key(description, prompt, model)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT comment, created FROM comments WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM comments WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE comments SET used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, description: str, prompt: str, model: str, comment: str) -> None:
+        """
+        Store a generated comment and evict expired or least recently used entries.
+        Args:
+            description: The post text.
+            prompt: The static prompt used for generation.
+            model: The model name used for generation.
+            comment: The generated comment.
+        """
+        key = self.make_key(description, prompt, model)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO comments (key, comment, created, used) VALUES (?, ?, ?, ?)",
+                (key, comment, now, now),
+            )
+            if self.ttl_seconds:
+                self._conn.execute("DELETE FROM comments WHERE created < ?", (now - self.ttl_seconds,))
+            if self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM comments WHERE key IN ("
+                    "SELECT key FROM comments ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """
+        Return hit/miss counters for this run and the number of stored comments.
+        """
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM comments").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "entries": size,
+            "path": os.path.abspath(self.path),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,177 @@
+
+import os
+import threading
+import time
+
+from api_clients import ApiStats, CommentLimit
+from prompt_templates import get_template
+from comment_batch import generate_batched
+from comment_cache import CommentCache
+from metrics import span, timed
+
+
+# --- LocalManager: on-device comment generation with llama.cpp ---
+
+class LocalManager:
+
+    def __init__(self, config, config_filename, logger, comment_cache: CommentCache = None):
+        """
+        Initialize the LocalManager, which generates comments with a GGUF model (e.g. gemma-3-1b-it) on the CPU
+        through llama-cpp-python (optional dependency: pip install llama-cpp-python).
+        The model is loaded on the first comment and then kept in memory. The static prompt is sent as the
+        system message, so llama.cpp reuses its evaluated tokens across posts instead of re-reading it.
+        Args:
+            config: RawConfigParser object for configuration ([LOCAL] section).
+            config_filename: Path to the config file.
+            logger: Logger object for logging errors/info.
+            comment_cache: Optional CommentCache consulted before running the model.
+        """
+        self._config = config
+        self._CONFIG_FILENAME = config_filename
+        self.LOGGER = logger
+        self.comment_cache = comment_cache
+        self._llm = None
+        # One llama.cpp context cannot run two generations at once
+        self._lock = threading.Lock()
+        # Comments are streamed and generation stops at the length limit ([API] comment_max_chars)
+        self.comment_limit = CommentLimit.from_config(config)
+        self.api_stats = ApiStats("Local model")
+        if not self._config.has_section("LOCAL"):
+            self._config.add_section("LOCAL")
+
+    def _setting(self, key: str, default: str) -> str:
+        return self._config["LOCAL"].get(key, default)
+
+    def _int_setting(self, key: str, default: int) -> int:
+        try:
+            return int(self._setting(key, str(default)))
+        except ValueError:
+            return default
+
+    def _static_prompt(self) -> str:
+        # Fall back to the Gemini prompt, which local Gemma models are closest to
+        prompt = self._setting("static prompt", "")
+        if not prompt and self._config.has_section("GOOGLE"):
+            prompt = self._config["GOOGLE"].get("static prompt", "")
+        return prompt or "Write a short, positive comment for this LinkedIn post:"
+
+    def model_name(self) -> str:
+        """Name of the configured model, used in cache keys."""
+        return os.path.basename(self._setting("model_path", "")) or self._setting("filename", "")
+
+    def _get_llm(self):
+        """
+        Load the model once ([LOCAL] model_path, or repo_id + filename to download it from Hugging Face).
+        Returns:
+            The llama_cpp.Llama instance.
+        """
+        if self._llm is not None:
+            return self._llm
+        try:
+            from llama_cpp import Llama
+        except ImportError:
+            raise RuntimeError("Local comments need llama-cpp-python: pip install llama-cpp-python")
+        options = {
+            "n_ctx": self._int_setting("n_ctx", 4096),
+            "n_threads": self._int_setting("n_threads", os.cpu_count() or 4),
+            "verbose": False,
+        }
+        model_path = self._setting("model_path", "")
+        if model_path:
+            if not os.path.exists(model_path):
+                raise RuntimeError(f"Local model not found: {model_path}")
+            self._llm = Llama(model_path=model_path, **options)
+        elif self._setting("repo_id", "") and self._setting("filename", ""):
+            self._llm = Llama.from_pretrained(repo_id=self._setting("repo_id", ""), filename=self._setting("filename", ""), **options)
+        else:
+            raise RuntimeError("Set [LOCAL] model_path to a .gguf model file.")
+        print(f"Loaded local model {self.model_name()}.")
+        return self._llm
+
+    def _complete(self, system_prompt: str, user_prompt: str, json_reply: bool = False, max_tokens: int = None) -> str:
+        """
+        Run one chat completion on the local model.
+        Args:
+            max_tokens: Output token cap (default: [LOCAL] max_tokens).
+        Returns:
+            The reply text.
+        """
+        with self._lock:
+            llm = self._get_llm()
+            options = {"max_tokens": max_tokens or self._int_setting("max_tokens", 256), "temperature": 0.7}
+            if json_reply:
+                options["response_format"] = {"type": "json_object"}
+            response = llm.create_chat_completion(
+                messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
+                **options,
+            )
+        return response["choices"][0]["message"]["content"].strip()
+
+    def _complete_comment(self, system_prompt: str, user_prompt: str) -> str:
+        """
+        Stream one comment and stop generating once the comment limit is reached.
+        Returns:
+            The comment text, trimmed to the limit.
+        """
+        max_tokens = self._int_setting("max_tokens", 256)
+        if self.comment_limit.max_tokens:
+            max_tokens = min(max_tokens, self.comment_limit.max_tokens)
+        with self._lock:
+            llm = self._get_llm()
+            started = time.monotonic()
+            chunks = llm.create_chat_completion(
+                messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
+                max_tokens=max_tokens, temperature=0.7, stream=True,
+            )
+            # Leaving the generator early stops llama.cpp from evaluating further tokens
+            return self.comment_limit.collect((chunk["choices"][0]["delta"].get("content") for chunk in chunks),
+                                              started, self.api_stats)
+
+    def generate_comment_for_description(self, description: str) -> str:
+        """
+        Generate a comment for a post description with the local model.
+        Args:
+            description: The post description or topic string.
+        Returns:
+            The generated comment as a string, or an error message if failed.
+        """
+        try:
+            prompt = self._static_prompt()
+            model_name = self.model_name()
+            if self.comment_cache is not None:
+                cached = self.comment_cache.get(description, prompt, model_name)
+                if cached is not None:
+                    return cached
+            # The fixed prefix is the system message, so llama.cpp reuses its evaluated tokens across posts
+            template = get_template(prompt, "LOCAL")
+            self.api_stats.record_usage(template.prompt_tokens(description))
+            with span("llm.comment", provider="local"):
+                if self.comment_limit.stream:
+                    comment = self._complete_comment(template.system, template.user_message(description))
+                else:
+                    comment = self.comment_limit.trim(self._complete(template.system, template.user_message(description)))
+            if self.comment_cache is not None and comment:
+                self.comment_cache.put(description, prompt, model_name, comment)
+            return comment
+        except Exception as e:
+            self.LOGGER.exception("Exception while generating local comment!")
+            return f"Error: {str(e)}"
+
+    @timed("llm.batch", provider="local")
+    def _request_batch(self, prompt: str, count: int) -> str:
+        # The batch prompt already contains the static prompt and the JSON instructions
+        return self._complete("You write LinkedIn comments and reply with JSON only.", prompt, json_reply=True,
+                              max_tokens=self.comment_limit.batch_max_tokens(count))
+
+    def generate_comments_for_descriptions(self, descriptions: list, batch_size: int = 5) -> list:
+        """
+        Generate comments for several posts, up to batch_size posts per model call.
+        Args:
+            descriptions: Post texts.
+            batch_size: Maximum posts per call.
+        Returns:
+            List of comments, in the order of descriptions.
+        """
+        return generate_batched(descriptions, self._request_batch, self.generate_comment_for_description,
+                                comment_cache=self.comment_cache, prompt=self._static_prompt(),
+                                model=self.model_name(), batch_size=batch_size, comment_limit=self.comment_limit)
@@ -0,0 +1,292 @@
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Histogram bucket upper bounds in seconds (Prometheus "le" values)
+BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+METRIC_NAME = "linkedin_stage_seconds"
+
+
+class Histogram:
+
+    def __init__(self, window: int = 1000):
+        """
+        Cumulative bucket counts, count and sum of one stage, plus recent samples for percentiles.
+        """
+        self.buckets = [0] * len(BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+        self.recent.append(seconds)
+        for index, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[index] += 1
+
+    def copy(self) -> "Histogram":
+        clone = Histogram(self.recent.maxlen)
+        clone.buckets = list(self.buckets)
+        clone.count, clone.sum, clone.max = self.count, self.sum, self.max
+        clone.recent.extend(self.recent)
+        return clone
+
+    def since(self, previous: "Histogram") -> "Histogram":
+        """
+        Return the observations made after `previous` (an earlier copy of this histogram) as a new histogram.
+        Percentiles and max come from the newest recent samples, so they are exact while the run has fewer than
+        `window` observations.
+        """
+        delta = Histogram(self.recent.maxlen)
+        delta.buckets = [now - before for now, before in zip(self.buckets, previous.buckets)]
+        delta.count = self.count - previous.count
+        delta.sum = self.sum - previous.sum
+        samples = list(self.recent)[-delta.count:] if delta.count > 0 else []
+        delta.recent.extend(samples)
+        delta.max = max(samples, default=0.0)
+        return delta
+
+    def percentile(self, pct: float) -> float:
+        samples = sorted(self.recent)
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+# --- MetricsRegistry: per-stage timings of the automation ---
+
+class MetricsRegistry:
+
+    def __init__(self):
+        """
+        Collect stage timings (navigation, scrolling, lookups, LLM generation, typing, submitting, ...)
+        as histograms keyed by stage name and labels. One registry is shared by the whole process (REGISTRY).
+        """
+        self.enabled = True
+        self.jsonl_path = ""
+        self._histograms = {}
+        # Copies of the histograms at the previous finish_run, so each report covers one run while the
+        # histograms themselves (and the Prometheus endpoint) stay cumulative for the whole process
+        self._reported = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    def configure(self, config) -> None:
+        """
+        Apply the optional [METRICS] section of the config: enabled (default true), jsonl_path (histograms are
+        appended there at the end of each run) and prometheus_port (serve /metrics for scraping; 0 disables).
+        Args:
+            config: RawConfigParser object for configuration (may be None).
+        """
+        section = config["METRICS"] if config is not None and config.has_section("METRICS") else {}
+        self.enabled = str(section.get("enabled", "true")).lower() not in ("0", "false", "no", "off")
+        self.jsonl_path = section.get("jsonl_path", "")
+        try:
+            port = int(section.get("prometheus_port", "0"))
+        except ValueError:
+            port = 0
+        if self.enabled and port and self._server is None:
+            self.serve_prometheus(port, section.get("prometheus_host", "127.0.0.1"))
+
+    def observe(self, stage: str, seconds: float, **labels) -> None:
+        """
+        Record one duration.
+        Args:
+            stage: Stage name, e.g. 'post.like' or 'llm.comment'.
+            seconds: Duration in seconds.
+            labels: Extra labels, e.g. provider='gpt'.
+        """
+        if not self.enabled:
+            return
+        key = (stage, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def span(self, stage: str, **labels):
+        """
+        Time the enclosed block as one observation of `stage` (also recorded when the block raises).
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started, **labels)
+
+    def _snapshot(self) -> list:
+        with self._lock:
+            return [(stage, dict(labels), histogram.copy()) for (stage, labels), histogram in sorted(self._histograms.items())]
+
+    def _run_snapshot(self) -> list:
+        """
+        Return what was observed since the previous call (per stage, as histograms of the difference).
+        """
+        with self._lock:
+            current = {key: histogram.copy() for key, histogram in self._histograms.items()}
+            previous, self._reported = self._reported, current
+        snapshot = []
+        for (stage, labels), histogram in sorted(current.items()):
+            before = previous.get((stage, labels))
+            if before is not None:
+                histogram = histogram.since(before)
+            if histogram.count:
+                snapshot.append((stage, dict(labels), histogram))
+        return snapshot
+
+    def render_prometheus(self) -> str:
+        """
+        Return all histograms in the Prometheus text exposition format.
+        """
+        lines = [f"# HELP {METRIC_NAME} Duration of automation stages.", f"# TYPE {METRIC_NAME} histogram"]
+        for stage, labels, histogram in self._snapshot():
+            label_text = ",".join(f'{key}="{value}"' for key, value in [("stage", stage)] + sorted(labels.items()))
+            for bound, count in zip(BUCKETS, histogram.buckets):
+                lines.append(f'{METRIC_NAME}_bucket{{{label_text},le="{bound}"}} {count}')
+            lines.append(f'{METRIC_NAME}_bucket{{{label_text},le="+Inf"}} {histogram.count}')
+            lines.append(f"{METRIC_NAME}_sum{{{label_text}}} {histogram.sum:.6f}")
+            lines.append(f"{METRIC_NAME}_count{{{label_text}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def serve_prometheus(self, port: int, host: str = "127.0.0.1") -> bool:
+        """
+        Serve render_prometheus() at http://host:port/metrics from a background thread.
+        Returns:
+            True if the endpoint is running.
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        try:
+            self._server = ThreadingHTTPServer((host, port), Handler)
+        except OSError as e:
+            # Parallel workers share the config; only the first one can bind the port
+            print(f"Metrics endpoint not started on port {port}: {e}")
+            return False
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics", daemon=True).start()
+        print(f"Metrics available at http://{host}:{port}/metrics")
+        return True
+
+    def export_jsonl(self, path: str = None, snapshot: list = None, **fields) -> int:
+        """
+        Append one JSON line per histogram (stage, labels, count, sum, p50, p95, max, cumulative buckets).
+        Args:
+            path: Output file (default: [METRICS] jsonl_path).
+            snapshot: Histograms to write (default: the current ones).
+            fields: Extra fields written on every line.
+        Returns:
+            Number of lines written.
+        """
+        path = path or self.jsonl_path
+        snapshot = self._snapshot() if snapshot is None else snapshot
+        if not path or not snapshot:
+            return 0
+        now = time.time()
+        with open(path, "a", encoding="utf-8") as file:
+            for stage, labels, histogram in snapshot:
+                record = dict(fields, time=now, stage=stage, labels=labels, count=histogram.count,
+                              sum=round(histogram.sum, 6), p50=round(histogram.percentile(50), 6),
+                              p95=round(histogram.percentile(95), 6), max=round(histogram.max, 6),
+                              buckets=dict(zip([str(bound) for bound in BUCKETS] + ["+Inf"], histogram.buckets + [histogram.count])))
+                file.write(json.dumps(record) + "\n")
+        return len(snapshot)
+
+    def print_summary(self, snapshot: list = None) -> None:
+        """
+        Print count, total, mean, p50 and p95 per stage, slowest total first.
+        Args:
+            snapshot: Histograms to summarize (default: the current ones).
+        """
+        snapshot = self._snapshot() if snapshot is None else snapshot
+        if not snapshot:
+            return
+        print("Stage timings:")
+        print(f"  {'stage':<32} {'count':>6} {'total':>9} {'mean':>8} {'p50':>8} {'p95':>8}")
+        for stage, labels, histogram in sorted(snapshot, key=lambda item: -item[2].sum):
+            name = stage + "".join(f" {key}={value}" for key, value in sorted(labels.items()))
+            print(f"  {name:<32} {histogram.count:>6} {histogram.sum:>8.1f}s {histogram.sum / histogram.count:>7.2f}s "
+                  f"{histogram.percentile(50):>7.2f}s {histogram.percentile(95):>7.2f}s")
+
+    def finish_run(self, **fields) -> None:
+        """
+        End-of-run reporting: print the summary and append the histograms to the JSONL file if configured.
+        Each report only covers what was observed since the previous one (e.g. one daemon job), while the
+        Prometheus endpoint keeps serving the cumulative histograms of the process.
+        """
+        snapshot = self._run_snapshot()
+        if not snapshot:
+            return
+        self.print_summary(snapshot)
+        try:
+            written = self.export_jsonl(snapshot=snapshot, **fields)
+            if written:
+                print(f"Stage timings appended to {self.jsonl_path}.")
+        except OSError as e:
+            print(f"Could not write stage timings to {self.jsonl_path}: {e}")
+
+
+# Shared by the whole process
+REGISTRY = MetricsRegistry()
+
+
+class Stopwatch:
+
+    def __init__(self, registry: MetricsRegistry = None):
+        """
+        Time consecutive stages of one flow: each lap() records the time since the previous lap (or start).
+        """
+        self._registry = registry or REGISTRY
+        self._last = time.perf_counter()
+
+    def lap(self, stage: str, **labels) -> float:
+        """Record the time since the last lap as one observation of `stage` and return it."""
+        now = time.perf_counter()
+        elapsed = now - self._last
+        self._registry.observe(stage, elapsed, **labels)
+        self._last = now
+        return elapsed
+
+    def restart(self) -> None:
+        """Start the next lap now (e.g. to leave a human-like pause out of the next stage)."""
+        self._last = time.perf_counter()
+
+
+def span(stage: str, **labels):
+    """Time a block on the shared registry: `with span('post.like'): ...`."""
+    return REGISTRY.span(stage, **labels)
+
+
+def timed(stage: str, **labels):
+    """Decorator timing every call of a function as one observation of `stage`."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with REGISTRY.span(stage, **labels):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,221 @@
+
+import math
+import random
+import time
+from collections import defaultdict
+
+
+# Median human delay in seconds for each kind of pause
+DEFAULT_DELAYS = {
+    "action": 1.5,         # after a click (like, connect, send)
+    "scroll": 1.2,         # after scrolling something into view
+    "typing": 1.0,         # before/after typing text
+    "read": 4.0,           # "reading" a freshly loaded page
+    "between_items": 3.0,  # between two posts / profiles
+}
+
+# Per-mode scale of the medians, jitter spread (lognormal sigma) and cap on a single pause
+PACING_MODES = {
+    "fast": {"scale": 0.4, "sigma": 0.25, "max_delay": 3.0},
+    "normal": {"scale": 1.0, "sigma": 0.35, "max_delay": 8.0},
+    "careful": {"scale": 2.0, "sigma": 0.45, "max_delay": 20.0},
+}
+
+# Resources loaded so far; used to detect when the page stops fetching
+_RESOURCE_COUNT_JS = "return window.performance ? performance.getEntriesByType('resource').length : 0;"
+
+
+# --- Pacer: readiness waits and human-like delays, with time accounting ---
+
+class Pacer:
+
+    def __init__(self, mode: str = "normal", delays: dict = None, seed: int = None):
+        """
+        Initialize the pacer.
+        Args:
+            mode: One of PACING_MODES ('fast', 'normal', 'careful').
+            delays: Optional overrides of DEFAULT_DELAYS medians (seconds).
+            seed: Optional random seed for reproducible delays.
+        """
+        if mode not in PACING_MODES:
+            print(f"Unknown pacing mode '{mode}', using 'normal'.")
+            mode = "normal"
+        self.mode = mode
+        self.delays = dict(DEFAULT_DELAYS)
+        self.delays.update(delays or {})
+        self._random = random.Random(seed)
+        self.totals = defaultdict(float)
+        self.counts = defaultdict(int)
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build a pacer from the optional [PACING] section of the config
+        (mode, and delay_<kind> overrides such as delay_action = 2).
+        Args:
+            config: RawConfigParser object for configuration (may be None).
+        Returns:
+            A Pacer instance.
+        """
+        if config is None or not config.has_section("PACING"):
+            return cls()
+        section = config["PACING"]
+        delays = {}
+        for kind in DEFAULT_DELAYS:
+            value = section.get(f"delay_{kind}")
+            if value:
+                try:
+                    delays[kind] = float(value)
+                except ValueError:
+                    print(f"Ignoring invalid pacing value delay_{kind} = {value}")
+        return cls(section.get("mode", "normal"), delays)
+
+    def _record(self, category: str, started: float) -> None:
+        self.totals[category] += time.monotonic() - started
+        self.counts[category] += 1
+
+    # --- Human-like delays ---
+
+    def pause(self, kind: str = "action") -> float:
+        """
+        Sleep for a jittered, human-like delay of the given kind.
+        Args:
+            kind: One of DEFAULT_DELAYS keys.
+        Returns:
+            The number of seconds slept.
+        """
+        settings = PACING_MODES[self.mode]
+        median = self.delays.get(kind, DEFAULT_DELAYS["action"]) * settings["scale"]
+        delay = median * math.exp(self._random.gauss(0, settings["sigma"]))
+        delay = min(max(delay, 0.0), settings["max_delay"])
+        started = time.monotonic()
+        time.sleep(delay)
+        self._record(f"delay:{kind}", started)
+        return delay
+
+    def idle(self, seconds: float, kind: str = "interval", stop_event=None) -> None:
+        """
+        Sleep for a fixed, user-configured interval (e.g. the feed refresh interval), tracked separately.
+        Args:
+            seconds: Number of seconds to wait.
+            kind: Label used in the report.
+            stop_event: Optional threading.Event that ends the wait early when set.
+        """
+        started = time.monotonic()
+        if stop_event is not None:
+            stop_event.wait(max(0, seconds))
+        else:
+            time.sleep(max(0, seconds))
+        self._record(f"idle:{kind}", started)
+
+    # --- Readiness waits ---
+
+    def wait_dom_ready(self, driver, timeout: float = 15) -> bool:
+        """
+        Wait until document.readyState is 'complete'.
+        Returns:
+            True if the page became ready before the timeout.
+        """
+        # selenium's wait helpers load the whole WebDriver stack, so they are imported on first use
+        from selenium.webdriver.support.wait import WebDriverWait
+        started = time.monotonic()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+            return True
+        except Exception:
+            return False
+        finally:
+            self._record("wait:dom_ready", started)
+
+    def wait_visible(self, context, locator: tuple, timeout: float = 10):
+        """
+        Wait until an element is visible.
+        Args:
+            context: WebDriver or WebElement to search from.
+            locator: (By, selector) tuple.
+            timeout: Maximum seconds to wait.
+        Returns:
+            The visible WebElement, or None on timeout.
+        """
+        from selenium.webdriver.support import expected_conditions as ec
+        from selenium.webdriver.support.wait import WebDriverWait
+        started = time.monotonic()
+        try:
+            return WebDriverWait(context, timeout, poll_frequency=0.1).until(ec.visibility_of_element_located(locator))
+        except Exception:
+            return None
+        finally:
+            self._record("wait:visible", started)
+
+    def wait_present(self, context, locator: tuple, timeout: float = 10):
+        """
+        Wait until at least one element matching the locator is in the DOM.
+        Args:
+            context: WebDriver or WebElement to search from.
+            locator: (By, selector) tuple.
+            timeout: Maximum seconds to wait.
+        Returns:
+            The first matching WebElement, or None on timeout.
+        """
+        from selenium.webdriver.support import expected_conditions as ec
+        from selenium.webdriver.support.wait import WebDriverWait
+        started = time.monotonic()
+        try:
+            return WebDriverWait(context, timeout, poll_frequency=0.1).until(ec.presence_of_element_located(locator))
+        except Exception:
+            return None
+        finally:
+            self._record("wait:present", started)
+
+    def wait_network_idle(self, driver, idle_time: float = 0.75, timeout: float = 10) -> bool:
+        """
+        Wait until the page has not started loading a new resource for idle_time seconds.
+        Returns:
+            True if the network went idle before the timeout.
+        """
+        started = time.monotonic()
+        try:
+            last_count = None
+            last_change = started
+            while time.monotonic() - started < timeout:
+                try:
+                    count = driver.execute_script(_RESOURCE_COUNT_JS)
+                except Exception:
+                    return False
+                now = time.monotonic()
+                if count != last_count:
+                    last_count = count
+                    last_change = now
+                elif now - last_change >= idle_time:
+                    return True
+                time.sleep(0.1)
+            return False
+        finally:
+            self._record("wait:network_idle", started)
+
+    # --- Reporting ---
+
+    def report(self) -> dict:
+        """
+        Return total seconds and call counts per category (wait:*, delay:*, idle:*).
+        """
+        return {category: {"seconds": round(self.totals[category], 2), "count": self.counts[category]}
+                for category in sorted(self.totals)}
+
+    def print_report(self) -> None:
+        """
+        Print where time went during this run, split into readiness waits and deliberate delays.
+        """
+        if not self.totals:
+            return
+        print(f"\n--- Pacing report (mode: {self.mode}) ---")
+        for group in ("wait", "delay", "idle"):
+            categories = [c for c in sorted(self.totals) if c.startswith(group + ":")]
+            if not categories:
+                continue
+            subtotal = sum(self.totals[c] for c in categories)
+            print(f"{group}: {subtotal:.1f}s")
+            for category in categories:
+                print(f"  {category.split(':', 1)[1]}: {self.totals[category]:.1f}s over {self.counts[category]} calls")
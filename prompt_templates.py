@@ -0,0 +1,123 @@
+
+import threading
+
+from app_config import LOGGER
+
+
+# Marks where the post goes in a static prompt; without it the post follows the prompt
+POST_PLACEHOLDER = "{post}"
+
+_templates = {}
+_templates_lock = threading.Lock()
+_encoding = None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count prompt tokens with tiktoken if it is installed, otherwise estimate about 4 characters per token.
+    """
+    global _encoding
+    if not text:
+        return 0
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _encoding = False
+    if _encoding:
+        return len(_encoding.encode(text))
+    return max(1, round(len(text) / 4))
+
+
+class PromptTemplate:
+
+    def __init__(self, system: str, lead: str = "", tail: str = "", name: str = ""):
+        """
+        A static prompt split into a fixed system prefix and the per-post part.
+        The prefix is identical for every post, so providers can reuse it (OpenAI prefix caching,
+        Gemini implicit caching, llama.cpp's evaluated system tokens) instead of processing it each time.
+        Args:
+            system: Fixed instructions sent first.
+            lead: Text placed right before the post (e.g. "Linkedin Post:").
+            tail: Text placed after the post.
+            name: Config section the prompt came from, used in messages.
+        """
+        self.system = system
+        self.lead = lead
+        self.tail = tail
+        self.name = name
+        self.system_tokens = count_tokens(system)
+
+    @classmethod
+    def compile(cls, text: str, name: str = ""):
+        """
+        Validate a static prompt and split it. A {post} placeholder marks where the post goes; without one,
+        the post follows the prompt, and a short closing label line such as "Linkedin Post:" moves to the per-post part.
+        Args:
+            text: The static prompt.
+            name: Config section the prompt came from.
+        Returns:
+            A PromptTemplate.
+        Raises:
+            ValueError: If the prompt is empty or contains {post} more than once.
+        """
+        text = (text or "").strip()
+        if not text:
+            raise ValueError(f"The [{name}] static prompt is empty.")
+        placeholders = text.count(POST_PLACEHOLDER)
+        if placeholders > 1:
+            raise ValueError(f"The [{name}] static prompt contains {POST_PLACEHOLDER} {placeholders} times; use it once.")
+        if placeholders == 1:
+            before, tail = text.split(POST_PLACEHOLDER)
+        else:
+            before, tail = text, ""
+        lines = before.rstrip().splitlines()
+        lead = ""
+        if len(lines) > 1 and lines[-1].strip().endswith(":") and len(lines[-1].strip()) <= 40:
+            before, lead = "\n".join(lines[:-1]), lines[-1].strip()
+        if not before.strip():
+            # Nothing but the post label: there is no fixed prefix to split off
+            before, lead = lead, ""
+        return cls(before.strip(), lead, tail.strip(), name)
+
+    def user_message(self, post: str) -> str:
+        """The per-post part: label, post text and any text after the post."""
+        return "\n".join(part for part in (self.lead, post, self.tail) if part)
+
+    def messages(self, post: str) -> list:
+        """Chat messages with the fixed prefix as the system message."""
+        return [{"role": "system", "content": self.system}, {"role": "user", "content": self.user_message(post)}]
+
+    def full_text(self, post: str) -> str:
+        """One prompt string, prefix first, for APIs or models without system instructions."""
+        return f"{self.system}\n{self.user_message(post)}"
+
+    def prompt_tokens(self, post: str) -> int:
+        """Prompt tokens sent for one post (prefix plus per-post part)."""
+        return self.system_tokens + count_tokens(self.user_message(post))
+
+
+def get_template(text: str, name: str = "") -> PromptTemplate:
+    """
+    Return the compiled template for a static prompt, compiling and validating each distinct prompt only once.
+    Args:
+        text: The static prompt from the config.
+        name: Config section the prompt came from.
+    Returns:
+        A PromptTemplate.
+    Raises:
+        ValueError: If the prompt is invalid (see PromptTemplate.compile).
+    """
+    key = (name, text)
+    with _templates_lock:
+        template = _templates.get(key)
+    if template is None:
+        template = PromptTemplate.compile(text, name)
+        LOGGER.info("Prompt template [%s]: fixed prefix ~%d tokens", name, template.system_tokens)
+        with _templates_lock:
+            if len(_templates) > 32:
+                # Prompts edited many times in one session; old versions are no longer used
+                _templates.clear()
+            _templates[key] = template
+    return template
@@ -0,0 +1,277 @@
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from app_config import LOGGER
+
+
+def is_usable_comment(comment) -> bool:
+    """
+    False for empty replies and the "Error: ..." strings the managers return on failure,
+    so they are never typed into LinkedIn.
+    """
+    return isinstance(comment, str) and bool(comment.strip()) and not comment.startswith("Error:")
+
+
+# --- Per-provider health: rolling latency/error window and a circuit breaker ---
+
+class ProviderHealth:
+
+    def __init__(self, window: int = 50, failure_threshold: int = 3, cooldown_seconds: float = 120):
+        """
+        Track recent calls of one provider.
+        Args:
+            window: Number of recent calls kept for latency percentiles and the error rate.
+            failure_threshold: Consecutive failures that open the circuit breaker.
+            cooldown_seconds: How long an open breaker rejects calls before one trial call is allowed.
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.opened_at = None
+        # Set while the single half-open trial call is running
+        self.trial_running = False
+        self.calls = 0
+        self.failures = 0
+        self.hedges_won = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, ok: bool) -> None:
+        with self._lock:
+            self.trial_running = False
+            self.calls += 1
+            self.outcomes.append(ok)
+            if ok:
+                self.latencies.append(seconds)
+                self.consecutive_failures = 0
+                self.opened_at = None
+            else:
+                self.failures += 1
+                self.consecutive_failures += 1
+                if self.consecutive_failures >= self.failure_threshold:
+                    # (Re)open the breaker; a failed half-open trial starts a new cooldown
+                    self.opened_at = time.monotonic()
+
+    def state(self) -> str:
+        """
+        'closed', 'open', or 'half-open' once the cooldown has passed (one trial call may run).
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            return "half-open" if time.monotonic() - self.opened_at >= self.cooldown_seconds else "open"
+
+    def available(self) -> bool:
+        """
+        True if a call may be attempted: the breaker is closed, or half-open with no trial call running.
+        Callers must still win try_acquire() before calling.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            return not self.trial_running and time.monotonic() - self.opened_at >= self.cooldown_seconds
+
+    def try_acquire(self) -> bool:
+        """
+        Claim permission for one call. Always granted while the breaker is closed; when half-open, only the
+        first caller gets the trial call and everyone else is treated as if the breaker were still open,
+        until the trial's result is recorded.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self.trial_running or time.monotonic() - self.opened_at < self.cooldown_seconds:
+                return False
+            self.trial_running = True
+            return True
+
+    def percentile(self, pct: float):
+        """
+        Return the pct-th percentile of recent successful latencies, or None without enough samples.
+        """
+        with self._lock:
+            samples = sorted(self.latencies)
+        if len(samples) < 5:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+    def error_rate(self) -> float:
+        with self._lock:
+            return (self.outcomes.count(False) / len(self.outcomes)) if self.outcomes else 0.0
+
+
+# --- ProviderRouter: failover and latency hedging between comment providers ---
+
+class ProviderRouter:
+
+    def __init__(self, providers: dict, hedge: bool = True, hedge_percentile: float = 90,
+                 hedge_after_seconds: float = 10, min_hedge_seconds: float = 2,
+                 failure_threshold: int = 3, cooldown_seconds: float = 120, workers_per_provider: int = 4):
+        """
+        Route comment generation across providers (GPTManager, GoogleManager, LocalManager).
+        The preferred provider is called first; if it has not answered by its hedge_percentile latency
+        (hedge_after_seconds until enough calls were seen), the same post is also sent to the next healthy
+        provider and the first usable comment wins. Failures count towards a per-provider circuit breaker,
+        and failed or empty replies move on to the next provider instead of being returned.
+        Args:
+            providers: {name: manager} in failover order; each has generate_comment_for_description.
+            hedge: Send hedged second requests (otherwise providers are only tried one after another).
+            hedge_percentile: Latency percentile of the preferred provider after which to hedge.
+            hedge_after_seconds: Hedge delay used before enough latencies are known.
+            min_hedge_seconds: Lower bound of the hedge delay (cache hits make latencies look small).
+            failure_threshold: Consecutive failures that open a provider's breaker.
+            cooldown_seconds: Breaker cooldown.
+            workers_per_provider: Concurrent calls per provider (the number of threads generating comments);
+                                  every provider has its own pool, so abandoned slow calls to one provider
+                                  never delay hedges to another.
+        """
+        self.providers = dict(providers)
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_after_seconds = hedge_after_seconds
+        self.min_hedge_seconds = min_hedge_seconds
+        self.workers_per_provider = max(1, workers_per_provider)
+        self.health = {name: ProviderHealth(failure_threshold=failure_threshold, cooldown_seconds=cooldown_seconds)
+                       for name in self.providers}
+        self._executors = {name: self._new_executor(name) for name in self.providers}
+
+    def _new_executor(self, name: str) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=self.workers_per_provider, thread_name_prefix=f"provider-{name}")
+
+    @classmethod
+    def from_config(cls, config, providers: dict, workers_per_provider: int = 4):
+        """
+        Build a router from the optional [ROUTER] section of the config
+        (hedge, hedge_percentile, hedge_after_seconds, breaker_failures, breaker_cooldown).
+        Args:
+            config: RawConfigParser object for configuration (may be None).
+            providers: {name: manager} of the configured providers.
+            workers_per_provider: Concurrent calls per provider.
+        Returns:
+            A ProviderRouter instance.
+        """
+        section = config["ROUTER"] if config is not None and config.has_section("ROUTER") else {}
+        try:
+            return cls(providers,
+                       hedge=str(section.get("hedge", "true")).lower() not in ("0", "false", "no", "off"),
+                       hedge_percentile=float(section.get("hedge_percentile", "90")),
+                       hedge_after_seconds=float(section.get("hedge_after_seconds", "10")),
+                       failure_threshold=int(section.get("breaker_failures", "3")),
+                       cooldown_seconds=float(section.get("breaker_cooldown", "120")),
+                       workers_per_provider=workers_per_provider)
+        except ValueError:
+            print("Invalid [ROUTER] settings, using defaults.")
+            return cls(providers, workers_per_provider=workers_per_provider)
+
+    def add_provider(self, name: str, manager) -> None:
+        """
+        Route to one more provider (e.g. a source selected for a single job); no-op if it is already routed.
+        """
+        if name in self.providers:
+            return
+        self.health[name] = ProviderHealth(failure_threshold=self.failure_threshold, cooldown_seconds=self.cooldown_seconds)
+        self._executors[name] = self._new_executor(name)
+        # Replaced rather than updated, so threads iterating the providers are not disturbed
+        self.providers = {**self.providers, name: manager}
+
+    def _order(self, preferred: str) -> list:
+        """Healthy providers, preferred first."""
+        names = ([preferred] if preferred in self.providers else []) + [name for name in self.providers if name != preferred]
+        return [name for name in names if self.health[name].available()]
+
+    def _call(self, name: str, description: str):
+        started = time.monotonic()
+        try:
+            comment = self.providers[name].generate_comment_for_description(description)
+        except Exception:
+            LOGGER.exception("Comment provider %s failed", name)
+            comment = None
+        ok = is_usable_comment(comment)
+        self.health[name].record(time.monotonic() - started, ok)
+        return comment if ok else None
+
+    def _hedge_delay(self, name: str) -> float:
+        latency = self.health[name].percentile(self.hedge_percentile)
+        return max(self.min_hedge_seconds, latency if latency is not None else self.hedge_after_seconds)
+
+    def generate_comment(self, description: str, preferred: str):
+        """
+        Generate a comment with failover and hedging.
+        Args:
+            description: Post text.
+            preferred: Name of the provider to try first (the configured comment_source).
+        Returns:
+            A usable comment, or None if every available provider failed.
+        """
+        candidates = self._order(preferred)
+        if not candidates:
+            print("All comment providers are unavailable (circuit breakers open).")
+            return None
+        running = {}
+        # The next provider is added once the preferred one's usual latency has passed (or right away when
+        # every running request failed); the deadline is fixed when a request starts, not on every wakeup
+        delay = self._hedge_delay(candidates[0])
+        hedge_at = None
+        while candidates or running:
+            now = time.monotonic()
+            if candidates and (not running or (self.hedge and now >= hedge_at)):
+                name = candidates.pop(0)
+                if not self.health[name].try_acquire():
+                    # Another caller holds the half-open trial of this provider
+                    continue
+                running[self._executors[name].submit(self._call, name, description)] = name
+                hedge_at = now + delay
+            timeout = max(0.0, hedge_at - time.monotonic()) if self.hedge and candidates else None
+            done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                comment = future.result()
+                if comment is not None:
+                    if name != preferred:
+                        self.health[name].hedges_won += 1
+                    # The slower request keeps running in the background; its result is discarded
+                    return comment
+        return None
+
+    def generate_comments(self, descriptions: list, preferred: str, batch_size: int = 5) -> list:
+        """
+        Generate comments for several posts with the preferred provider's batch request, then route
+        every post without a usable comment through generate_comment.
+        Returns:
+            List of comments (None where no provider produced one), in order.
+        """
+        comments = [None] * len(descriptions)
+        if preferred in self.providers and self.health[preferred].try_acquire():
+            started = time.monotonic()
+            try:
+                comments = self.providers[preferred].generate_comments_for_descriptions(descriptions, batch_size=batch_size)
+            except Exception:
+                LOGGER.exception("Batch comment generation with %s failed", preferred)
+            usable = [is_usable_comment(comment) for comment in comments]
+            # Batch latency is not comparable to single calls, so only the outcome is recorded
+            self.health[preferred].record(time.monotonic() - started, any(usable))
+            comments = [comment if ok else None for comment, ok in zip(comments, usable)]
+        return [comment if comment is not None else self.generate_comment(description, preferred)
+                for comment, description in zip(comments, descriptions)]
+
+    def print_report(self) -> None:
+        """
+        Print calls, error rate, p50/p90 latency and breaker state per provider.
+        """
+        for name, health in self.health.items():
+            if not health.calls:
+                continue
+            p50, p90 = health.percentile(50), health.percentile(90)
+            latency = f"p50 {p50:.1f}s, p90 {p90:.1f}s" if p50 is not None else "few samples"
+            print(f"Provider {name}: {health.calls} calls, {health.error_rate():.0%} recent errors, {latency}, "
+                  f"{health.hedges_won} won as fallback, breaker {health.state()}.")
+
+    def shutdown(self) -> None:
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,119 @@
+
+import re
+import sqlite3
+import time
+from urllib.parse import urlsplit
+
+
+def normalize_profile_url(url: str) -> str:
+    """
+    Normalize a LinkedIn profile URL so the same person always gives the same key.
+    'https://www.linkedin.com/in/Jane-Doe-123/?miniProfileUrn=...' -> 'linkedin.com/in/jane-doe-123'
+    Args:
+        url: Profile URL as found on the page.
+    Returns:
+        Normalized key, or '' if the URL is empty.
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    host = parts.netloc.lower()
+    host = re.sub(r"^(www\.|[a-z]{2}\.)", "", host)
+    path = parts.path.rstrip("/").lower()
+    match = re.match(r"(/in/[^/]+)", path)
+    if match:
+        path = match.group(1)
+    return f"{host}{path}"
+
+
+# --- HuntResultsStore: deduplicated, resumable connection hunting results ---
+
+class HuntResultsStore:
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the SQLite results store used by connection_hunting.
+        Profiles are keyed by normalized profile URL, so duplicate checks are a single index lookup,
+        and the last completed page of every search is recorded for automatic resume.
+        Args:
+            path: Path to the SQLite database file.
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS profiles ("
+            " url_key TEXT PRIMARY KEY, name TEXT, profile_link TEXT, headline TEXT, location TEXT,"
+            " current_position TEXT, search_key TEXT, page INTEGER, added REAL);"
+            "CREATE TABLE IF NOT EXISTS progress ("
+            " search_key TEXT PRIMARY KEY, last_page INTEGER NOT NULL, total_pages INTEGER, updated REAL);"
+        )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def __contains__(self, profile_url) -> bool:
+        key = normalize_profile_url(profile_url)
+        if not key:
+            return False
+        return self._conn.execute("SELECT 1 FROM profiles WHERE url_key = ?", (key,)).fetchone() is not None
+
+    def add_profiles(self, profiles: list, search_key: str = "", page: int = 0, commit: bool = True) -> list:
+        """
+        Insert profiles whose URL is not stored yet.
+        Args:
+            profiles: List of dicts with Name, Profile Link, Headline, Location and Current Position.
+            search_key: Identifies the search the profiles came from.
+            page: Result page number.
+            commit: Commit right away; otherwise the caller calls commit() or rollback() later.
+        Returns:
+            The profiles that were new (profiles without a link are skipped).
+        """
+        new_profiles = []
+        now = time.time()
+        for profile in profiles:
+            key = normalize_profile_url(profile.get("Profile Link", ""))
+            if not key:
+                continue
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO profiles (url_key, name, profile_link, headline, location, current_position,"
+                " search_key, page, added) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, profile.get("Name", ""), profile.get("Profile Link", ""), profile.get("Headline", ""),
+                 profile.get("Location", ""), profile.get("Current Position", ""), search_key, page, now),
+            )
+            if cursor.rowcount:
+                new_profiles.append(profile)
+        if commit:
+            self._conn.commit()
+        return new_profiles
+
+    def mark_page_done(self, search_key: str, page: int, total_pages: int = None, commit: bool = True) -> None:
+        """
+        Record that a result page of a search has been fully processed.
+        """
+        self._conn.execute(
+            "INSERT INTO progress (search_key, last_page, total_pages, updated) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(search_key) DO UPDATE SET last_page = excluded.last_page, "
+            "total_pages = excluded.total_pages, updated = excluded.updated",
+            (search_key, page, total_pages, time.time()),
+        )
+        if commit:
+            self._conn.commit()
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def rollback(self) -> None:
+        """Discard profiles and page markers added with commit=False."""
+        self._conn.rollback()
+
+    def last_completed_page(self, search_key: str) -> int:
+        """
+        Return the last fully processed page of a search (0 if it was never started).
+        """
+        row = self._conn.execute("SELECT last_page FROM progress WHERE search_key = ?", (search_key,)).fetchone()
+        return row[0] if row else 0
+
+    def close(self) -> None:
+        self._conn.close()
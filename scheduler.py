@@ -0,0 +1,374 @@
+
+import itertools
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+
+# Action kinds with shared limits, and their default (per hour, per day) budgets; 0 means unlimited
+DEFAULT_BUDGETS = {
+    "like": (30, 150),
+    "comment": (10, 50),
+    "invite": (15, 40),
+    "page_view": (80, 500),
+}
+
+HOUR = 3600
+DAY = 24 * 3600
+
+# Default job priorities (higher runs first), overridable with [SCHEDULER] priority_<job>
+DEFAULT_PRIORITIES = {"connect": 3, "warmup": 2, "hunt": 1, "feed": 0}
+
+
+def job_priority(config, job: str) -> int:
+    """
+    Return the priority of a job type ('feed', 'connect', 'warmup' or 'hunt') from the config.
+    """
+    default = DEFAULT_PRIORITIES.get(job, 0)
+    if config is None or not config.has_section("SCHEDULER"):
+        return default
+    try:
+        return int(config["SCHEDULER"].get(f"priority_{job}", default))
+    except ValueError:
+        return default
+
+
+# --- ActionBudget: shared per-hour / per-day limits for account actions ---
+
+class ActionBudget:
+
+    def __init__(self, path: str = "action_budget.sqlite3", limits: dict = None):
+        """
+        Initialize the budget backed by a SQLite file, so limits hold across restarts and across the
+        parallel worker processes, which all open the same file.
+        Args:
+            path: Path to the SQLite database file recording every spent action.
+            limits: Optional overrides of DEFAULT_BUDGETS, {kind: (per_hour, per_day)}.
+        """
+        self.path = path
+        self.limits = dict(DEFAULT_BUDGETS)
+        self.limits.update(limits or {})
+        self.denied = {kind: 0 for kind in self.limits}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS actions (kind TEXT NOT NULL, time REAL NOT NULL)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS actions_kind_time ON actions (kind, time)")
+        self._conn.execute("DELETE FROM actions WHERE time < ?", (time.time() - DAY,))
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build a budget from the optional [BUDGET] section of the config
+        (enabled, path, and <kind>_per_hour / <kind>_per_day for like, comment, invite and page_view).
+        Args:
+            config: RawConfigParser object for configuration (may be None).
+        Returns:
+            An ActionBudget instance, or None if budgets are disabled or the database cannot be opened.
+        """
+        section = config["BUDGET"] if config is not None and config.has_section("BUDGET") else {}
+        if str(section.get("enabled", "true")).lower() in ("0", "false", "no", "off"):
+            return None
+        limits = {}
+        for kind, (per_hour, per_day) in DEFAULT_BUDGETS.items():
+            try:
+                limits[kind] = (int(section.get(f"{kind}_per_hour", per_hour)), int(section.get(f"{kind}_per_day", per_day)))
+            except ValueError:
+                print(f"Ignoring invalid budget for '{kind}', using {per_hour}/hour and {per_day}/day.")
+        path = section.get("path", "action_budget.sqlite3")
+        try:
+            return cls(path, limits)
+        except sqlite3.Error as e:
+            print(f"Action budgets disabled, could not open {path}: {e}")
+            return None
+
+    def _used(self, kind: str, window: float, now: float) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM actions WHERE kind = ? AND time > ?",
+                                  (kind, now - window)).fetchone()[0]
+
+    def remaining(self, kind: str) -> int:
+        """
+        Return how many actions of a kind are still allowed right now (None if unlimited).
+        """
+        if kind not in self.limits:
+            return None
+        per_hour, per_day = self.limits[kind]
+        now = time.time()
+        left = []
+        with self._lock:
+            if per_hour:
+                left.append(per_hour - self._used(kind, HOUR, now))
+            if per_day:
+                left.append(per_day - self._used(kind, DAY, now))
+        return max(0, min(left)) if left else None
+
+    def available(self, kind: str) -> bool:
+        """
+        True if at least one action of this kind is allowed now (unknown kinds are never limited).
+        """
+        remaining = self.remaining(kind)
+        return remaining is None or remaining > 0
+
+    def try_spend(self, kind: str) -> bool:
+        """
+        Record one action if the budget allows it.
+        Args:
+            kind: One of DEFAULT_BUDGETS keys.
+        Returns:
+            True if the action may be performed, False if the hourly or daily limit is reached.
+        """
+        per_hour, per_day = self.limits.get(kind, (0, 0))
+        with self._lock:
+            # Count and insert in one write transaction, so parallel workers sharing the file cannot overshoot
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                allowed = ((not per_hour or self._used(kind, HOUR, now) < per_hour)
+                           and (not per_day or self._used(kind, DAY, now) < per_day))
+                if allowed:
+                    self._conn.execute("INSERT INTO actions (kind, time) VALUES (?, ?)", (kind, now))
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        if not allowed and kind in self.denied:
+            self.denied[kind] += 1
+        return allowed
+
+    def next_available(self, kind: str) -> float:
+        """
+        Return the number of seconds until the next action of this kind is allowed (0 if allowed now).
+        """
+        if self.available(kind):
+            return 0.0
+        per_hour, per_day = self.limits[kind]
+        now = time.time()
+        wait = 0.0
+        with self._lock:
+            for limit, window in ((per_hour, HOUR), (per_day, DAY)):
+                if not limit:
+                    continue
+                # The window frees up when its oldest counted action ages out
+                row = self._conn.execute("SELECT time FROM actions WHERE kind = ? AND time > ? ORDER BY time DESC "
+                                         "LIMIT 1 OFFSET ?", (kind, now - window, limit - 1)).fetchone()
+                if row is not None:
+                    wait = max(wait, row[0] + window - now)
+        return wait
+
+    def print_report(self) -> None:
+        """
+        Print used/remaining actions per kind.
+        """
+        now = time.time()
+        print("Action budget (last hour / last 24h):")
+        for kind, (per_hour, per_day) in self.limits.items():
+            with self._lock:
+                hour, day = self._used(kind, HOUR, now), self._used(kind, DAY, now)
+            denied = f", {self.denied[kind]} skipped" if self.denied.get(kind) else ""
+            print(f"  {kind:<10} {hour}/{per_hour or '-'}  {day}/{per_day or '-'}{denied}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# --- Per-thread job output ---
+
+class ThreadLocalStdout:
+
+    def __init__(self, default):
+        """
+        Stand-in for sys.stdout that sends each thread's prints to the stream set for that thread (see job_output),
+        and everything else to the original stdout. Unlike contextlib.redirect_stdout, a job's output stream only
+        receives that job's prints, not those of background threads running at the same time.
+        Args:
+            default: The stdout replaced by this proxy.
+        """
+        self.default = default
+        self._local = threading.local()
+
+    def _target(self):
+        return getattr(self._local, "stream", None) or self.default
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+
+_stdout_lock = threading.Lock()
+
+
+@contextmanager
+def job_output(stream):
+    """
+    Send the current thread's prints to `stream` inside the with block, installing ThreadLocalStdout
+    as sys.stdout the first time it is needed.
+    """
+    with _stdout_lock:
+        if not isinstance(sys.stdout, ThreadLocalStdout):
+            sys.stdout = ThreadLocalStdout(sys.stdout)
+        proxy = sys.stdout
+    previous = getattr(proxy._local, "stream", None)
+    proxy._local.stream = stream
+    try:
+        yield stream
+    finally:
+        proxy._local.stream = previous
+
+
+# --- JobScheduler: interleaves jobs on one browser session ---
+
+class ScheduledJob:
+
+    def __init__(self, name: str, steps, priority: int, seq: int, output=None):
+        """
+        A queued job. `steps` is a generator that yields (kind, delay) before each unit of work:
+        kind is the budget the next unit mainly spends (or None) and delay the seconds it must wait first
+        (e.g. the feed refresh interval). Resuming the generator performs the unit.
+        """
+        self.name = name
+        self.steps = steps
+        self.priority = priority
+        self.seq = seq
+        self.output = output
+        self.kind = None
+        self.ready_at = 0.0
+        self.last_run = 0.0
+        self.started = False
+        self.ok = True
+        self.done = threading.Event()
+
+
+class JobScheduler:
+
+    def __init__(self, budget: ActionBudget = None, stop_event: threading.Event = None):
+        """
+        Run queued jobs on one browser session. The highest-priority job that is due and within budget
+        runs its next step; jobs of equal priority take turns, and while one job waits (refresh interval or
+        exhausted budget) the others keep working.
+        Args:
+            budget: Shared ActionBudget, or None for no limits.
+            stop_event: When set, all queued jobs are closed and the scheduler returns (or, with
+                        run(forever=True), clears the event and waits for new jobs).
+        """
+        self.budget = budget
+        self.stop_event = stop_event or threading.Event()
+        self._jobs = []
+        self._seq = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def add(self, name: str, steps, priority: int = 0, output=None) -> ScheduledJob:
+        """
+        Queue a job (thread-safe).
+        Args:
+            name: Job name used in progress messages.
+            steps: Step generator (see ScheduledJob).
+            priority: Higher runs first.
+            output: Optional stream the job's printed output is redirected to.
+        Returns:
+            The ScheduledJob; its `done` event is set when it finishes.
+        """
+        job = ScheduledJob(name, steps, priority, next(self._seq), output)
+        with self._condition:
+            self._jobs.append(job)
+            self._condition.notify()
+        return job
+
+    def snapshot(self) -> list:
+        """The queued and running jobs (a copy)."""
+        with self._condition:
+            return list(self._jobs)
+
+    def pending(self) -> list:
+        """Names of the queued and running jobs."""
+        return [job.name for job in self.snapshot()]
+
+    def close(self) -> None:
+        """Make run(forever=True) return once the current step is finished."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+    def _finish(self, job: ScheduledJob) -> None:
+        with self._condition:
+            self._jobs.remove(job)
+        job.done.set()
+
+    def _step(self, job: ScheduledJob) -> None:
+        job.started = True
+        job.last_run = time.monotonic()
+        finished = False
+        with job_output(job.output) if job.output is not None else nullcontext():
+            try:
+                job.kind, delay = next(job.steps)
+                job.ready_at = time.monotonic() + max(0, delay or 0)
+            except StopIteration:
+                finished = True
+            except Exception as e:
+                job.ok = False
+                finished = True
+                print(f"Job '{job.name}' failed: {e}")
+        if finished:
+            self._finish(job)
+
+    def _next_job(self):
+        """
+        Pick the job to run now.
+        Returns:
+            (job, 0) or (None, seconds to wait before something can run).
+        """
+        now = time.monotonic()
+        best, wait = None, None
+        for job in self.snapshot():
+            due_in = job.ready_at - now
+            if job.started and job.kind and self.budget is not None:
+                due_in = max(due_in, self.budget.next_available(job.kind))
+            if due_in > 0:
+                wait = due_in if wait is None else min(wait, due_in)
+                continue
+            if best is None or (-job.priority, job.last_run, job.seq) < (-best.priority, best.last_run, best.seq):
+                best = job
+        return best, (0 if best is not None else wait)
+
+    def _cancel_all(self) -> None:
+        for job in self.snapshot():
+            job.steps.close()
+            self._finish(job)
+
+    def run(self, forever: bool = False) -> None:
+        """
+        Run jobs until the queue is empty, or until close() when forever is True.
+        """
+        waiting_for = None
+        while True:
+            if self.stop_event.is_set():
+                self._cancel_all()
+                if not forever:
+                    return
+                self.stop_event.clear()
+            with self._condition:
+                if self._closed or (not self._jobs and not forever):
+                    break
+            job, wait = self._next_job()
+            if job is not None:
+                waiting_for = None
+                self._step(job)
+                continue
+            if wait is not None and wait > 60 and waiting_for is None:
+                blocked = sorted({job.kind for job in self.snapshot() if job.kind and self.budget is not None
+                                  and not self.budget.available(job.kind)})
+                if blocked:
+                    waiting_for = blocked
+                    print(f"Budget reached for {', '.join(blocked)}; resuming in {wait / 60:.0f} min.")
+            # New jobs and close() wake the wait early; stop requests are seen within a second
+            with self._condition:
+                self._condition.wait(timeout=min(wait, 1) if wait is not None else 1)
+        self._cancel_all()
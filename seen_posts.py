@@ -0,0 +1,122 @@
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+# Fallback ids derived from a post's position on the page; another post can get the same id after a reload,
+# so they are only remembered in memory, never written to disk
+TRANSIENT_ID_PREFIXES = ("post-",)
+
+# --- SeenPostStore: bounded, persistent record of processed posts ---
+
+class SeenPostStore:
+
+    def __init__(self, path: str = "seen_posts.sqlite3", max_age_seconds: int = 14 * 24 * 3600, memory_size: int = 2000):
+        """
+        Initialize the seen-post store. Behaves like the set previously used by monitor_feed
+        (supports `post_id in store` and `store.add(post_id)`), but survives restarts and stays bounded.
+        Args:
+            path: Path to the SQLite database file holding every seen post id.
+            max_age_seconds: Age after which a post id is forgotten (0 keeps ids forever).
+            memory_size: Number of recently seen ids kept in the in-memory LRU front.
+        """
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self.memory_size = max(1, memory_size)
+        self._recent = OrderedDict()
+        self._adds_since_prune = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS seen (post_id TEXT PRIMARY KEY, seen REAL NOT NULL)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS seen_time ON seen (seen)")
+        self._conn.commit()
+        self.prune()
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build a store from the [LINKEDIN] section of the config.
+        Falls back to a plain in-memory set if the database cannot be opened.
+        Args:
+            config: RawConfigParser object for configuration (may be None).
+        Returns:
+            A SeenPostStore instance, or a set.
+        """
+        section = config["LINKEDIN"] if config is not None and config.has_section("LINKEDIN") else {}
+        path = section.get("seen_posts_db", "seen_posts.sqlite3")
+        try:
+            max_age_days = float(section.get("seen_posts_max_age_days", "14"))
+            memory_size = int(section.get("seen_posts_memory", "2000"))
+        except ValueError:
+            max_age_days, memory_size = 14, 2000
+        try:
+            return cls(path, max_age_seconds=int(max_age_days * 24 * 3600), memory_size=memory_size)
+        except sqlite3.Error as e:
+            print(f"Could not open seen-post store {path}: {e}. Using in-memory tracking only.")
+            return set()
+
+    def _remember(self, post_id: str) -> None:
+        self._recent[post_id] = None
+        self._recent.move_to_end(post_id)
+        while len(self._recent) > self.memory_size:
+            self._recent.popitem(last=False)
+
+    def __contains__(self, post_id) -> bool:
+        if post_id is None:
+            return False
+        with self._lock:
+            if post_id in self._recent:
+                self._recent.move_to_end(post_id)
+                return True
+            row = self._conn.execute("SELECT seen FROM seen WHERE post_id = ?", (post_id,)).fetchone()
+            if row is None:
+                return False
+            if self.max_age_seconds and time.time() - row[0] > self.max_age_seconds:
+                return False
+            self._remember(post_id)
+            return True
+
+    def add(self, post_id) -> None:
+        """
+        Mark a post id as processed.
+        Args:
+            post_id: The post's data-urn (or other unique id); position-based fallback ids
+                     (TRANSIENT_ID_PREFIXES) are kept in memory only.
+        """
+        if post_id is None:
+            return
+        if post_id.startswith(TRANSIENT_ID_PREFIXES):
+            with self._lock:
+                self._remember(post_id)
+            return
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO seen (post_id, seen) VALUES (?, ?)", (post_id, time.time()))
+            self._conn.commit()
+            self._remember(post_id)
+            self._adds_since_prune += 1
+        if self._adds_since_prune >= 500:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        Delete post ids older than max_age_seconds from disk.
+        Returns:
+            Number of ids removed.
+        """
+        with self._lock:
+            self._adds_since_prune = 0
+            if not self.max_age_seconds:
+                return 0
+            cursor = self._conn.execute("DELETE FROM seen WHERE seen < ?", (time.time() - self.max_age_seconds,))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,204 @@
+
+import csv
+import json
+import os
+
+
+# Supported table formats, chosen by file extension
+SUPPORTED_EXTENSIONS = (".xlsx", ".csv", ".jsonl")
+
+
+def _extension(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in SUPPORTED_EXTENSIONS:
+        raise ValueError(f"Unsupported file type '{ext}' (use one of {', '.join(SUPPORTED_EXTENSIONS)})")
+    return ext
+
+
+def _clean(value):
+    # Empty cells come back as None from openpyxl; treat them like pandas' fillna('')
+    if value is None:
+        return ""
+    return value
+
+
+def read_header(path: str) -> list:
+    """
+    Return the column names of a table file without loading its rows.
+    Args:
+        path: Path to an .xlsx, .csv or .jsonl file.
+    Returns:
+        List of column names (for JSONL, the keys of the first record).
+    """
+    ext = _extension(path)
+    if ext == ".xlsx":
+        from openpyxl import load_workbook
+        workbook = load_workbook(path, read_only=True)
+        try:
+            for header in workbook.active.iter_rows(max_row=1, values_only=True):
+                return [str(cell) for cell in header if cell is not None]
+        finally:
+            workbook.close()
+    elif ext == ".csv":
+        with open(path, "r", encoding="utf-8-sig", newline="") as file:
+            return next(csv.reader(file), [])
+    else:
+        for row in iter_rows(path):
+            return list(row.keys())
+    return []
+
+
+def iter_rows(path: str):
+    """
+    Stream the rows of a table file as dicts, one at a time, with constant memory.
+    Args:
+        path: Path to an .xlsx (read in read-only mode), .csv or .jsonl file.
+    Yields:
+        Dict mapping column name to cell value ('' for empty cells).
+    """
+    ext = _extension(path)
+    if ext == ".xlsx":
+        from openpyxl import load_workbook
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = [str(cell) if cell is not None else f"Column {i + 1}" for i, cell in enumerate(header)]
+            for values in rows:
+                if values is None or all(value is None for value in values):
+                    continue
+                yield {column: _clean(value) for column, value in zip(columns, values)}
+        finally:
+            workbook.close()
+    elif ext == ".csv":
+        with open(path, "r", encoding="utf-8-sig", newline="") as file:
+            for row in csv.DictReader(file):
+                yield {column: _clean(value) for column, value in row.items()}
+    else:
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield {column: _clean(value) for column, value in json.loads(line).items()}
+                except ValueError:
+                    # Half-written last line after a crash
+                    continue
+
+
+def count_rows(path: str) -> int:
+    """
+    Count data rows cheaply (for progress messages) without building them.
+    Args:
+        path: Path to an .xlsx, .csv or .jsonl file.
+    Returns:
+        Number of data rows (for .xlsx, taken from the sheet dimensions and may include trailing blank rows).
+    """
+    ext = _extension(path)
+    if ext == ".xlsx":
+        from openpyxl import load_workbook
+        workbook = load_workbook(path, read_only=True)
+        try:
+            max_row = workbook.active.max_row
+            if max_row is None:
+                return sum(1 for _ in iter_rows(path))
+            return max(0, max_row - 1)
+        finally:
+            workbook.close()
+    if ext == ".csv":
+        with open(path, "r", encoding="utf-8-sig", newline="") as file:
+            return max(0, sum(1 for _ in csv.reader(file)) - 1)
+    with open(path, "r", encoding="utf-8") as file:
+        return sum(1 for line in file if line.strip())
+
+
+# --- RowWriter: append-only output ---
+
+class RowWriter:
+
+    def __init__(self, path: str, columns: list):
+        """
+        Open an append-only writer. Rows already in the file are kept and new rows are added after them.
+        CSV and JSONL files are appended to directly. Excel files cannot be appended in place, so rows go to
+        a '<file>.journal.jsonl' side file and are merged into the workbook once, in write-only mode, on close().
+        A journal left behind by a crash is picked up by the next writer.
+        Args:
+            path: Output .xlsx, .csv or .jsonl file.
+            columns: Column order for new rows.
+        """
+        self.path = path
+        self.columns = list(columns)
+        self.rows_written = 0
+        self._ext = _extension(path)
+        self._journal = f"{path}.journal.jsonl" if self._ext == ".xlsx" else None
+        target = self._journal or path
+        if self._ext == ".csv":
+            new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+            self._file = open(path, "a", encoding="utf-8", newline="")
+            self._csv = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction="ignore")
+            if new_file:
+                self._csv.writeheader()
+        else:
+            self._file = open(target, "a", encoding="utf-8")
+            self._csv = None
+
+    def write_rows(self, rows: list) -> None:
+        """
+        Append rows and flush them to disk. Cost depends only on the number of new rows.
+        Args:
+            rows: List of dicts keyed by column name.
+        """
+        for row in rows:
+            if self._csv is not None:
+                self._csv.writerow({column: row.get(column, "") for column in self.columns})
+            else:
+                self._file.write(json.dumps({column: row.get(column, "") for column in self.columns}, default=str) + "\n")
+        self._file.flush()
+        self.rows_written += len(rows)
+
+    def close(self) -> None:
+        """
+        Close the writer; for Excel output, merge the journal into the workbook.
+        """
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        if self._journal is not None:
+            merge_journal(self.path, self.columns)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def merge_journal(path: str, columns: list) -> None:
+    """
+    Stream an Excel file's existing rows plus its pending journal rows into a new write-only workbook.
+    Args:
+        path: The .xlsx file.
+        columns: Column order for the merged workbook (extra existing columns are appended).
+    """
+    journal = f"{path}.journal.jsonl"
+    if not os.path.exists(journal):
+        return
+    from openpyxl import Workbook
+    header = list(columns)
+    if os.path.exists(path):
+        header += [column for column in read_header(path) if column not in header]
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(header)
+    sources = ([path] if os.path.exists(path) else []) + [journal]
+    for source in sources:
+        for row in iter_rows(source):
+            sheet.append([row.get(column, "") for column in header])
+    temp_path = f"{path}.tmp.xlsx"
+    workbook.save(temp_path)
+    os.replace(temp_path, path)
+    os.remove(journal)
@@ -0,0 +1,48 @@
+
+import json
+
+from comment_batch import parse_batch_response
+
+
+def _reply(items) -> str:
+    return json.dumps({"comments": items})
+
+
+def test_ids_one_based_in_any_order():
+    reply = _reply([{"id": 2, "comment": "for B"}, {"id": 1, "comment": "for A"}, {"id": 3, "comment": "for C"}])
+    assert parse_batch_response(reply, 3) == ["for A", "for B", "for C"]
+
+
+def test_items_without_ids_are_positional():
+    assert parse_batch_response('```json\n["for A", "for B"]\n```', 2) == ["for A", "for B"]
+    assert parse_batch_response(_reply([{"comment": "for A"}, {"comment": "for B"}]), 2) == ["for A", "for B"]
+
+
+def test_zero_based_ids_are_rejected():
+    reply = _reply([{"id": 0, "comment": "for A"}, {"id": 1, "comment": "for B"}, {"id": 2, "comment": "for C"}])
+    assert parse_batch_response(reply, 3) == [None, None, None]
+
+
+def test_duplicate_ids_are_rejected():
+    reply = _reply([{"id": 1, "comment": "for A"}, {"id": 1, "comment": "for B"}, {"id": 3, "comment": "for C"}])
+    assert parse_batch_response(reply, 3) == [None, None, None]
+
+
+def test_missing_items_are_rejected():
+    reply = _reply([{"id": 1, "comment": "for A"}, {"id": 3, "comment": "for C"}])
+    assert parse_batch_response(reply, 3) == [None, None, None]
+    assert parse_batch_response('["for A", "for B"]', 3) == [None, None, None]
+
+
+def test_mixed_ids_are_rejected():
+    reply = _reply([{"id": 2, "comment": "for B"}, "for A", {"comment": "for C"}])
+    assert parse_batch_response(reply, 3) == [None, None, None]
+
+
+def test_empty_comment_stays_unset():
+    reply = _reply([{"id": 1, "comment": "for A"}, {"id": 2, "comment": "  "}])
+    assert parse_batch_response(reply, 2) == ["for A", None]
+
+
+def test_unparsable_reply():
+    assert parse_batch_response("Sorry, I cannot help with that.", 2) == [None, None]
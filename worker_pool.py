@@ -0,0 +1,194 @@
+
+import multiprocessing
+import os
+import queue
+import shutil
+
+from app_config import RUN_ID, RUN_ID_ENV, TEMP_PROFILE, apply_config_overrides
+from table_io import RowWriter, iter_rows, read_header
+
+
+# Browser state that must not be copied between Chrome profiles
+_PROFILE_COPY_IGNORE = shutil.ignore_patterns("Singleton*", "*.lock", "lockfile", "Cache", "Code Cache", "GPUCache")
+
+
+def worker_profile_dir(base_dir: str, worker_id: int) -> str:
+    """
+    Return the Chrome user-data dir used by a worker.
+    Args:
+        base_dir: The main (signed-in) profile directory.
+        worker_id: Zero-based worker number.
+    """
+    return f"{base_dir}-worker{worker_id}"
+
+
+def _seed_profile_dir(base_dir: str, worker_dir: str) -> None:
+    """
+    Copy the main profile into a new worker profile so the worker starts with the LinkedIn session.
+    """
+    if os.path.exists(worker_dir) or not os.path.isdir(base_dir):
+        return
+    try:
+        shutil.copytree(base_dir, worker_dir, ignore=_PROFILE_COPY_IGNORE)
+    except (OSError, shutil.Error) as e:
+        print(f"Could not copy browser profile to {worker_dir}: {e}")
+
+
+def read_profile_rows(input_excel: str) -> list:
+    """
+    Read the 'Profile Link' (and optional 'Name') column of an Excel, CSV or JSONL file.
+    Only these two columns are kept, so memory stays small even for very wide sheets.
+    Args:
+        input_excel: Path to the input file.
+    Returns:
+        List of dicts with row index, profile link and name, or None if the file is unusable.
+    """
+    try:
+        if 'Profile Link' not in read_header(input_excel):
+            print("Excel file must contain a 'Profile Link' column.")
+            return None
+        return [{
+            "row": idx,
+            "Profile Link": str(row.get('Profile Link', '')).strip(),
+            "Name": str(row.get('Name', '')).strip(),
+        } for idx, row in enumerate(iter_rows(input_excel))]
+    except Exception as e:
+        print(f"Failed to read Excel file: {e}")
+        return None
+
+
+def _worker_main(worker_id: int, task: str, rows: list, options: dict, progress_queue) -> None:
+    """
+    Entry point of one worker process: own browser session, own profile dir, one shard of the rows.
+    Every processed row is reported on progress_queue; a final {'worker', 'done'} message marks the end.
+    """
+    # Imported in the worker so each process builds its own managers and browser
+    import Monitor_Feed as mf
+
+    try:
+        config = mf._config
+        config.read(mf._CONFIG_FILENAME, encoding="utf-8")
+        # Command-line overrides of the parent (pacing, pipeline workers, max posts) are not in the file
+        apply_config_overrides(config, options.get("config_overrides"))
+        comment_cache = mf.CommentCache.from_config(config)
+        gpt_manager = mf.GPTManager(config, mf._CONFIG_FILENAME, mf.LOGGER, comment_cache=comment_cache)
+        google_manager = mf.GoogleManager(config, mf._CONFIG_FILENAME, mf.LOGGER, comment_cache=comment_cache)
+        local_manager = mf.LocalManager(config, mf._CONFIG_FILENAME, mf.LOGGER, comment_cache=comment_cache)
+        worker_dir = worker_profile_dir(options["user_data_dir"], worker_id)
+        _seed_profile_dir(options["user_data_dir"], worker_dir)
+        manager = mf.LinkedInManager(gpt_manager, google_manager=google_manager, config=config,
+                                     mode=options["mode"], user_data_dir=worker_dir, local_manager=local_manager)
+        try:
+            signed_in = manager.linkedin_signin()
+        except EOFError:
+            # Workers cannot prompt for credentials; the main profile must already be signed in
+            signed_in = False
+        if not signed_in:
+            for row in rows:
+                progress_queue.put({**row, "Status": "signin_failed", "Worker": worker_id})
+            if manager.driver is not None:
+                manager.kill_browser()
+            return
+        try:
+            for row in rows:
+                label = f"[worker {worker_id}] Row {row['row'] + 1}"
+                result = {**row, "Worker": worker_id}
+                try:
+                    if task == "connect":
+                        result["Status"] = manager.send_connection_request(
+                            row["Profile Link"], row["Name"], options["message"], label=label)
+                    else:
+                        result["Posts"] = manager.warmup_profile(row["Profile Link"], label=label)
+                        result["Status"] = "warmed_up" if result["Posts"] is not None else "page_view_budget_reached"
+                except Exception as e:
+                    mf.LOGGER.exception("Worker %s failed on row %s", worker_id, row["row"])
+                    result["Status"] = f"error: {e}"
+                progress_queue.put(result)
+        finally:
+            manager.kill_browser()
+    except Exception as e:
+        print(f"Worker {worker_id} crashed: {e}")
+    finally:
+        progress_queue.put({"worker": worker_id, "done": True})
+
+
+def run_sharded(task: str, input_excel: str, workers: int, mode: str = "headon", message_template: str = None,
+                user_data_dir: str = None, output_file: str = None, config_overrides: dict = None) -> list:
+    """
+    Shard the rows of an Excel file across several browser worker processes and collect their results.
+    Args:
+        task: 'connect' (send connection requests) or 'warmup' (profile warmup).
+        input_excel: Excel file with a 'Profile Link' column (and optional 'Name').
+        workers: Number of worker processes (each runs its own Chrome).
+        mode: 'headless' or 'headon'.
+        message_template: Connection note template (task 'connect' only).
+        user_data_dir: Main Chrome profile, copied into each new worker profile; defaults to TEMP_PROFILE.
+        output_file: Where to save per-row results (.xlsx, .csv or .jsonl); defaults to '<input> results.xlsx'.
+        config_overrides: In-memory settings of the parent, {section: {key: value}}, applied on top of each
+                          worker's config file.
+    Returns:
+        List of per-row result dicts in input order.
+    """
+    if task not in ("connect", "warmup"):
+        raise ValueError(f"Unknown task '{task}'")
+    rows = read_profile_rows(input_excel)
+    if rows is None:
+        return []
+    if user_data_dir is None:
+        user_data_dir = TEMP_PROFILE
+    results = [{**row, "Status": "no_profile_link"} for row in rows if not row["Profile Link"]]
+    todo = [row for row in rows if row["Profile Link"]]
+    workers = max(1, min(workers, len(todo))) if todo else 0
+    shards = [todo[i::workers] for i in range(workers)]
+    options = {"mode": mode, "message": message_template or "", "user_data_dir": user_data_dir,
+               "config_overrides": config_overrides or {}}
+
+    # Spawn (not fork) so every worker starts a clean Chrome/selenium state on all platforms
+    ctx = multiprocessing.get_context("spawn")
+    progress_queue = ctx.Queue()
+    processes = [ctx.Process(target=_worker_main, args=(i, task, shard, options, progress_queue), daemon=True)
+                 for i, shard in enumerate(shards)]
+    print(f"Starting {len(processes)} workers for {len(todo)} profiles ...")
+    # The workers log under this run's id; the variable is only set while they are started
+    os.environ[RUN_ID_ENV] = RUN_ID
+    try:
+        for process in processes:
+            process.start()
+    finally:
+        os.environ.pop(RUN_ID_ENV, None)
+
+    finished = set()
+    done_rows = 0
+    while len(finished) < len(processes):
+        try:
+            message = progress_queue.get(timeout=1)
+        except queue.Empty:
+            # A worker that died without reporting would otherwise block forever
+            for i, process in enumerate(processes):
+                if i not in finished and not process.is_alive() and progress_queue.empty():
+                    print(f"Worker {i} exited unexpectedly.")
+                    finished.add(i)
+            continue
+        if message.get("done"):
+            finished.add(message["worker"])
+            print(f"Worker {message['worker']} finished.")
+            continue
+        results.append(message)
+        done_rows += 1
+        print(f"[{done_rows}/{len(todo)}] Worker {message['Worker']}: {message['Profile Link']} => {message['Status']}")
+    for process in processes:
+        process.join(timeout=5)
+
+    results.sort(key=lambda result: result["row"])
+    if output_file is None:
+        output_file = f"{os.path.splitext(input_excel)[0]} results.xlsx"
+    try:
+        columns = ["Profile Link", "Name", "Status", "Posts", "Worker"]
+        if os.path.exists(output_file):
+            os.remove(output_file)
+        with RowWriter(output_file, columns) as writer:
+            writer.write_rows(results)
+        print(f"Saved results for {len(results)} rows to {output_file}")
+    except Exception as e:
+        print(f"Error saving results: {e}")
+    return results